@@ -3,37 +3,58 @@
 from flask import Flask, jsonify
 from flask_cors import CORS
 from flask_migrate import Migrate
-from flask_bcrypt import Bcrypt
 from flask_jwt_extended import JWTManager
 from flask_restx import Api
+from werkzeug.middleware.proxy_fix import ProxyFix
 
+from cli import register_commands
 from config import Config
-from database import db
+from database import db, init_db
 from routes.user_routes import api as user_ns
 from routes.auth import api as auth_ns
+from services.compression import ResponseCompression
+from services.login_throttle import login_throttle
+from services.metrics import RequestMetrics
+from services.password_hasher import password_hasher
+from services.bill_service import summary_cache
+from services.slow_query import SlowQueryLog
+from services.user_service import user_cache
+from routes.bill_routes import bill_bp
+from routes.reminder_routes import reminder_bp
 
 # from routes.bill_routes import api as bill_ns
 # from routes.reminder_routes import api as reminder_ns
 
 # Initialize Flask extensions
-bcrypt = Bcrypt()
 jwt = JWTManager()
 migrate = Migrate()
 
 
-def create_app():
+def create_app(config_class=Config):
     """Initialize Flask application and extensions"""
     app = Flask(__name__)
 
     # Load Configuration
-    app.config.from_object(Config)
+    app.config.from_object(config_class)
 
     # Initialize Extensions
-    db.init_app(app)
-    bcrypt.init_app(app)
+    init_db(app)
+    password_hasher.init_app(app)
     jwt.init_app(app)
     migrate.init_app(app, db)
     CORS(app)
+    register_commands(app)
+    if app.config["METRICS_ENABLED"]:
+        RequestMetrics(app)
+    if app.config["SLOW_QUERY_LOG_ENABLED"]:
+        SlowQueryLog(app)
+    if app.config["COMPRESSION_ENABLED"]:
+        ResponseCompression(app)
+    if app.config["PROXY_FIX_X_FOR"]:
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=app.config["PROXY_FIX_X_FOR"])
+    login_throttle.init_app(app)
+    user_cache.init_app(app)
+    summary_cache.init_app(app)
 
     # Bearer Authentication for Swagger
     authorizations = {
@@ -60,6 +81,8 @@ def create_app():
     api.add_namespace(user_ns, path="/api/v1/users")
     api.add_namespace(auth_ns, path="/api/v1/auth")
     # api.add_namespace(bill_ns, path="/api/v1/bills")
+    app.register_blueprint(bill_bp, url_prefix="/api/v1/bills")
+    app.register_blueprint(reminder_bp, url_prefix="/api/v1/reminders")
 
     @app.route("/", methods=["GET"])
     def home():
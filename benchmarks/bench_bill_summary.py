@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Time BillService.get_summary on a cache miss (one aggregate query) and a cache hit.
+
+Usage: python -m benchmarks.bench_bill_summary [bills_per_user]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app import create_app
+from config import Config
+from database import db
+from services.bill_service import BillService, summary_cache
+
+
+def run(count, repeat=200):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            today = date.today()
+            BillService.create_bills_bulk(
+                {"user_id": "bench-user", "amount": 1 + i % 300, "due_date": today + timedelta(days=i % 120 - 30)}
+                for i in range(count)
+            )
+
+            queries = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: queries.append(1))
+
+            start = time.perf_counter()
+            for _ in range(repeat):
+                summary_cache.clear()
+                BillService.get_summary("bench-user")
+            miss = (time.perf_counter() - start) / repeat
+            miss_queries = len(queries) / repeat
+
+            queries.clear()
+            start = time.perf_counter()
+            for _ in range(repeat * 50):
+                BillService.get_summary("bench-user")
+            hit = (time.perf_counter() - start) / (repeat * 50)
+
+            db.session.remove()
+
+    print(f"bills for user: {count}")
+    print(f"cache miss: {miss * 1000:8.3f} ms  ({miss_queries:.0f} query)")
+    print(f"cache hit:  {hit * 1000:8.3f} ms  ({len(queries)} queries)")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
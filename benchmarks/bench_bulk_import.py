@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Compare rows/sec of per-row BillService.create_bill with create_bills_bulk.
+
+Usage: python -m benchmarks.bench_bulk_import [rows]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app import create_app
+from config import Config
+from database import db
+from models.bill import Bill
+from services.bill_service import BillService
+
+
+def make_rows(count):
+    today = date.today()
+    return [
+        {"user_id": "bench-user", "amount": 10 + i % 500, "due_date": today + timedelta(days=i % 90),
+         "description": f"Bill {i}"}
+        for i in range(count)
+    ]
+
+
+def run(count):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            rows = make_rows(count)
+
+            start = time.perf_counter()
+            for row in rows:
+                BillService.create_bill(row["user_id"], row["amount"], row["due_date"], row["description"])
+            per_row = time.perf_counter() - start
+
+            db.session.query(Bill).delete()
+            db.session.commit()
+
+            start = time.perf_counter()
+            BillService.create_bills_bulk(rows)
+            bulk = time.perf_counter() - start
+
+            db.session.remove()
+
+    print(f"rows: {count}")
+    print(f"per-row create_bill:  {count / per_row:12.0f} rows/sec ({per_row:.3f}s)")
+    print(f"create_bills_bulk:    {count / bulk:12.0f} rows/sec ({bulk:.3f}s)")
+    print(f"speedup: {per_row / bulk:.1f}x")
+
+
+if __name__ == "__main__":
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 5000)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""Latency of the bill pay/update/delete paths: the previous SELECT + mutate +
+commit versus one conditional UPDATE ... RETURNING. Each call starts from an
+empty session, as a request would.
+
+Usage: python -m benchmarks.bench_conditional_update [operations]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event, insert
+
+from app import create_app
+from config import Config
+from database import db
+from models.bill import Bill
+from models.ids import uuid7
+from services.bill_service import BillService
+
+
+def select_then_commit(operation, bill_id):
+    """The previous implementation: load by id, change the object, commit"""
+    bill = db.session.get(Bill, bill_id)
+    if operation == "pay":
+        bill.status = "paid"
+    elif operation == "update":
+        bill.amount = 99
+    else:
+        bill.is_deleted = True
+    db.session.commit()
+    return bill
+
+
+def conditional(operation, bill_id):
+    if operation == "pay":
+        return BillService.mark_bill_as_paid(bill_id)
+    if operation == "update":
+        return BillService.update_bill(bill_id, amount=99)
+    return BillService.delete_bill(bill_id)
+
+
+def run(operations):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            statements = []
+            event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+            for operation in ("pay", "update", "delete"):
+                for label, path in (("SELECT + commit", select_then_commit), ("conditional UPDATE", conditional)):
+                    ids = [uuid7() for _ in range(operations)]
+                    db.session.execute(insert(Bill), [
+                        {"id": bill_id, "user_id": "bench-user", "amount": 10, "due_date": date.today() + timedelta(days=5)}
+                        for bill_id in ids
+                    ])
+                    db.session.commit()
+                    db.session.remove()
+
+                    statements.clear()
+                    latencies = []
+                    for bill_id in ids:
+                        started = time.perf_counter()
+                        path(operation, bill_id)
+                        latencies.append(time.perf_counter() - started)
+                        db.session.remove()
+                    latencies.sort()
+                    print(f"{operation:6} {label:18} {len(statements) / operations:4.1f} statements/op  "
+                          f"mean {sum(latencies) / operations * 1e6:7.0f} us  "
+                          f"p95 {latencies[int(operations * 0.95)] * 1e6:7.0f} us")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 2000)
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""Insert rate, primary key index size and lookup rate for UUID4 text, UUID7 text
+and UUID7 binary keys on SQLite.
+
+Usage: python -m benchmarks.bench_ids [rows] [batch]
+"""
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+
+from models.ids import uuid7
+
+VARIANTS = (
+    ("uuid4 text", "VARCHAR(36)", lambda: str(uuid.uuid4())),
+    ("uuid7 text", "VARCHAR(36)", uuid7),
+    ("uuid7 binary", "BLOB", lambda: uuid.UUID(uuid7()).bytes),
+)
+
+
+def run_variant(label, column_type, make_id, rows, batch, path):
+    conn = sqlite3.connect(path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute("PRAGMA cache_size=-16000")  # 16 MiB, smaller than the index at 1M rows
+    conn.execute(f"CREATE TABLE bills (id {column_type} PRIMARY KEY, amount FLOAT, description VARCHAR(255))")
+
+    ids = []
+    started = time.perf_counter()
+    for offset in range(0, rows, batch):
+        values = [(make_id(), 10.0, "bill") for _ in range(min(batch, rows - offset))]
+        conn.executemany("INSERT INTO bills VALUES (?, ?, ?)", values)
+        conn.commit()
+        ids.extend(v[0] for v in values[::100])
+    insert_time = time.perf_counter() - started
+
+    index_bytes = conn.execute(
+        "SELECT SUM(pgsize) FROM dbstat WHERE name = 'sqlite_autoindex_bills_1'"
+    ).fetchone()[0]
+
+    sample = random.sample(ids, min(len(ids), 20000))
+    started = time.perf_counter()
+    for key in sample:
+        conn.execute("SELECT amount FROM bills WHERE id = ?", (key,)).fetchone()
+    lookup_time = time.perf_counter() - started
+    conn.close()
+
+    print(f"{label:13} insert {rows / insert_time:9.0f} rows/s   pk index {index_bytes / 2**20:7.1f} MiB   "
+          f"lookups {len(sample) / lookup_time:8.0f}/s   file {os.path.getsize(path) / 2**20:7.1f} MiB")
+
+
+def run(rows, batch):
+    print(f"rows: {rows}, batch: {batch}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for i, (label, column_type, make_id) in enumerate(VARIANTS):
+            run_variant(label, column_type, make_id, rows, batch, os.path.join(tmp, f"ids{i}.db"))
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 1_000_000, int(args[1]) if len(args) > 1 else 10_000)
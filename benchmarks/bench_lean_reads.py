@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""ORM list reads against the Core row path (BillService.list_bills_rows) for
+one user with 10k and 100k bills.
+
+- page walk: every bill through 200-row keyset pages, each serialized like
+  GET /bills/user/<id> and read from a fresh session, as a request would.
+- one list: all bills held in memory at once; peak traced allocation and time.
+
+Usage: python -m benchmarks.bench_lean_reads [rows ...]
+"""
+
+import gc
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert, select
+
+from app import create_app
+from config import Config
+from database import db
+from models.bill import Bill
+from models.ids import uuid7
+from routes.bill_routes import BILL_LIST_FIELDS
+from services.bill_service import BillService, LIST_COLUMNS
+from services.pagination import MAX_PAGE_SIZE
+
+USER_ID = "bench-user"
+
+
+def seed(rows):
+    now = datetime.utcnow()
+    for start in range(0, rows, 10000):
+        db.session.execute(insert(Bill), [
+            {"id": uuid7(), "user_id": USER_ID, "amount": 40 + i % 100, "status": "pending",
+             "due_date": date.today() + timedelta(days=i % 60), "description": f"Electricity bill {i}",
+             "created_at": now + timedelta(microseconds=i), "updated_at": now}
+            for i in range(start, min(rows, start + 10000))
+        ])
+    db.session.commit()
+
+
+def serialize(records):
+    return [{name: BILL_LIST_FIELDS[name](record) for name in LIST_COLUMNS} for record in records]
+
+
+def walk_orm():
+    count, cursor = 0, None
+    while True:
+        bills, cursor = BillService.get_bills_page_by_user(USER_ID, MAX_PAGE_SIZE, cursor)
+        count += len(serialize(bills))
+        db.session.remove()
+        if cursor is None:
+            return count
+
+
+def walk_rows():
+    count, cursor = 0, None
+    while True:
+        rows, cursor = BillService.list_bills_rows(USER_ID, MAX_PAGE_SIZE, cursor)
+        count += len(serialize(rows))
+        db.session.remove()
+        if cursor is None:
+            return count
+
+
+def load_orm():
+    return Bill.query.filter_by(user_id=USER_ID).order_by(Bill.created_at, Bill.id).all()
+
+
+def load_rows():
+    bills = Bill.__table__
+    columns = [bills.c[name] for name in dict.fromkeys((*LIST_COLUMNS, "created_at", "id"))]
+    statement = select(*columns).where(bills.c.user_id == USER_ID).order_by(bills.c.created_at, bills.c.id)
+    return db.session.execute(statement).all()
+
+
+def timed(call):
+    gc.collect()
+    started = time.perf_counter()
+    result = call()
+    return result, time.perf_counter() - started
+
+
+def traced(call):
+    """Peak bytes allocated while the result of call is built and still held"""
+    gc.collect()
+    tracemalloc.start()
+    result = call()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    db.session.remove()
+    return peak
+
+
+def run(sizes):
+    for rows in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            class BenchConfig(Config):
+                SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+                METRICS_ENABLED = False
+
+            app = create_app(BenchConfig)
+            with app.app_context():
+                db.create_all()
+                seed(rows)
+                db.session.remove()
+
+                print(f"{rows} bills")
+                walks = {}
+                for label, walk in (("ORM", walk_orm), ("Core rows", walk_rows)):
+                    count, seconds = timed(walk)
+                    assert count == rows
+                    walks[label] = seconds
+                    print(f"  page walk  {label:9} {seconds:7.2f} s  {seconds / rows * 1e6:6.1f} us/row")
+                print(f"  page walk  speedup   {walks['ORM'] / walks['Core rows']:.1f}x")
+
+                loads = {}
+                for label, load in (("ORM", load_orm), ("Core rows", load_rows)):
+                    result, seconds = timed(load)
+                    assert len(result) == rows
+                    del result
+                    db.session.remove()
+                    peak = traced(load)
+                    loads[label] = peak
+                    print(f"  one list   {label:9} {seconds:7.2f} s  peak {peak / 2**20:7.1f} MiB "
+                          f"({peak / rows:5.0f} B/row)")
+                print(f"  one list   memory    {loads['ORM'] / loads['Core rows']:.1f}x less with rows")
+
+
+if __name__ == "__main__":
+    run([int(arg) for arg in sys.argv[1:]] or [10000, 100000])
@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Logins/sec under concurrency, with the latency of an unrelated endpoint during the burst.
+
+Usage: python -m benchmarks.bench_login [threads] [seconds] [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from app import create_app
+from config import Config
+from database import db
+from services.user_service import UserService
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def run(threads, seconds, rounds):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+            BCRYPT_LOG_ROUNDS = rounds
+            LOGIN_THROTTLE_ENABLED = False  # every attempt comes from one address
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            UserService.create_user("Bench", "User", "bench@example.com", "benchpass")
+
+        counts = {"ok": 0, "busy": 0, "other": 0}
+        home_latencies = []
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def login_worker():
+            client = app.test_client()
+            while time.perf_counter() < deadline:
+                status = client.post("/api/v1/auth/login",
+                                     json={"email": "bench@example.com", "password": "benchpass"}).status_code
+                key = "ok" if status == 200 else "busy" if status == 503 else "other"
+                with lock:
+                    counts[key] += 1
+
+        def home_worker():
+            client = app.test_client()
+            while time.perf_counter() < deadline:
+                started = time.perf_counter()
+                client.get("/")
+                home_latencies.append(time.perf_counter() - started)
+                time.sleep(0.01)
+
+        workers = [threading.Thread(target=login_worker) for _ in range(threads)]
+        workers.append(threading.Thread(target=home_worker))
+        started = time.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = time.perf_counter() - started
+
+    print(f"threads: {threads}, bcrypt rounds: {rounds}, hash workers: {Config.PASSWORD_HASH_WORKERS}")
+    print(f"logins/sec: {counts['ok'] / elapsed:.1f}  (ok={counts['ok']} 503={counts['busy']} other={counts['other']})")
+    print(f"GET / during burst: p50={percentile(home_latencies, 50) * 1000:.2f} ms "
+          f"p99={percentile(home_latencies, 99) * 1000:.2f} ms")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 16, float(args[1]) if len(args) > 1 else 5, int(args[2]) if len(args) > 2 else 10)
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""Per-request cost of the /metrics instrumentation: the same requests against
+an app with METRICS_ENABLED on and off, interleaved in rounds to even out noise.
+
+Usage: python -m benchmarks.bench_metrics [requests_per_round] [rounds]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from app import create_app
+from config import Config
+from database import db
+from models.bill import Bill
+
+
+def build_app(tmp, name, enabled):
+    class BenchConfig(Config):
+        SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, name)
+        METRICS_ENABLED = enabled
+
+    app = create_app(BenchConfig)
+    with app.app_context():
+        db.create_all()
+        bills = [Bill(user_id="bench-user", amount=i, due_date=date.today() + timedelta(days=i)) for i in range(50)]
+        db.session.add_all(bills)
+        db.session.commit()
+        bill_id = bills[0].id
+        db.session.remove()
+    return app, [f"/api/v1/bills/{bill_id}", "/api/v1/bills/user/bench-user?limit=50"]
+
+
+def timed(client, paths, requests):
+    start = time.perf_counter()
+    for i in range(requests):
+        client.get(paths[i % len(paths)], buffered=True)  # closed, so the request is recorded
+    return time.perf_counter() - start
+
+
+def run(requests, rounds):
+    with tempfile.TemporaryDirectory() as tmp:
+        apps = {label: build_app(tmp, f"{label}.db", enabled) for label, enabled in (("off", False), ("on", True))}
+        clients = {label: (app.test_client(), paths) for label, (app, paths) in apps.items()}
+        totals = {"off": 0.0, "on": 0.0}
+        for label, (client, paths) in clients.items():
+            timed(client, paths, 50)  # warm up
+        for _ in range(rounds):
+            for label, (client, paths) in clients.items():
+                totals[label] += timed(client, paths, requests)
+
+        count = requests * rounds
+        off, on = (totals[label] / count * 1e6 for label in ("off", "on"))
+        print(f"metrics off {off:8.1f} us/request")
+        print(f"metrics on  {on:8.1f} us/request")
+        print(f"overhead    {on - off:8.1f} us/request ({(on - off) / off * 100:+.1f}%)")
+
+        app = apps["on"][0]
+        render_start = time.perf_counter()
+        body = app.extensions["metrics"].render()
+        print(f"scrape      {(time.perf_counter() - render_start) * 1000:8.2f} ms, {len(body)} bytes")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 500, int(args[1]) if len(args) > 1 else 5)
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Mixed read/write throughput on a SQLite file with and without the engine profile.
+
+Usage: python -m benchmarks.bench_sqlite_profile [threads] [seconds] [write_percent]
+"""
+
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from datetime import date, timedelta
+
+from sqlalchemy.exc import OperationalError
+
+from app import create_app
+from config import Config
+from database import db
+from services.bill_service import BillService
+
+
+def run_profile(apply_pragmas, threads, seconds, write_percent):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+            SQLITE_APPLY_PRAGMAS = apply_pragmas
+
+        app = create_app(BenchConfig)
+        today = date.today()
+        with app.app_context():
+            db.create_all()
+            BillService.create_bills_bulk(
+                {"user_id": f"user-{i % 100}", "amount": i % 500, "due_date": today + timedelta(days=i % 60)}
+                for i in range(20000)
+            )
+
+        counts = {"reads": 0, "writes": 0, "locked": 0}
+        lock = threading.Lock()
+        deadline = time.perf_counter() + seconds
+
+        def worker(seed):
+            rng = random.Random(seed)
+            reads = writes = locked = 0
+            with app.app_context():
+                while time.perf_counter() < deadline:
+                    user_id = f"user-{rng.randrange(100)}"
+                    try:
+                        if rng.randrange(100) < write_percent:
+                            BillService.create_bill(user_id, 10, today)
+                            writes += 1
+                        else:
+                            BillService.get_bills_page_by_user(user_id, limit=50)
+                            db.session.rollback()
+                            reads += 1
+                    except OperationalError:
+                        db.session.rollback()
+                        locked += 1
+                db.session.remove()
+            with lock:
+                counts["reads"] += reads
+                counts["writes"] += writes
+                counts["locked"] += locked
+
+        workers = [threading.Thread(target=worker, args=(i,)) for i in range(threads)]
+        started = time.perf_counter()
+        for w in workers:
+            w.start()
+        for w in workers:
+            w.join()
+        elapsed = time.perf_counter() - started
+
+        with app.app_context():
+            db.engine.dispose()
+
+    label = "tuned profile" if apply_pragmas else "defaults"
+    total = counts["reads"] + counts["writes"]
+    print(f"{label:14} {total / elapsed:9.0f} ops/sec  reads={counts['reads']} writes={counts['writes']} "
+          f"locked errors={counts['locked']}")
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    threads = int(args[0]) if args else 8
+    seconds = float(args[1]) if len(args) > 1 else 5
+    write_percent = int(args[2]) if len(args) > 2 else 20
+    print(f"threads: {threads}, {seconds}s each, {write_percent}% writes")
+    run_profile(False, threads, seconds, write_percent)
+    run_profile(True, threads, seconds, write_percent)
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Commits and time per composite operation (a bill, its reminders and an update)
+with and without unit_of_work().
+
+Usage: python -m benchmarks.bench_unit_of_work [operations] [reminders_per_bill]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from sqlalchemy import event
+
+from app import create_app
+from config import Config
+from database import db, unit_of_work
+from services.bill_service import BillService
+from services.reminder_service import ReminderService
+
+
+def composite(reminders):
+    bill = BillService.create_bill("bench-user", 100, date.today() + timedelta(days=10))
+    for days in range(reminders):
+        ReminderService.create_reminder(bill.id, "bench-user", date.today() + timedelta(days=days))
+    BillService.update_bill(bill.id, description="with reminders")
+
+
+def run(operations, reminders):
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            commits = []
+            event.listen(db.engine, "commit", lambda *args: commits.append(1))
+
+            for label, grouped in (("separate commits", False), ("unit_of_work", True)):
+                commits.clear()
+                start = time.perf_counter()
+                for _ in range(operations):
+                    if grouped:
+                        with unit_of_work():
+                            composite(reminders)
+                    else:
+                        composite(reminders)
+                elapsed = time.perf_counter() - start
+                print(f"{label:17} {len(commits) / operations:5.1f} commits/op  "
+                      f"{elapsed / operations * 1000:7.2f} ms/op")
+
+            db.session.remove()
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    run(int(args[0]) if args else 300, int(args[1]) if len(args) > 1 else 3)
@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+"""Benchmark suite covering every API route at a chosen data size.
+
+Seeds a fresh SQLite database (users, bills, reminders, plus pools of rows for
+the destructive routes). Then it times the service functions in-process and
+drives concurrent HTTP load against the app served on a local port.
+Per benchmark it reports p50/p95/p99 and requests (or calls) per second, writes
+everything as JSON and, given a baseline file, flags regressions and exits 1.
+
+Usage: python -m benchmarks.suite [--users N] [--bills-per-user N] [--requests N]
+       [--concurrency N] [--output FILE] [--baseline FILE] [--tolerance 0.2]
+"""
+
+import argparse
+import http.client
+import json
+import logging
+import os
+import platform
+import random
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timedelta
+
+from flask_jwt_extended import create_access_token
+from sqlalchemy import insert
+from werkzeug.serving import make_server
+
+from app import create_app
+from config import Config
+from database import db
+from models.bill import Bill
+from models.ids import uuid7
+from models.reminder import Reminder
+from models.user import User
+from services.archive_service import ArchiveService
+from services.bill_service import BillService, summary_cache
+from services.password_hasher import password_hasher
+from services.reminder_service import ReminderService
+from services.user_service import UserService, user_cache
+
+PASSWORD = "benchpass"
+STATUSES = ("pending", "pending", "pending", "paid", "paid", "overdue")
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def summarize(latencies, elapsed, errors=0):
+    return {
+        "count": len(latencies),
+        "errors": errors,
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+        "p99_ms": percentile(latencies, 99) * 1000,
+        "mean_ms": sum(latencies) / len(latencies) * 1000 if latencies else 0.0,
+        "per_second": len(latencies) / elapsed if elapsed else 0.0,
+    }
+
+
+def _user_rows(count, password_hash, prefix):
+    now = datetime.utcnow()
+    return [{"id": uuid7(), "first_name": "Bench", "last_name": f"User{i}", "email": f"{prefix}{i}@bench.local",
+             "password_hash": password_hash, "created_at": now, "updated_at": now} for i in range(count)]
+
+
+def _bill_rows(user_ids, per_user, rng, **overrides):
+    today = date.today()
+    now = datetime.utcnow()
+    rows = []
+    for user_id in user_ids:
+        for _ in range(per_user):
+            row = {"id": uuid7(), "user_id": user_id, "amount": round(rng.lognormvariate(4, 0.8), 2),
+                   "due_date": today + timedelta(days=rng.randint(-60, 60)), "status": rng.choice(STATUSES),
+                   "description": "Bench bill", "created_at": now, "updated_at": now, "is_deleted": False}
+            row.update(overrides)
+            rows.append(row)
+    return rows
+
+
+def _reminder_rows(bills, per_bill, **overrides):
+    now = datetime.utcnow()
+    rows = []
+    for bill in bills:
+        for offset in range(per_bill):
+            row = {"id": uuid7(), "bill_id": bill["id"], "user_id": bill["user_id"],
+                   "reminder_date": bill["due_date"] - timedelta(days=3 * (offset + 1)),
+                   "notification_method": "email", "message": "Bill due soon", "delivery_status": "pending",
+                   "created_at": now, "updated_at": now, "is_deleted": False}
+            row.update(overrides)
+            rows.append(row)
+    return rows
+
+
+def seed(users, bills_per_user, reminders_per_bill, pool):
+    """Insert the working set plus `pool` rows for every destructive route"""
+    rng = random.Random(42)
+    password_hash = password_hasher.hash(PASSWORD)
+    long_ago = datetime.utcnow() - timedelta(days=365)
+
+    user_rows = _user_rows(users, password_hash, "user")
+    bill_rows = _bill_rows([u["id"] for u in user_rows], bills_per_user, rng)
+    reminder_rows = _reminder_rows(bill_rows, reminders_per_bill)
+    disposable_users = _user_rows(pool, password_hash, "disposable")
+    disposable_bills = _bill_rows([u["id"] for u in user_rows[:1]], pool, rng)
+    archived_bills = _bill_rows([u["id"] for u in user_rows[:1]], pool, rng, is_deleted=True, updated_at=long_ago)
+    live_bill = bill_rows[:1]
+    archived_reminders = _reminder_rows(live_bill * pool, 1, is_deleted=True, updated_at=long_ago)
+
+    for model, rows in ((User, user_rows + disposable_users), (Bill, bill_rows + disposable_bills + archived_bills),
+                        (Reminder, reminder_rows + archived_reminders)):
+        db.session.execute(insert(model), rows)
+    db.session.commit()
+    ArchiveService.archive_deleted(retention_days=30, batch_size=5000)
+
+    return {
+        "users": [u["id"] for u in user_rows],
+        "emails": [u["email"] for u in user_rows],
+        "bills": [b["id"] for b in bill_rows],
+        "reminders": [r["id"] for r in reminder_rows],
+        "disposable_users": [u["id"] for u in disposable_users],
+        "disposable_bills": [b["id"] for b in disposable_bills],
+        "archived_bills": [b["id"] for b in archived_bills],
+        "archived_reminders": [r["id"] for r in archived_reminders],
+    }
+
+
+def run_micro(data, iterations):
+    """Time each service function in-process, cycling through seeded ids"""
+    users, bills, emails = data["users"], data["bills"], data["emails"]
+    benchmarks = {
+        "UserService.get_user_by_id": lambda i: UserService.get_user_by_id(users[i % len(users)]),
+        "UserService.get_user_by_email": lambda i: UserService.get_user_by_email(emails[i % len(emails)]),
+        "UserService.get_user_overview": lambda i: UserService.get_user_overview(users[i % len(users)]),
+        "UserService.get_users_page": lambda i: UserService.get_users_page(50, None),
+        "BillService.get_bill_by_id": lambda i: BillService.get_bill_by_id(bills[i % len(bills)]),
+        "BillService.get_bills_by_ids": lambda i: BillService.get_bills_by_ids(bills[i % len(bills):][:20]),
+        "BillService.get_bills_page_by_user": lambda i: BillService.get_bills_page_by_user(users[i % len(users)], 50, None),
+        "BillService.list_bills_rows": lambda i: BillService.list_bills_rows(users[i % len(users)], 50, None),
+        "BillService.get_bill_changes": lambda i: BillService.get_bill_changes(users[i % len(users)], None, 50),
+        "BillService.get_summary": lambda i: BillService.get_summary(users[i % len(users)]),
+        "ReminderService.get_reminders_page_by_user":
+            lambda i: ReminderService.get_reminders_page_by_user(users[i % len(users)], 50, None),
+    }
+    results = {}
+    for name, call in benchmarks.items():
+        user_cache.clear()
+        summary_cache.clear()
+        latencies = []
+        started = time.perf_counter()
+        for i in range(iterations):
+            call_started = time.perf_counter()
+            call(i)
+            latencies.append(time.perf_counter() - call_started)
+            db.session.remove()
+        results[name] = summarize(latencies, time.perf_counter() - started)
+    return results
+
+
+def http_scenarios(data, tokens, import_rows):
+    """(name, method, path(i), body(i), headers(i), expected status) for every route"""
+    users, bills, reminders = data["users"], data["bills"], data["reminders"]
+    today = date.today().isoformat()
+    user = lambda i: users[i % len(users)]  # noqa: E731
+    bill = lambda i: bills[i % len(bills)]  # noqa: E731
+    auth = lambda i: {"Authorization": f"Bearer {tokens['read']}"}  # noqa: E731
+    owner = lambda key: lambda i: {"Authorization": f"Bearer {tokens[key][i]}"}  # noqa: E731
+    none = lambda i: None  # noqa: E731
+    ids = lambda pool: lambda i: ",".join(pool[i % len(pool):][:20])  # noqa: E731
+    ndjson = "\n".join(json.dumps(row) for row in import_rows)
+
+    return [
+        ("GET /", "GET", lambda i: "/", none, none, 200),
+        ("GET /metrics", "GET", lambda i: "/metrics", none, none, 200),
+        ("POST /users/", "POST", lambda i: "/api/v1/users/",
+         lambda i: {"first_name": "New", "last_name": "User", "email": f"new{i}@bench.local", "password": PASSWORD},
+         none, 201),
+        ("GET /users/<id>", "GET", lambda i: f"/api/v1/users/{user(i)}", none, auth, 200),
+        ("GET /users/<id>/overview", "GET", lambda i: f"/api/v1/users/{user(i)}/overview", none, auth, 200),
+        ("GET /users/user-list", "GET", lambda i: "/api/v1/users/user-list?limit=50", none, auth, 200),
+        ("PUT /users/update/<id>", "PUT", lambda i: f"/api/v1/users/update/{users[i % len(users)]}",
+         lambda i: {"first_name": f"Renamed{i}"}, owner("users"), 200),
+        ("DELETE /users/delete/<id>", "DELETE", lambda i: f"/api/v1/users/delete/{data['disposable_users'][i]}",
+         none, owner("disposable_users"), 200),
+        ("POST /auth/login", "POST", lambda i: "/api/v1/auth/login",
+         lambda i: {"email": data["emails"][i % len(users)], "password": PASSWORD}, none, 200),
+        ("GET /auth/protected", "GET", lambda i: "/api/v1/auth/protected", none, auth, 200),
+        ("POST /bills/", "POST", lambda i: "/api/v1/bills/",
+         lambda i: {"user_id": user(i), "amount": 42.5, "due_date": today}, none, 201),
+        ("POST /bills/import", "POST", lambda i: f"/api/v1/bills/import?user_id={user(i)}",
+         lambda i: ndjson, lambda i: {"Content-Type": "application/x-ndjson"}, 201),
+        ("POST /bills/overdue/sweep", "POST", lambda i: "/api/v1/bills/overdue/sweep", none, none, 200),
+        ("GET /bills/batch", "GET", lambda i: f"/api/v1/bills/batch?ids={ids(bills)(i)}", none, none, 200),
+        ("GET /bills/<id>", "GET", lambda i: f"/api/v1/bills/{bill(i)}", none, none, 200),
+        ("GET /bills/user/<id>", "GET", lambda i: f"/api/v1/bills/user/{user(i)}?limit=50", none, none, 200),
+        ("GET /bills/user/<id>/changes", "GET", lambda i: f"/api/v1/bills/user/{user(i)}/changes?limit=50",
+         none, none, 200),
+        ("GET /bills/user/<id>/export", "GET", lambda i: f"/api/v1/bills/user/{user(i)}/export", none, none, 200),
+        ("GET /bills/user/<id>/summary", "GET", lambda i: f"/api/v1/bills/user/{user(i)}/summary", none, none, 200),
+        ("PUT /bills/<id>", "PUT", lambda i: f"/api/v1/bills/{bill(i)}",
+         lambda i: {"description": f"Edited {i}"}, none, 200),
+        ("PATCH /bills/<id>/pay", "PATCH", lambda i: f"/api/v1/bills/{bill(i)}/pay", none, none, 200),
+        ("POST /bills/<id>/restore", "POST", lambda i: f"/api/v1/bills/{data['archived_bills'][i]}/restore",
+         none, none, 200),
+        ("DELETE /bills/<id>", "DELETE", lambda i: f"/api/v1/bills/{data['disposable_bills'][i]}", none, none, 200),
+        ("GET /reminders/batch", "GET", lambda i: f"/api/v1/reminders/batch?ids={ids(reminders)(i)}",
+         none, none, 200),
+        ("GET /reminders/user/<id>", "GET", lambda i: f"/api/v1/reminders/user/{user(i)}?limit=50",
+         none, none, 200),
+        ("GET /reminders/user/<id>/changes", "GET",
+         lambda i: f"/api/v1/reminders/user/{user(i)}/changes?limit=50", none, none, 200),
+        ("GET /reminders/user/<id>/export", "GET", lambda i: f"/api/v1/reminders/user/{user(i)}/export",
+         none, none, 200),
+        ("POST /reminders/<id>/restore", "POST",
+         lambda i: f"/api/v1/reminders/{data['archived_reminders'][i]}/restore", none, none, 200),
+    ]
+
+
+def _send(port, method, path, body, headers):
+    headers = dict(headers or {})
+    if body is not None and not isinstance(body, str):
+        body = json.dumps(body)
+        headers.setdefault("Content-Type", "application/json")
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=60)
+    try:
+        started = time.perf_counter()
+        conn.request(method, path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status, time.perf_counter() - started
+    finally:
+        conn.close()
+
+
+def run_http(app, scenarios, requests, concurrency):
+    """Fire `requests` requests per route from `concurrency` threads at a local server"""
+    logging.getLogger("werkzeug").setLevel(logging.WARNING)
+    server = make_server("127.0.0.1", 0, app, threaded=True)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    results = {}
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for name, method, path, body, headers, expected in scenarios:
+                def one(i):
+                    return _send(server.server_port, method, path(i), body(i), headers(i))
+
+                started = time.perf_counter()
+                outcomes = list(pool.map(one, range(requests)))
+                elapsed = time.perf_counter() - started
+                errors = sum(1 for status, _ in outcomes if status != expected)
+                results[name] = summarize([latency for _, latency in outcomes], elapsed, errors)
+                if errors:
+                    statuses = sorted({status for status, _ in outcomes if status != expected})
+                    results[name]["unexpected_statuses"] = statuses
+    finally:
+        server.shutdown()
+        thread.join()
+    return results
+
+
+def compare(results, baseline, tolerance):
+    """Entries whose p95 grew or throughput dropped by more than `tolerance`"""
+    regressions = []
+    for section in ("micro", "http"):
+        for name, current in results.get(section, {}).items():
+            previous = baseline.get(section, {}).get(name)
+            if not previous:
+                continue
+            if previous["p95_ms"] and current["p95_ms"] > previous["p95_ms"] * (1 + tolerance):
+                regressions.append((section, name, "p95_ms", previous["p95_ms"], current["p95_ms"]))
+            if previous["per_second"] and current["per_second"] < previous["per_second"] * (1 - tolerance):
+                regressions.append((section, name, "per_second", previous["per_second"], current["per_second"]))
+    return regressions
+
+
+def print_table(title, stats):
+    print(f"\n{title}")
+    print(f"{'benchmark':46} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'per sec':>10} {'errors':>7}")
+    for name, s in stats.items():
+        print(f"{name:46} {s['p50_ms']:9.2f} {s['p95_ms']:9.2f} {s['p99_ms']:9.2f} "
+              f"{s['per_second']:10.1f} {s['errors']:7d}")
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--bills-per-user", type=int, default=20)
+    parser.add_argument("--reminders-per-bill", type=int, default=2)
+    parser.add_argument("--iterations", type=int, default=500, help="calls per service microbenchmark")
+    parser.add_argument("--requests", type=int, default=200, help="requests per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--import-rows", type=int, default=100, help="rows per /bills/import request")
+    parser.add_argument("--bcrypt-rounds", type=int, default=4,
+                        help="bcrypt cost for signup/login; bench_login measures real costs")
+    parser.add_argument("--skip-micro", action="store_true")
+    parser.add_argument("--skip-http", action="store_true")
+    parser.add_argument("--output", default="benchmark-results.json")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative slowdown")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    with tempfile.TemporaryDirectory() as tmp:
+        class BenchConfig(Config):
+            SQLALCHEMY_DATABASE_URI = "sqlite:///" + os.path.join(tmp, "bench.db")
+            BCRYPT_LOG_ROUNDS = args.bcrypt_rounds
+            LOGIN_THROTTLE_ENABLED = False  # the load driver logs in from one address
+            METRICS_ENABLED = True
+            ADMIN_TOKEN = None
+
+        app = create_app(BenchConfig)
+        with app.app_context():
+            db.create_all()
+            started = time.perf_counter()
+            data = seed(args.users, args.bills_per_user, args.reminders_per_bill, args.requests)
+            print(f"seeded {len(data['users'])} users, {len(data['bills'])} bills, "
+                  f"{len(data['reminders'])} reminders in {time.perf_counter() - started:.1f}s")
+            tokens = {
+                "read": create_access_token(identity=data["users"][0]),
+                "users": [create_access_token(identity={"id": user_id}) for user_id in
+                          (data["users"][i % len(data["users"])] for i in range(args.requests))],
+                "disposable_users": [create_access_token(identity={"id": user_id})
+                                     for user_id in data["disposable_users"]],
+            }
+            results = {
+                "meta": {
+                    "created_at": datetime.utcnow().isoformat(),
+                    "python": platform.python_version(),
+                    "sqlite": sqlite3.sqlite_version,
+                    "cpus": os.cpu_count(),
+                    "args": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+                },
+            }
+            if not args.skip_micro:
+                results["micro"] = run_micro(data, args.iterations)
+            db.session.remove()
+
+        if not args.skip_http:
+            import_rows = [{"amount": 10 + i, "due_date": date.today().isoformat(), "description": "Imported"}
+                           for i in range(args.import_rows)]
+            scenarios = http_scenarios(data, tokens, import_rows)
+            results["http"] = run_http(app, scenarios, args.requests, args.concurrency)
+
+    if "micro" in results:
+        print_table("service microbenchmarks", results["micro"])
+    if "http" in results:
+        print_table(f"HTTP load ({args.requests} requests/route, {args.concurrency} threads)", results["http"])
+
+    with open(args.output, "w") as f:
+        json.dump(results, f, indent=2)
+    print(f"\nresults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(results, json.load(f), args.tolerance)
+        for section, name, metric, before, after in regressions:
+            print(f"REGRESSION {section} {name}: {metric} {before:.2f} -> {after:.2f}")
+        if regressions:
+            return 1
+        print(f"no regressions beyond {args.tolerance:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
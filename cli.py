@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from database import SQLITE_PRAGMAS, db
+from services.archive_service import ArchiveService
+from services.bill_service import BillService
+from services.password_hasher import password_hasher
+from services.reminder_dispatcher import ReminderDispatcher
+from services.synthetic_data import DEFAULTS, generate
+
+bills_cli = AppGroup("bills", help="Bill maintenance commands")
+reminders_cli = AppGroup("reminders", help="Reminder delivery commands")
+data_cli = AppGroup("data", help="Synthetic data for scale testing")
+
+
+@bills_cli.command("sweep-overdue")
+@click.option("--chunk-size", type=int, default=None, help="Rows updated per transaction")
+def sweep_overdue(chunk_size):
+    """Mark unpaid bills past their due date as overdue"""
+    result = BillService.sweep_overdue(chunk_size or current_app.config["OVERDUE_SWEEP_CHUNK_SIZE"])
+    click.echo(json.dumps(result))
+
+
+@bills_cli.command("archive")
+@click.option("--retention-days", type=int, default=None, help="Only archive rows deleted longer ago than this")
+@click.option("--batch-size", type=int, default=None, help="Rows moved per transaction")
+def archive_deleted(retention_days, batch_size):
+    """Move soft-deleted bills and reminders into the archive tables"""
+    config = current_app.config
+    result = ArchiveService.archive_deleted(
+        config["ARCHIVE_RETENTION_DAYS"] if retention_days is None else retention_days,
+        batch_size or config["ARCHIVE_BATCH_SIZE"],
+        config["ARCHIVE_PAUSE_SECONDS"],
+    )
+    click.echo(json.dumps(result))
+
+
+@reminders_cli.command("dispatch")
+@click.option("--loop", is_flag=True, help="Keep running on REMINDER_DISPATCH_INTERVAL")
+@click.option("--interval", type=int, default=None, help="Seconds between runs when looping")
+def dispatch_reminders(loop, interval):
+    """Send every due reminder once"""
+    dispatcher = ReminderDispatcher(current_app._get_current_object())
+    if not loop:
+        click.echo(json.dumps(dispatcher.run_once()))
+        click.echo(json.dumps(dispatcher.metrics()))
+        return
+
+    interval = interval or current_app.config["REMINDER_DISPATCH_INTERVAL"]
+    dispatcher.start(interval)
+    try:
+        while True:
+            time.sleep(interval)
+            click.echo(json.dumps(dispatcher.metrics()))
+    except KeyboardInterrupt:
+        dispatcher.stop()
+
+
+@data_cli.command("generate")
+@click.option("--users", type=int, required=True, help="Number of users to create")
+@click.option("--start-user", type=int, default=0, help="Index of the first user (emails are user<N>@example.com)")
+@click.option("--bills-per-user", type=float, default=DEFAULTS["bills_per_user"], help="Mean bills per user")
+@click.option("--reminders-per-bill", type=float, default=DEFAULTS["reminders_per_bill"],
+              help="Mean reminders per bill (at most 3)")
+@click.option("--deleted-fraction", type=float, default=DEFAULTS["deleted_fraction"],
+              help="Share of soft-deleted bills and reminders")
+@click.option("--paid-fraction", type=float, default=DEFAULTS["paid_fraction"],
+              help="Share of past-due bills that are paid (the rest are overdue)")
+@click.option("--history-days", type=int, default=DEFAULTS["history_days"], help="How far back due dates go")
+@click.option("--chunk-users", type=int, default=DEFAULTS["chunk_users"], help="Users per transaction")
+@click.option("--workers", type=int, default=1, help="Processes, each inserting its own user range")
+@click.option("--seed", type=int, default=DEFAULTS["seed"], help="Random seed")
+@click.option("--password", default="password123", help="Password for every user, hashed once")
+@click.option("--password-hash", default=None, help="Precomputed bcrypt hash to store instead")
+def generate_data(users, start_user, workers, password, password_hash, **options):
+    """Bulk-insert realistic users, bills and reminders"""
+    config = current_app.config
+    pragma_config = {key: config.get(key) for _, key in SQLITE_PRAGMAS}
+    pragma_config["SQLITE_BUSY_TIMEOUT_MS"] = max(config["SQLITE_BUSY_TIMEOUT_MS"], 60000)
+    try:
+        result = generate(db.engine, users, password_hash or password_hasher.hash(password),
+                          start_user=start_user, workers=workers, pragma_config=pragma_config, **options)
+    except ValueError as e:
+        raise click.UsageError(str(e))
+    click.echo(json.dumps(result))
+
+
+def register_commands(app):
+    """Attach the CLI command groups to the app"""
+    app.cli.add_command(bills_cli)
+    app.cli.add_command(reminders_cli)
+    app.cli.add_command(data_cli)
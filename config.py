@@ -12,3 +12,108 @@ class Config:
     SQLALCHEMY_TRACK_MODIFICATIONS = False
     DEBUG = os.getenv("DEBUG", "False").strip().lower() in ["1", "true", "yes"]
 
+    # Primary key storage: "string" (36-char text) or "binary" (16 bytes, new databases only)
+    ID_STORAGE = os.getenv("ID_STORAGE", "string")
+
+    # SQLite engine profile, applied to every new connection
+    SQLITE_APPLY_PRAGMAS = os.getenv("SQLITE_APPLY_PRAGMAS", "True").strip().lower() in ["1", "true", "yes"]
+    SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+    SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+    SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+    SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-64000"))  # negative = KiB
+    SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+    SQLITE_TEMP_STORE = os.getenv("SQLITE_TEMP_STORE", "MEMORY")
+
+    # Connection pool for server databases
+    DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+    DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+    DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))  # seconds
+    DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "True").strip().lower() in ["1", "true", "yes"]
+
+    # Request metrics served at /metrics (Prometheus text format), opt-in;
+    # when ADMIN_TOKEN is set the scrape must send it in X-Admin-Token
+    METRICS_ENABLED = os.getenv("METRICS_ENABLED", "False").strip().lower() in ["1", "true", "yes"]
+
+    # Slow-query log (opt-in); "memory" keeps a ring buffer served at /admin/slow-queries
+    SLOW_QUERY_LOG_ENABLED = os.getenv("SLOW_QUERY_LOG_ENABLED", "False").strip().lower() in ["1", "true", "yes"]
+    SLOW_QUERY_THRESHOLD_MS = float(os.getenv("SLOW_QUERY_THRESHOLD_MS", "200"))
+    SLOW_QUERY_SAMPLE_RATE = float(os.getenv("SLOW_QUERY_SAMPLE_RATE", "1.0"))  # share of statements timed
+    SLOW_QUERY_EXPLAIN_PER_MINUTE = int(os.getenv("SLOW_QUERY_EXPLAIN_PER_MINUTE", "30"))
+    SLOW_QUERY_SINK = os.getenv("SLOW_QUERY_SINK", "memory")  # memory or file
+    SLOW_QUERY_BUFFER_SIZE = int(os.getenv("SLOW_QUERY_BUFFER_SIZE", "200"))
+    SLOW_QUERY_FILE = os.getenv("SLOW_QUERY_FILE", "slow_queries.log")
+    SLOW_QUERY_FILE_MAX_BYTES = int(os.getenv("SLOW_QUERY_FILE_MAX_BYTES", str(10 * 1024 * 1024)))
+    SLOW_QUERY_FILE_BACKUPS = int(os.getenv("SLOW_QUERY_FILE_BACKUPS", "5"))
+    ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")  # required in X-Admin-Token for /admin endpoints
+
+    # Password hashing
+    BCRYPT_LOG_ROUNDS = int(os.getenv("BCRYPT_LOG_ROUNDS", "12"))
+    BCRYPT_TARGET_MS = int(os.getenv("BCRYPT_TARGET_MS", "0")) or None  # calibrate the cost at startup when set
+    PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", str(os.cpu_count() or 2)))
+    PASSWORD_HASH_QUEUE = int(os.getenv("PASSWORD_HASH_QUEUE", "32"))
+    PASSWORD_HASH_TIMEOUT = int(os.getenv("PASSWORD_HASH_TIMEOUT", "10"))  # seconds
+
+    # Login throttling: token buckets per client IP and per email, checked before bcrypt
+    LOGIN_THROTTLE_ENABLED = os.getenv("LOGIN_THROTTLE_ENABLED", "True").strip().lower() in ["1", "true", "yes"]
+    LOGIN_THROTTLE_BACKEND = os.getenv("LOGIN_THROTTLE_BACKEND", "memory")  # memory or sqlite (shared file)
+    LOGIN_THROTTLE_PATH = os.getenv("LOGIN_THROTTLE_PATH")
+    LOGIN_THROTTLE_MAX_KEYS = int(os.getenv("LOGIN_THROTTLE_MAX_KEYS", "100000"))
+    LOGIN_IP_BURST = int(os.getenv("LOGIN_IP_BURST", "20"))
+    LOGIN_IP_PER_MINUTE = float(os.getenv("LOGIN_IP_PER_MINUTE", "20"))
+    LOGIN_EMAIL_BURST = int(os.getenv("LOGIN_EMAIL_BURST", "5"))
+    LOGIN_EMAIL_PER_MINUTE = float(os.getenv("LOGIN_EMAIL_PER_MINUTE", "5"))
+    # Reverse proxies in front of the app whose X-Forwarded-For entries are trusted; 0 keys
+    # the IP buckets on the socket address, so behind a proxy every client would share one
+    PROXY_FIX_X_FOR = int(os.getenv("PROXY_FIX_X_FOR", "0"))
+
+    # Bulk bill import
+    BULK_IMPORT_CHUNK_SIZE = int(os.getenv("BULK_IMPORT_CHUNK_SIZE", "1000"))
+    BULK_IMPORT_COMMIT_PER_CHUNK = os.getenv("BULK_IMPORT_COMMIT_PER_CHUNK", "False").strip().lower() in ["1", "true", "yes"]
+
+    # Multi-get endpoints
+    BATCH_GET_MAX_IDS = int(os.getenv("BATCH_GET_MAX_IDS", "100"))
+
+    # Overdue sweep
+    OVERDUE_SWEEP_CHUNK_SIZE = int(os.getenv("OVERDUE_SWEEP_CHUNK_SIZE", "5000"))
+
+    # Archival of soft-deleted bills and reminders
+    ARCHIVE_RETENTION_DAYS = int(os.getenv("ARCHIVE_RETENTION_DAYS", "30"))
+    ARCHIVE_BATCH_SIZE = int(os.getenv("ARCHIVE_BATCH_SIZE", "500"))
+    ARCHIVE_PAUSE_SECONDS = float(os.getenv("ARCHIVE_PAUSE_SECONDS", "0"))
+
+    # gzip/deflate for buffered text responses at least COMPRESSION_MIN_SIZE bytes long
+    COMPRESSION_ENABLED = os.getenv("COMPRESSION_ENABLED", "True").strip().lower() in ["1", "true", "yes"]
+    COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+    COMPRESSION_LEVEL = int(os.getenv("COMPRESSION_LEVEL", "6"))
+
+    # Delta sync feeds: changes newer than this many seconds are held back until their writers commit
+    SYNC_SETTLE_SECONDS = float(os.getenv("SYNC_SETTLE_SECONDS", "2"))
+
+    # Per-user bill summary cache
+    BILL_SUMMARY_CACHE_SIZE = int(os.getenv("BILL_SUMMARY_CACHE_SIZE", "10000"))
+    BILL_SUMMARY_CACHE_TTL = int(os.getenv("BILL_SUMMARY_CACHE_TTL", "300"))  # seconds
+
+    # User record cache: "memory" (per process) or "sqlite" (file shared by worker processes)
+    USER_CACHE_BACKEND = os.getenv("USER_CACHE_BACKEND", "memory")
+    USER_CACHE_SIZE = int(os.getenv("USER_CACHE_SIZE", "10000"))
+    USER_CACHE_TTL = int(os.getenv("USER_CACHE_TTL", "60"))  # seconds
+    USER_CACHE_PATH = os.getenv("USER_CACHE_PATH")
+
+    # Reminder dispatcher
+    REMINDER_NOTIFIER = os.getenv("REMINDER_NOTIFIER", "log")  # log, smtp or webhook
+    REMINDER_BATCH_SIZE = int(os.getenv("REMINDER_BATCH_SIZE", "500"))
+    REMINDER_MAX_WORKERS = int(os.getenv("REMINDER_MAX_WORKERS", "8"))
+    REMINDER_DISPATCH_INTERVAL = int(os.getenv("REMINDER_DISPATCH_INTERVAL", "60"))  # seconds
+    REMINDER_MAX_ATTEMPTS = int(os.getenv("REMINDER_MAX_ATTEMPTS", "3"))  # sends before a reminder is failed
+    REMINDER_LEASE_SECONDS = int(os.getenv("REMINDER_LEASE_SECONDS", "600"))  # stale "sending" claims are retaken
+    REMINDER_SMTP_HOST = os.getenv("REMINDER_SMTP_HOST", "localhost")
+    REMINDER_SMTP_PORT = int(os.getenv("REMINDER_SMTP_PORT", "1025"))
+    REMINDER_SMTP_SENDER = os.getenv("REMINDER_SMTP_SENDER", "reminders@billmap.local")
+    REMINDER_WEBHOOK_URL = os.getenv("REMINDER_WEBHOOK_URL")
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    METRICS_ENABLED = True
+    BCRYPT_LOG_ROUNDS = 4
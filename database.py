@@ -1,5 +1,96 @@
 #!/usr/bin/env python3
 
+from contextlib import contextmanager
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import event
+from sqlalchemy.engine import make_url
 
 db = SQLAlchemy()
+
+SQLITE_PRAGMAS = (
+    ("journal_mode", "SQLITE_JOURNAL_MODE"),
+    ("synchronous", "SQLITE_SYNCHRONOUS"),
+    ("busy_timeout", "SQLITE_BUSY_TIMEOUT_MS"),
+    ("cache_size", "SQLITE_CACHE_SIZE"),
+    ("mmap_size", "SQLITE_MMAP_SIZE"),
+    ("temp_store", "SQLITE_TEMP_STORE"),
+)
+
+
+def _is_sqlite(uri):
+    return make_url(uri).get_backend_name() == "sqlite"
+
+
+def _server_engine_options(config):
+    """Pool sizing for server databases (PostgreSQL, MySQL, ...)"""
+    return {
+        "pool_size": config["DB_POOL_SIZE"],
+        "max_overflow": config["DB_MAX_OVERFLOW"],
+        "pool_recycle": config["DB_POOL_RECYCLE"],
+        "pool_pre_ping": config["DB_POOL_PRE_PING"],
+    }
+
+
+def _sqlite_pragma_listener(config):
+    pragmas = [(name, config[key]) for name, key in SQLITE_PRAGMAS if config.get(key) is not None]
+
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas:
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+    return set_sqlite_pragmas
+
+
+def init_db(app):
+    """Bind db to the app using the engine profile from its config.
+
+    SQLite connections get the configured pragmas (WAL, busy timeout, cache,
+    mmap, ...) as they are opened; other backends get pool sizing options."""
+    uri = app.config["SQLALCHEMY_DATABASE_URI"]
+    sqlite = _is_sqlite(uri)
+    if not sqlite:
+        options = app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {})
+        for key, value in _server_engine_options(app.config).items():
+            options.setdefault(key, value)
+
+    db.init_app(app)
+
+    if sqlite and app.config.get("SQLITE_APPLY_PRAGMAS", True):
+        with app.app_context():
+            event.listen(db.engine, "connect", _sqlite_pragma_listener(app.config))
+
+
+def in_unit_of_work():
+    return db.session.info.get("unit_of_work_depth", 0) > 0
+
+
+def commit():
+    """Commit the session, or only flush it while a unit of work is open"""
+    if in_unit_of_work():
+        db.session.flush()
+    else:
+        db.session.commit()
+
+
+@contextmanager
+def unit_of_work():
+    """Group several model/service writes into a single transaction.
+
+    Inside the block, commit() flushes instead of committing, so ids and
+    defaults are still populated and later queries see the changes. The
+    outermost block commits once on exit and rolls back if an exception
+    escapes. Also usable as a decorator: @unit_of_work()."""
+    info = db.session.info
+    info["unit_of_work_depth"] = info.get("unit_of_work_depth", 0) + 1
+    try:
+        yield db.session
+        if info["unit_of_work_depth"] == 1:
+            db.session.commit()
+    except BaseException:
+        if info["unit_of_work_depth"] == 1:
+            db.session.rollback()
+        raise
+    finally:
+        info["unit_of_work_depth"] -= 1
@@ -2,5 +2,6 @@
 from models.user import User
 from models.bill import Bill
 from models.reminder import Reminder
+from models.archive import bills_archive, reminders_archive
 
-__all__ = ['User', 'Bill', 'Reminder']
\ No newline at end of file
+__all__ = ['User', 'Bill', 'Reminder', 'bills_archive', 'reminders_archive']
\ No newline at end of file
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+from database import db
+from models.bill import Bill
+from models.reminder import Reminder
+
+
+def _archive_table(name, source):
+    """Plain copy of a hot table's columns (no foreign keys or secondary indexes) plus archived_at"""
+    columns = [
+        db.Column(column.name, column.type, primary_key=column.primary_key, nullable=column.nullable)
+        for column in source.columns
+    ]
+    return db.Table(name, db.metadata, *columns, db.Column("archived_at", db.DateTime, nullable=False))
+
+
+bills_archive = _archive_table("bills_archive", Bill.__table__)
+reminders_archive = _archive_table("reminders_archive", Reminder.__table__)
+
+# Restoring a bill brings its archived reminders back with it
+db.Index("ix_reminders_archive_bill_id", reminders_archive.c.bill_id)
@@ -1,14 +1,14 @@
 #!/usr/bin/env python3
 
-import uuid
 from datetime import datetime
-from database import db
+from database import db, commit
+from models.ids import id_type, uuid7
 
 
 class BaseModel(db.Model):
     __abstract__ = True
 
-    id = db.Column(db.String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = db.Column(id_type(), primary_key=True, default=uuid7)
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
     is_deleted = db.Column(db.Boolean, default=False)
@@ -17,7 +17,7 @@ class BaseModel(db.Model):
         """Save the object to the database"""
         self.updated_at = datetime.utcnow()
         db.session.add(self)
-        db.session.commit()
+        commit()
 
     def update(self, data):
         """Update the attributes of the object and save"""
@@ -1,27 +1,47 @@
 #!/usr/bin/env python3
 
 from models.base_model import BaseModel
-from database import db
+from database import db, commit
+from models.ids import id_type
 from datetime import date
 
 class Bill(BaseModel):
     __tablename__ = 'bills'
+    __table_args__ = (
+        db.Index('ix_bills_user_id_is_deleted_due_date', 'user_id', 'is_deleted', 'due_date'),
+        db.Index('ix_bills_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        # Delta sync: a user's changes in (updated_at, id) order
+        db.Index('ix_bills_user_id_updated_at_id', 'user_id', 'updated_at', 'id'),
+        db.Index('ix_bills_status_due_date', 'status', 'due_date'),
+        # Unpaid, non-deleted bills by due date (partial where the backend supports it)
+        db.Index('ix_bills_unpaid_due_date', 'due_date',
+                 sqlite_where=db.text("is_deleted = 0 AND status != 'paid'"),
+                 postgresql_where=db.text("is_deleted = false AND status != 'paid'")),
+        # Soft-deleted bills waiting for archival
+        db.Index('ix_bills_deleted_updated_at', 'updated_at',
+                 sqlite_where=db.text("is_deleted = 1"),
+                 postgresql_where=db.text("is_deleted = true")),
+    )
     
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    user_id = db.Column(id_type(), db.ForeignKey('users.id'), nullable=False)
     amount = db.Column(db.Float, nullable=False)
     due_date = db.Column(db.Date, nullable=False)
     status = db.Column(db.String(20), default="pending")
     minimum_payment = db.Column(db.Float, nullable=True)
     description = db.Column(db.String(255), nullable=True)
+
+    user = db.relationship("User", back_populates="bills")
+    reminders = db.relationship("Reminder", back_populates="bill", order_by="Reminder.reminder_date",
+                                passive_deletes="all")
     
     def mark_as_paid(self):
         self.status = "paid"
-        db.session.commit()
+        commit()
         
     def is_overdue(self):
         return self.due_date < date.today() and self.status != "paid"
     
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
         
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+
+import os
+import threading
+import time
+import uuid
+from sqlalchemy.types import TypeDecorator, LargeBinary
+from config import Config
+from database import db
+
+_lock = threading.Lock()
+_last_ms = 0
+_counter = 0
+
+
+def uuid7():
+    """Return a time-ordered UUID (version 7) as a string.
+
+    The first 48 bits are the Unix time in milliseconds, so new ids sort after
+    old ones and inserts land at the right edge of the primary key index. Within
+    one millisecond a 12-bit counter keeps ids from this process increasing."""
+    global _last_ms, _counter
+    with _lock:
+        ms = time.time_ns() // 1_000_000
+        if ms <= _last_ms:
+            _counter += 1
+            if _counter > 0xFFF:
+                _last_ms += 1
+                _counter = 0
+            ms = _last_ms
+        else:
+            _last_ms = ms
+            _counter = int.from_bytes(os.urandom(2), "big") & 0x3FF
+        rand_a = _counter
+
+    rand_b = int.from_bytes(os.urandom(8), "big") & ((1 << 62) - 1)
+    value = (ms << 80) | (0x7 << 76) | (rand_a << 64) | (0b10 << 62) | rand_b
+    h = "%032x" % value  # same text as str(uuid.UUID(int=value)), without building the object
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+class BinaryUUID(TypeDecorator):
+    """Stores a UUID string as 16 raw bytes instead of 36 characters"""
+
+    impl = LargeBinary(16)
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None or isinstance(value, bytes):
+            return value
+        return uuid.UUID(str(value)).bytes
+
+    def process_result_value(self, value, dialect):
+        if value is None:
+            return None
+        return str(uuid.UUID(bytes=bytes(value)))
+
+
+def id_type():
+    """Column type for primary keys and the foreign keys that point at them (ID_STORAGE)"""
+    if Config.ID_STORAGE == "binary":
+        return BinaryUUID()
+    return db.String(36)
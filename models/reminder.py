@@ -1,17 +1,41 @@
 #!/usr/bin/env python3
 
 from models.base_model import BaseModel
-from database import db
+from database import db, commit
+from models.ids import id_type
 from datetime import date
 
 class Reminder(BaseModel):
     __tablename__ = 'reminders'
+    __table_args__ = (
+        db.Index('ix_reminders_reminder_date_is_deleted', 'reminder_date', 'is_deleted'),
+        db.Index('ix_reminders_user_id_created_at_id', 'user_id', 'created_at', 'id'),
+        # Delta sync: a user's changes in (updated_at, id) order
+        db.Index('ix_reminders_user_id_updated_at_id', 'user_id', 'updated_at', 'id'),
+        db.Index('ix_reminders_bill_id', 'bill_id'),
+        # Reminders still waiting for the dispatcher
+        db.Index('ix_reminders_pending_reminder_date', 'reminder_date',
+                 sqlite_where=db.text("delivery_status = 'pending' AND is_deleted = 0"),
+                 postgresql_where=db.text("delivery_status = 'pending' AND is_deleted = false")),
+        # Soft-deleted reminders waiting for archival
+        db.Index('ix_reminders_deleted_updated_at', 'updated_at',
+                 sqlite_where=db.text("is_deleted = 1"),
+                 postgresql_where=db.text("is_deleted = true")),
+    )
     
-    bill_id = db.Column(db.Integer, db.ForeignKey('bills.id'), nullable=False)
-    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+    bill_id = db.Column(id_type(), db.ForeignKey('bills.id'), nullable=False)
+    user_id = db.Column(id_type(), db.ForeignKey('users.id'), nullable=False)
     reminder_date = db.Column(db.Date, nullable=False)
     notification_method = db.Column(db.String(50), default="app_notification")
     message = db.Column(db.String(255), nullable=True)
+    delivery_status = db.Column(db.String(20), default="pending", server_default="pending", nullable=False)
+    sent_at = db.Column(db.DateTime, nullable=True)
+    # Dispatcher bookkeeping: sends tried so far and when the current claim was taken
+    delivery_attempts = db.Column(db.Integer, default=0, server_default="0", nullable=False)
+    claimed_at = db.Column(db.DateTime, nullable=True)
+
+    bill = db.relationship("Bill", back_populates="reminders")
+    user = db.relationship("User", back_populates="reminders")
     
     def send_notification(self):
         print(f"Sending {self.notification_method} reminder: {self.message}")
@@ -21,5 +45,5 @@ class Reminder(BaseModel):
     
     def save(self):
         db.session.add(self)
-        db.session.commit()
+        commit()
         
@@ -2,23 +2,32 @@
 
 from models.base_model import BaseModel
 from database import db
-from flask_bcrypt import Bcrypt
-
-bcrypt = Bcrypt()
+from services.password_hasher import password_hasher
 
 
 class User(BaseModel):
     __tablename__ = "users"
+    __table_args__ = (
+        db.Index('ix_users_created_at_id', 'created_at', 'id'),
+    )
 
     first_name = db.Column(db.String(50), nullable=False)
     last_name = db.Column(db.String(50), nullable=False)
     email = db.Column(db.String(120), unique=True, nullable=False)
     password_hash = db.Column(db.String(256), nullable=False)
 
+    bills = db.relationship("Bill", back_populates="user", order_by="Bill.due_date", passive_deletes="all")
+    reminders = db.relationship("Reminder", back_populates="user", order_by="Reminder.reminder_date",
+                                passive_deletes="all")
+
     def set_password(self, password):
         """Hash and store password"""
-        self.password_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
         """Verify provided password against stored hash"""
-        return bcrypt.check_password_hash(self.password_hash, password)
+        return password_hasher.verify(self.password_hash, password)
+
+    def password_needs_rehash(self):
+        """Check if the stored hash uses an outdated bcrypt cost"""
+        return password_hasher.needs_rehash(self.password_hash)
@@ -1,11 +1,25 @@
 #!/usr/bin/env python3
 
+from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import create_access_token, jwt_required, get_jwt_identity
 from services.user_service import UserService
+from services.login_throttle import LoginThrottled, login_throttle
+from services.password_hasher import PasswordHasherBusy
 
 api = Namespace('auth', description='Authentication operations')
 
+
+@api.errorhandler(PasswordHasherBusy)
+def handle_hasher_busy(error):
+    """Shed load quickly when the password hashing pool is full"""
+    return {'error': str(error)}, 503, {'Retry-After': '1'}
+
+@api.errorhandler(LoginThrottled)
+def handle_login_throttled(error):
+    """Reject over-limit login attempts before any lookup or hashing"""
+    return {'error': str(error)}, 429, {'Retry-After': str(error.retry_after)}
+
 # Model for input validation
 login_model = api.model('Login', {
     'email': fields.String(required=True, description='User email'),
@@ -16,15 +30,20 @@ login_model = api.model('Login', {
 @api.route('/login')
 class Login(Resource):
     @api.expect(login_model, validate=True)
+    @api.response(429, 'Too many login attempts from this address or for this email')
+    @api.response(503, 'Too many concurrent logins')
     def post(self):
         """Authenticate user and return a JWT token"""
         credentials = api.payload
+        login_throttle.check(request.remote_addr, credentials['email'])
 
         # Step 1: Retrieve the user based on the provided email
         user = UserService.get_user_by_email(credentials['email'])
         if not user or not user.check_password(credentials['password']):
             return {'error': 'Invalid credentials'}, 401
 
+        UserService.rehash_password_if_needed(user, credentials['password'])
+
         # Step 2: Create a JWT token with user details (Fix)
         access_token = create_access_token(identity={"id": str(user.id), "email": user.email})
 
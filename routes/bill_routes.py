@@ -1,11 +1,64 @@
 #!/usr/bin/env python3
 
-from flask import Blueprint, request, jsonify
-from services.bill_service import BillService
+import csv
+import io
+import json
+from flask import Blueprint, request, jsonify, current_app
+from services.bill_service import BillService, EXPORT_COLUMNS
+from services.archive_service import ArchiveService
+from routes.streaming import EXPORT_FORMATS, parse_date_range, stream_rows
+from routes.params import parse_fields, parse_id_list
+from routes.sync import changes_response
+from routes.conditional import check_conditional
 from datetime import datetime
 
 bill_bp = Blueprint("bill_bp", __name__)
 
+
+def format_bill(bill):
+    """Helper function to format bill responses"""
+    return {
+        "id": bill.id,
+        "user_id": bill.user_id,
+        "amount": bill.amount,
+        "due_date": bill.due_date.isoformat(),
+        "status": bill.status,
+        "description": bill.description,
+        "minimum_payment": bill.minimum_payment
+    }
+
+
+# Fields of the bills-by-user list, selectable with ?fields=
+BILL_LIST_FIELDS = {
+    "id": lambda bill: bill.id,
+    "amount": lambda bill: bill.amount,
+    "due_date": lambda bill: bill.due_date.isoformat(),
+    "status": lambda bill: bill.status,
+    "description": lambda bill: bill.description,
+}
+
+
+def _read_ndjson(stream):
+    """Yield one dict per non-blank line; undecodable lines yield None"""
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except ValueError:
+            yield None
+
+
+def _read_import_rows():
+    """Stream rows from the request body as CSV or NDJSON"""
+    stream = io.TextIOWrapper(request.stream, encoding="utf-8", newline="")
+    if request.mimetype in ("text/csv", "application/csv"):
+        return csv.DictReader(stream)
+    if request.mimetype in ("application/x-ndjson", "application/ndjson", "application/jsonl"):
+        return _read_ndjson(stream)
+    return None
+
 @bill_bp.route("/", methods=["POST"])
 def create_bill():
     data = request.get_json()
@@ -26,36 +79,111 @@ def create_bill():
     bill = BillService.create_bill(user_id, amount, due_date, description, minimum_payment)
     return jsonify({"message": "Bill created successfully", "bill_id": bill.id}), 201
 
-@bill_bp.route("/<int:bill_id>", methods=["GET"])
+@bill_bp.route("/import", methods=["POST"])
+def import_bills():
+    rows = _read_import_rows()
+    if rows is None:
+        return jsonify({"error": "Content-Type must be text/csv or application/x-ndjson"}), 415
+
+    chunk_size = request.args.get("chunk_size", current_app.config["BULK_IMPORT_CHUNK_SIZE"], type=int)
+    if chunk_size < 1:
+        return jsonify({"error": "chunk_size must be a positive integer"}), 400
+
+    commit_per_chunk = request.args.get("commit_per_chunk")
+    if commit_per_chunk is None:
+        commit_per_chunk = current_app.config["BULK_IMPORT_COMMIT_PER_CHUNK"]
+    else:
+        commit_per_chunk = commit_per_chunk.strip().lower() in ["1", "true", "yes"]
+
+    try:
+        result = BillService.create_bills_bulk(
+            rows,
+            user_id=request.args.get("user_id"),
+            chunk_size=chunk_size,
+            commit_per_chunk=commit_per_chunk
+        )
+    except (UnicodeDecodeError, csv.Error) as e:
+        return jsonify({"error": f"Request body could not be read: {e}"}), 400
+    status = 201 if result["created"] else 400
+    return jsonify(result), status
+
+@bill_bp.route("/overdue/sweep", methods=["POST"])
+def sweep_overdue_bills():
+    result = BillService.sweep_overdue(current_app.config["OVERDUE_SWEEP_CHUNK_SIZE"])
+    return jsonify(result), 200
+
+@bill_bp.route("/batch", methods=["GET"])
+def get_bills_batch():
+    bill_ids = parse_id_list(request.args.get("ids"))
+    if not bill_ids:
+        return jsonify({"error": "ids is required"}), 400
+
+    max_ids = current_app.config["BATCH_GET_MAX_IDS"]
+    if len(bill_ids) > max_ids:
+        return jsonify({"error": f"At most {max_ids} ids per request"}), 400
+
+    bills, missing = BillService.get_bills_by_ids(bill_ids)
+    return jsonify({"items": [format_bill(bill) for bill in bills], "missing": missing}), 200
+
+@bill_bp.route("/<string:bill_id>", methods=["GET"])
 def get_bill(bill_id):
+    updated_at = BillService.get_bill_version(bill_id)
+    if updated_at is None:
+        return jsonify({"error": "Bill not found"}), 404
+
+    headers, not_modified = check_conditional(updated_at, updated_at)
+    if not_modified:
+        return not_modified
+
     bill = BillService.get_bill_by_id(bill_id)
     if not bill:
         return jsonify({"error": "Bill not found"}), 404
 
-    return jsonify({
-        "id": bill.id,
-        "user_id": bill.user_id,
-        "amount": bill.amount,
-        "due_date": bill.due_date.isoformat(),
-        "status": bill.status,
-        "description": bill.description,
-        "minimum_payment": bill.minimum_payment
-    }), 200
+    return jsonify(format_bill(bill)), 200, headers
 
-@bill_bp.route("/user/<int:user_id>", methods=["GET"])
+@bill_bp.route("/user/<string:user_id>", methods=["GET"])
 def get_bills_by_user(user_id):
-    bills = BillService.get_bills_by_user(user_id)
-    return jsonify([
-        {
-            "id": bill.id,
-            "amount": bill.amount,
-            "due_date": bill.due_date.isoformat(),
-            "status": bill.status,
-            "description": bill.description
-        } for bill in bills
-    ]), 200
-
-@bill_bp.route("/<int:bill_id>", methods=["PUT"])
+    count, updated_at = BillService.get_user_bills_version(user_id)
+    headers, not_modified = check_conditional(None, count, updated_at)
+    if not_modified:
+        return not_modified
+
+    try:
+        fields = parse_fields(request.args.get("fields"), BILL_LIST_FIELDS)
+        bills, next_cursor = BillService.list_bills_rows(
+            user_id, request.args.get("limit", type=int), request.args.get("cursor"), fields
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "items": [{name: BILL_LIST_FIELDS[name](bill) for name in fields} for bill in bills],
+        "next_cursor": next_cursor
+    }), 200, headers
+
+@bill_bp.route("/user/<string:user_id>/changes", methods=["GET"])
+def get_bill_changes(user_id):
+    return changes_response(BillService.get_bill_changes, user_id, format_bill)
+
+@bill_bp.route("/user/<string:user_id>/export", methods=["GET"])
+def export_bills_by_user(user_id):
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "format must be ndjson or csv"}), 400
+
+    try:
+        start_date, end_date = parse_date_range(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    rows = BillService.iter_bills_for_export(user_id, start_date, end_date)
+    return stream_rows(rows, EXPORT_COLUMNS, fmt, f"bills-{user_id}")
+
+@bill_bp.route("/user/<string:user_id>/summary", methods=["GET"])
+def get_bill_summary(user_id):
+    return jsonify(BillService.get_summary(user_id)), 200
+
+@bill_bp.route("/<string:bill_id>", methods=["PUT"])
 def update_bill(bill_id):
     data = request.get_json()
     amount = data.get("amount")
@@ -76,7 +204,7 @@ def update_bill(bill_id):
 
     return jsonify({"message": "Bill updated successfully"}), 200
 
-@bill_bp.route("/<int:bill_id>/pay", methods=["PATCH"])
+@bill_bp.route("/<string:bill_id>/pay", methods=["PATCH"])
 def mark_bill_as_paid(bill_id):
     paid_bill = BillService.mark_bill_as_paid(bill_id)
     if not paid_bill:
@@ -84,7 +212,15 @@ def mark_bill_as_paid(bill_id):
 
     return jsonify({"message": "Bill marked as paid"}), 200
 
-@bill_bp.route("/<int:bill_id>", methods=["DELETE"])
+@bill_bp.route("/<string:bill_id>/restore", methods=["POST"])
+def restore_bill(bill_id):
+    bill = ArchiveService.restore_bill(bill_id)
+    if not bill:
+        return jsonify({"error": "Archived bill not found"}), 404
+
+    return jsonify(format_bill(bill)), 200
+
+@bill_bp.route("/<string:bill_id>", methods=["DELETE"])
 def delete_bill(bill_id):
     deleted_bill = BillService.delete_bill(bill_id)
     if not deleted_bill:
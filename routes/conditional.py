@@ -0,0 +1,38 @@
+#!/usr/bin/env python3
+
+import hashlib
+from datetime import datetime
+from flask import current_app, request
+from werkzeug.http import http_date, is_resource_modified
+
+
+def make_etag(*parts):
+    """Weak ETag for the representation identified by parts"""
+    digest = hashlib.blake2b("\x1f".join(map(str, parts)).encode("utf-8"), digest_size=12).hexdigest()
+    return f'W/"{digest}"'
+
+
+def check_conditional(last_modified, *version):
+    """Return (validator headers, 304 response or None) for the resource at this URL.
+
+    `version` is whatever changes whenever the representation does (e.g.
+    updated_at, or count and max(updated_at) for a collection); the path and
+    query string are added so every page and variant gets its own tag. Call
+    it before loading rows, so a matching If-None-Match or If-Modified-Since
+    costs only the version query.
+
+    Last-Modified has one-second precision, so If-Modified-Since is only
+    trusted for resources last changed before the current second; a change
+    later in the same second would otherwise be answered with a 304.
+    Collections pass last_modified=None and revalidate on the ETag alone,
+    since max(updated_at) does not move when rows leave the table."""
+    etag = make_etag(request.path, request.query_string.decode("latin-1"), *version)
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = http_date(last_modified)
+        if last_modified >= datetime.utcnow().replace(microsecond=0):
+            last_modified = None
+
+    if is_resource_modified(request.environ, etag=etag, last_modified=last_modified):
+        return headers, None
+    return headers, current_app.response_class(status=304, headers=headers)
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+
+
+def parse_id_list(value):
+    """Split a comma-separated ids query argument, dropping blanks"""
+    if not value:
+        return []
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+def parse_fields(value, available):
+    """Read a ?fields= list of names, in the order given; blank selects every available field.
+
+    Raises ValueError naming any field that is not in `available`."""
+    fields = parse_id_list(value)
+    if not fields:
+        return tuple(available)
+    unknown = [name for name in fields if name not in available]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Choose from {', '.join(available)}")
+    return tuple(dict.fromkeys(fields))
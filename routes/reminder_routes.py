@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+from flask import Blueprint, request, jsonify, current_app
+from services.reminder_service import ReminderService, EXPORT_COLUMNS
+from services.archive_service import ArchiveService, ParentBillNotLive
+from routes.streaming import EXPORT_FORMATS, parse_date_range, stream_rows
+from routes.params import parse_fields, parse_id_list
+from routes.sync import changes_response
+
+reminder_bp = Blueprint("reminder_bp", __name__)
+
+
+def format_reminder(reminder):
+    """Helper function to format reminder responses"""
+    return {
+        "id": reminder.id,
+        "bill_id": reminder.bill_id,
+        "user_id": reminder.user_id,
+        "reminder_date": reminder.reminder_date.isoformat(),
+        "notification_method": reminder.notification_method,
+        "message": reminder.message,
+        "delivery_status": reminder.delivery_status
+    }
+
+# Fields of the reminders-by-user list, selectable with ?fields=
+REMINDER_LIST_FIELDS = {
+    "id": lambda reminder: reminder.id,
+    "bill_id": lambda reminder: reminder.bill_id,
+    "reminder_date": lambda reminder: reminder.reminder_date.isoformat(),
+    "notification_method": lambda reminder: reminder.notification_method,
+    "message": lambda reminder: reminder.message,
+}
+
+@reminder_bp.route("/batch", methods=["GET"])
+def get_reminders_batch():
+    reminder_ids = parse_id_list(request.args.get("ids"))
+    if not reminder_ids:
+        return jsonify({"error": "ids is required"}), 400
+
+    max_ids = current_app.config["BATCH_GET_MAX_IDS"]
+    if len(reminder_ids) > max_ids:
+        return jsonify({"error": f"At most {max_ids} ids per request"}), 400
+
+    reminders, missing = ReminderService.get_reminders_by_ids(reminder_ids)
+    return jsonify({"items": [format_reminder(reminder) for reminder in reminders], "missing": missing}), 200
+
+@reminder_bp.route("/user/<string:user_id>", methods=["GET"])
+def get_reminders_by_user(user_id):
+    try:
+        fields = parse_fields(request.args.get("fields"), REMINDER_LIST_FIELDS)
+        reminders, next_cursor = ReminderService.list_reminders_rows(
+            user_id, request.args.get("limit", type=int), request.args.get("cursor"), fields
+        )
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    return jsonify({
+        "items": [{name: REMINDER_LIST_FIELDS[name](reminder) for name in fields} for reminder in reminders],
+        "next_cursor": next_cursor
+    }), 200
+
+@reminder_bp.route("/user/<string:user_id>/changes", methods=["GET"])
+def get_reminder_changes(user_id):
+    return changes_response(ReminderService.get_reminder_changes, user_id, format_reminder)
+
+@reminder_bp.route("/user/<string:user_id>/export", methods=["GET"])
+def export_reminders_by_user(user_id):
+    fmt = request.args.get("format", "ndjson")
+    if fmt not in EXPORT_FORMATS:
+        return jsonify({"error": "format must be ndjson or csv"}), 400
+
+    try:
+        start_date, end_date = parse_date_range(request.args)
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    rows = ReminderService.iter_reminders_for_export(user_id, start_date, end_date)
+    return stream_rows(rows, EXPORT_COLUMNS, fmt, f"reminders-{user_id}")
+
+@reminder_bp.route("/<string:reminder_id>/restore", methods=["POST"])
+def restore_reminder(reminder_id):
+    try:
+        reminder = ArchiveService.restore_reminder(reminder_id)
+    except ParentBillNotLive as e:
+        return jsonify({"error": str(e)}), 409
+    if not reminder:
+        return jsonify({"error": "Archived reminder not found"}), 404
+
+    return jsonify(format_reminder(reminder)), 200
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import csv
+import io
+import json
+from datetime import date, datetime
+from flask import Response, stream_with_context
+
+EXPORT_FORMATS = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def parse_date_range(args):
+    """Read optional from/to (YYYY-MM-DD) query arguments; raise ValueError when malformed"""
+    bounds = []
+    for name in ("from", "to"):
+        value = args.get(name)
+        try:
+            bounds.append(datetime.strptime(value, "%Y-%m-%d").date() if value else None)
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+    return bounds
+
+
+def _to_json_value(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _ndjson_lines(rows, columns):
+    for row in rows:
+        yield json.dumps({column: _to_json_value(value) for column, value in zip(columns, row)}) + "\n"
+
+
+def _csv_lines(rows, columns):
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(columns)
+    for row in rows:
+        writer.writerow(row)
+        # Flush roughly every 64 KiB so memory stays flat
+        if buffer.tell() > 65536:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+def stream_rows(rows, columns, fmt, filename):
+    """Stream an iterable of row tuples as an NDJSON or CSV download"""
+    lines = _csv_lines(rows, columns) if fmt == "csv" else _ndjson_lines(rows, columns)
+    return Response(
+        stream_with_context(lines),
+        mimetype=EXPORT_FORMATS[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}.{fmt}"'}
+    )
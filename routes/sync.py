@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+from flask import current_app, jsonify, request
+from services.pagination import WatermarkExpired
+
+
+def changes_response(get_changes, user_id, format_item):
+    """Serve one page of a user's changes after ?since=, with deleted rows as tombstones.
+
+    `get_changes` is a service method with the changes_page signature; clients
+    keep calling with the returned watermark until has_more is false."""
+    config = current_app.config
+    try:
+        rows, watermark, has_more = get_changes(
+            user_id,
+            request.args.get("since"),
+            request.args.get("limit", type=int),
+            config["SYNC_SETTLE_SECONDS"],
+            config["ARCHIVE_RETENTION_DAYS"],
+        )
+    except WatermarkExpired as e:
+        return jsonify({"error": str(e)}), 410
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    items, deleted = [], []
+    for row in rows:
+        if row.is_deleted:
+            deleted.append({"id": row.id, "deleted_at": row.updated_at.isoformat()})
+        else:
+            items.append(dict(format_item(row), updated_at=row.updated_at.isoformat()))
+    return jsonify({"items": items, "deleted": deleted, "watermark": watermark, "has_more": has_more}), 200
@@ -4,10 +4,21 @@ from flask import request
 from flask_restx import Namespace, Resource, fields
 from flask_jwt_extended import jwt_required, get_jwt_identity
 from services.user_service import UserService  # UserService logic (facade)
+from services.password_hasher import PasswordHasherBusy
+from routes.bill_routes import format_bill
+from routes.reminder_routes import format_reminder
+from routes.conditional import check_conditional
+from routes.params import parse_fields
 
 # User Namespace
 api = Namespace('users', description='User operations')
 
+
+@api.errorhandler(PasswordHasherBusy)
+def handle_hasher_busy(error):
+    """Shed load quickly when the password hashing pool is full"""
+    return {"error": str(error)}, 503, {"Retry-After": "1"}
+
 # User Models
 user_model = api.model('User', {
     'first_name': fields.String(required=True, description='First name'),
@@ -33,12 +44,22 @@ def format_user(user):
     }
 
 
+# Fields of the user list, selectable with ?fields=
+USER_LIST_FIELDS = {
+    "id": lambda user: str(user.id),
+    "first_name": lambda user: user.first_name,
+    "last_name": lambda user: user.last_name,
+    "email": lambda user: user.email,
+}
+
+
 @api.route('/')
 class UserList(Resource):
 
     @api.expect(user_model, validate=True)
     @api.response(201, 'User successfully created')
     @api.response(400, 'Email already registered')
+    @api.response(503, 'Too many concurrent signups')
     def post(self):
         """Create new user"""
         user_data = request.get_json()
@@ -56,25 +77,64 @@ class UserList(Resource):
 class UserResource(Resource):
     @jwt_required()
     @api.response(200, 'User details retrieved successfully')
+    @api.response(304, 'Not modified since the ETag or date the client sent')
     @api.response(404, 'User not found')
     def get(self, user_id):
         """Get user by ID"""
+        updated_at = UserService.get_user_version(user_id)
+        if updated_at is None:
+            return {"error": "User not found"}, 404
+
+        headers, not_modified = check_conditional(updated_at, updated_at)
+        if not_modified:
+            return not_modified
+
         user = UserService.get_user_by_id(user_id)
 
         if not user:
             return {"error": "User not found"}, 404
 
-        return format_user(user), 200
+        return format_user(user), 200, headers
+
+
+@api.route('/<string:user_id>/overview')
+class UserOverview(Resource):
+    @jwt_required()
+    @api.response(200, 'User with active bills and upcoming reminders')
+    @api.response(404, 'User not found')
+    def get(self, user_id):
+        """Get a user with active bills and their upcoming reminders"""
+        user = UserService.get_user_overview(user_id)
+        if not user:
+            return {"error": "User not found"}, 404
+
+        overview = format_user(user)
+        overview["bills"] = [
+            dict(format_bill(bill), reminders=[format_reminder(reminder) for reminder in bill.reminders])
+            for bill in user.bills
+        ]
+        return overview, 200
 
 
 @api.route('/user-list')
 class Users(Resource):
     @jwt_required()
+    @api.doc(params={'limit': 'Page size', 'cursor': 'Cursor returned as next_cursor by the previous page',
+                     'fields': 'Comma-separated fields to return: ' + ', '.join(USER_LIST_FIELDS)})
     @api.response(200, 'List of users retrieved successfully')
+    @api.response(400, 'Invalid cursor or unknown field')
     def get(self):
-        """Get all users"""
-        users = UserService.get_all_users()
-        return [format_user(user) for user in users], 200
+        """Get a page of users"""
+        try:
+            fields = parse_fields(request.args.get('fields'), USER_LIST_FIELDS)
+            users, next_cursor = UserService.list_users_rows(
+                request.args.get('limit', type=int), request.args.get('cursor'), fields
+            )
+        except ValueError as e:
+            return {"error": str(e)}, 400
+
+        items = [{name: USER_LIST_FIELDS[name](user) for name in fields} for user in users]
+        return {"items": items, "next_cursor": next_cursor}, 200
 
 
 @api.route('/update/<string:user_id>')
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import time
+from datetime import datetime, timedelta
+from sqlalchemy import select, delete, func, update
+from database import db
+from models.bill import Bill
+from models.reminder import Reminder
+from models.archive import bills_archive, reminders_archive
+from services.bill_service import _invalidate_summary
+
+ARCHIVE_BATCH_SIZE = 500
+
+
+def _table_sizes():
+    tables = {"bills": Bill.__table__, "reminders": Reminder.__table__,
+              "bills_archive": bills_archive, "reminders_archive": reminders_archive}
+    return {name: db.session.execute(select(func.count()).select_from(table)).scalar()
+            for name, table in tables.items()}
+
+
+def _move(source, target, condition, archived_at=None):
+    """Copy the rows matching condition from source to target, then delete them from source.
+
+    The matching ids are read once (locked where the backend supports it) and
+    both statements use them, so a row that starts matching in between is
+    neither deleted without a copy nor copied twice."""
+    ids = db.session.execute(select(source.c.id).where(condition).with_for_update()).scalars().all()
+    if not ids:
+        return 0
+    columns = [column.name for column in source.columns if column.name != "archived_at"]
+    selected = [source.c[name] for name in columns]
+    if archived_at is not None:
+        columns.append("archived_at")
+        selected.append(db.literal(archived_at, db.DateTime))
+    db.session.execute(target.insert().from_select(columns, select(*selected).where(source.c.id.in_(ids))))
+    return db.session.execute(delete(source).where(source.c.id.in_(ids))).rowcount
+
+
+class ParentBillNotLive(ValueError):
+    """A reminder cannot be restored while its bill is archived or deleted"""
+
+
+class ArchiveService:
+
+    @staticmethod
+    def archive_deleted(retention_days=30, batch_size=ARCHIVE_BATCH_SIZE, pause_seconds=0):
+        """Move soft-deleted rows older than the retention window into the archive tables.
+
+        Deleted bills go together with all of their reminders; deleted reminders
+        of live bills are moved on their own. Every batch is one short
+        transaction, optionally followed by a pause to let other writers in."""
+        started = time.perf_counter()
+        cutoff = datetime.utcnow() - timedelta(days=retention_days)
+        size_before = _table_sizes()
+        bills = reminders = batches = 0
+
+        bills_table, reminders_table = Bill.__table__, Reminder.__table__
+        deleted_bills = (
+            select(bills_table.c.id)
+            .where(bills_table.c.is_deleted == True, bills_table.c.updated_at < cutoff)  # noqa: E712
+            .limit(batch_size)
+        )
+        deleted_reminders = (
+            select(reminders_table.c.id)
+            .where(reminders_table.c.is_deleted == True, reminders_table.c.updated_at < cutoff)  # noqa: E712
+            .limit(batch_size)
+        )
+
+        while True:
+            ids = db.session.execute(deleted_bills).scalars().all()
+            if not ids:
+                break
+            now = datetime.utcnow()
+            reminders += _move(reminders_table, reminders_archive, reminders_table.c.bill_id.in_(ids), now)
+            bills += _move(bills_table, bills_archive, bills_table.c.id.in_(ids), now)
+            db.session.commit()
+            batches += 1
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        while True:
+            ids = db.session.execute(deleted_reminders).scalars().all()
+            if not ids:
+                break
+            reminders += _move(reminders_table, reminders_archive, reminders_table.c.id.in_(ids), datetime.utcnow())
+            db.session.commit()
+            batches += 1
+            if pause_seconds:
+                time.sleep(pause_seconds)
+
+        db.session.expire_all()
+        duration = time.perf_counter() - started
+        moved = bills + reminders
+        return {
+            "bills": bills,
+            "reminders": reminders,
+            "batches": batches,
+            "duration_seconds": duration,
+            "rows_per_second": moved / duration if duration else 0.0,
+            "size_before": size_before,
+            "size_after": _table_sizes(),
+        }
+
+    @staticmethod
+    def restore_bill(bill_id):
+        """Move an archived bill and its archived reminders back and undo the bill's deletion"""
+        moved = _move(bills_archive, Bill.__table__, bills_archive.c.id == bill_id)
+        if not moved:
+            return None
+
+        _move(reminders_archive, Reminder.__table__, reminders_archive.c.bill_id == bill_id)
+        db.session.execute(update(Bill).where(Bill.id == bill_id).values(is_deleted=False))
+        # the reminders come back with their old updated_at; stamp them so delta sync sends them again
+        db.session.execute(update(Reminder).where(Reminder.bill_id == bill_id).values(updated_at=datetime.utcnow()))
+        db.session.commit()
+        bill = db.session.get(Bill, bill_id)
+        _invalidate_summary(bill.user_id)
+        return bill
+
+    @staticmethod
+    def restore_reminder(reminder_id):
+        """Move an archived reminder back and undo its deletion.
+
+        Raises ParentBillNotLive unless its bill is in the live table and not
+        deleted; restore the bill first (which brings its reminders along)."""
+        bill_id = db.session.execute(
+            select(reminders_archive.c.bill_id).where(reminders_archive.c.id == reminder_id)
+        ).scalar()
+        if bill_id is None:
+            return None
+        bill = db.session.get(Bill, bill_id)
+        if bill is None or bill.is_deleted:
+            raise ParentBillNotLive("The reminder's bill is archived or deleted; restore the bill first")
+
+        moved = _move(reminders_archive, Reminder.__table__, reminders_archive.c.id == reminder_id)
+        if not moved:
+            return None
+
+        db.session.execute(update(Reminder).where(Reminder.id == reminder_id).values(is_deleted=False))
+        db.session.commit()
+        return db.session.get(Reminder, reminder_id)
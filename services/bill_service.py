@@ -1,8 +1,112 @@
 #!/usr/bin/env python3
 
+import math
 from models.bill import Bill
-from database import db
-from datetime import datetime
+from models.ids import uuid7
+from database import db, commit
+from datetime import datetime, date, timedelta
+from itertools import islice
+from time import perf_counter
+from sqlalchemy import event, select, update, func, case
+from sqlalchemy.orm import Session
+from services.cache import AppCache
+from services.conditional_update import conditional_update
+from services.multi_get import get_many
+from services.pagination import changes_page, keyset_page, keyset_rows, DEFAULT_PAGE_SIZE
+
+BULK_CHUNK_SIZE = 1000
+OVERDUE_SWEEP_CHUNK_SIZE = 5000
+EXPORT_BATCH_SIZE = 1000
+LIST_COLUMNS = ("id", "amount", "due_date", "status", "description")
+EXPORT_COLUMNS = ("id", "user_id", "amount", "due_date", "status", "minimum_payment",
+                  "description", "created_at", "updated_at", "is_deleted")
+
+# Per-user dashboard summaries, keyed by (user_id, day) since they depend on today's date;
+# sized from BILL_SUMMARY_CACHE_* by init_app
+summary_cache = AppCache("BILL_SUMMARY_CACHE")
+_TOUCHED = "summary_cache_keys"
+
+
+def _invalidate_summary(*user_ids):
+    """Drop the users' summaries now, and again when the transaction ends.
+
+    Inside unit_of_work() commit() only flushes, so a summary read later in
+    the same block holds uncommitted totals; the commit/rollback drop
+    removes it."""
+    today = date.today().isoformat()
+    keys = {(str(user_id), today) for user_id in user_ids}
+    for key in keys:
+        summary_cache.delete(key)
+    db.session.info.setdefault(_TOUCHED, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_touched_summaries(session):
+    for key in session.info.pop(_TOUCHED, ()):
+        summary_cache.delete(key)
+
+
+def _restamp(id_chunks):
+    """Move updated_at of bills written earlier in this transaction to now"""
+    bills = Bill.__table__
+    now = datetime.utcnow()
+    for ids in id_chunks:
+        db.session.execute(update(bills).where(bills.c.id.in_(ids)).values(updated_at=now))
+
+
+def _parse_bill_row(row, default_user_id=None):
+    """Validate one imported row and return the column values for a bill insert"""
+    if not isinstance(row, dict):
+        raise ValueError("Invalid row")
+
+    user_id = row.get("user_id") or default_user_id
+    amount = row.get("amount")
+    due_date = row.get("due_date")
+
+    if not user_id or amount in (None, "") or not due_date:
+        raise ValueError("User ID, amount, and due date are required")
+    if not isinstance(user_id, str):
+        raise ValueError("Invalid user ID")
+
+    try:
+        amount = float(amount)
+    except (TypeError, ValueError):
+        raise ValueError("Invalid amount")
+    # float() accepts "nan", "inf" and overflows like "1e400"
+    if not math.isfinite(amount):
+        raise ValueError("Invalid amount")
+
+    # date objects come from Python callers; decoded CSV/NDJSON only ever yields strings here
+    if isinstance(due_date, datetime):
+        due_date = due_date.date()
+    elif not isinstance(due_date, date):
+        if not isinstance(due_date, str):
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+        try:
+            due_date = datetime.strptime(due_date, "%Y-%m-%d").date()
+        except ValueError:
+            raise ValueError("Invalid date format. Use YYYY-MM-DD")
+
+    minimum_payment = row.get("minimum_payment")
+    if minimum_payment in (None, ""):
+        minimum_payment = None
+    else:
+        try:
+            minimum_payment = float(minimum_payment)
+        except (TypeError, ValueError):
+            raise ValueError("Invalid minimum payment")
+        if not math.isfinite(minimum_payment):
+            raise ValueError("Invalid minimum payment")
+
+    return {
+        "user_id": user_id,
+        "amount": amount,
+        "due_date": due_date,
+        "description": row.get("description") or None,
+        "minimum_payment": minimum_payment,
+    }
+
 
 class BillService:
     
@@ -20,23 +124,174 @@ class BillService:
             minimum_payment=minimum_payment
         )
         new_bill.save()
+        _invalidate_summary(user_id)
         return new_bill
     
+    @staticmethod
+    def create_bills_bulk(rows, user_id=None, chunk_size=BULK_CHUNK_SIZE, commit_per_chunk=False):
+        """Insert many bills with batched executemany.
+
+        Rows are validated and inserted chunk by chunk. By default the whole
+        import is a single transaction; with commit_per_chunk every chunk is
+        committed on its own. A single transaction re-stamps updated_at on
+        its earlier chunks just before commit, so delta sync (changes_page)
+        does not see rows that commit long after the time they carry.
+        Returns the created count and per-row errors (1-based row numbers)."""
+        created = 0
+        errors = []
+        row_number = 0
+        user_ids = set()
+        pending_ids = []  # one list per chunk not yet committed
+        rows = iter(rows)
+
+        try:
+            while True:
+                chunk = list(islice(rows, chunk_size))
+                if not chunk:
+                    break
+
+                values = []
+                for row in chunk:
+                    row_number += 1
+                    try:
+                        values.append(_parse_bill_row(row, user_id))
+                    except ValueError as e:
+                        errors.append({"row": row_number, "error": str(e)})
+
+                if values:
+                    for value in values:
+                        value["id"] = uuid7()
+                    db.session.execute(Bill.__table__.insert(), values)
+                    created += len(values)
+                    user_ids.update(v["user_id"] for v in values)
+                    pending_ids.append([v["id"] for v in values])
+
+                if commit_per_chunk:
+                    commit()
+                    pending_ids.clear()
+
+            # the last chunk was stamped moments ago
+            if len(pending_ids) > 1:
+                _restamp(pending_ids[:-1])
+            commit()
+        except Exception:
+            db.session.rollback()
+            raise
+        finally:
+            _invalidate_summary(*user_ids)
+
+        return {"created": created, "errors": errors}
+
     @staticmethod
     def get_bill_by_id(bill_id):
         return db.session.get(Bill, bill_id)
+
+    @staticmethod
+    def get_bill_version(bill_id):
+        """Return the bill's updated_at, or None if there is no such bill, without loading the row"""
+        return db.session.execute(select(Bill.updated_at).where(Bill.id == bill_id)).scalar()
+
+    @staticmethod
+    def get_user_bills_version(user_id):
+        """Return (count, latest updated_at) of a user's bills, read from the (user_id, updated_at) index alone"""
+        return tuple(db.session.execute(
+            select(func.count(), func.max(Bill.updated_at)).where(Bill.user_id == user_id)
+        ).one())
     
+    @staticmethod
+    def get_bills_by_ids(bill_ids):
+        """Return (bills in the requested order, ids not found) using chunked IN queries"""
+        return get_many(Bill, bill_ids)
+
     @staticmethod
     def get_bills_by_user(user_id):
         return Bill.query.filter_by(user_id=user_id).all()
+
+    @staticmethod
+    def iter_bills_for_export(user_id, start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield every bill of a user (deleted ones included) as rows, fetched batch_size at a time"""
+        query = select(*(getattr(Bill, column) for column in EXPORT_COLUMNS)).where(Bill.user_id == user_id)
+        if start_date:
+            query = query.where(Bill.due_date >= start_date)
+        if end_date:
+            query = query.where(Bill.due_date <= end_date)
+        query = query.order_by(Bill.due_date, Bill.id).execution_options(yield_per=batch_size)
+
+        yield from db.session.execute(query)
+
+    @staticmethod
+    def get_bills_page_by_user(user_id, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """Return a page of a user's bills and the cursor for the next one"""
+        return keyset_page(Bill.query.filter_by(user_id=user_id), Bill, limit, cursor)
+
+    @staticmethod
+    def list_bills_rows(user_id, limit=DEFAULT_PAGE_SIZE, cursor=None, columns=LIST_COLUMNS):
+        """Read-only page of a user's bills as plain rows of `columns`, and the next cursor.
+
+        Same order and cursors as get_bills_page_by_user, without building Bill objects."""
+        bills = Bill.__table__
+        return keyset_rows(bills, columns, bills.c.user_id == user_id, limit=limit, cursor=cursor)
+
+    @staticmethod
+    def get_bill_changes(user_id, since=None, limit=DEFAULT_PAGE_SIZE, settle_seconds=0, retention_days=None):
+        """Return a user's bills changed after the `since` watermark, deleted ones included.
+
+        Returns (bills, watermark, has_more); see pagination.changes_page."""
+        return changes_page(Bill.query.filter_by(user_id=user_id), Bill, limit, since,
+                            settle_seconds, retention_days)
     
+    @staticmethod
+    def get_summary(user_id):
+        """Dashboard totals for a user's unpaid bills, computed in one aggregate query and cached"""
+        today = date.today()
+        key = (str(user_id), today.isoformat())
+        summary = summary_cache.get(key)
+        if summary is not None:
+            return dict(summary)
+
+        def unpaid_amount(*conditions):
+            return func.coalesce(func.sum(case((db.and_(*conditions), Bill.amount), else_=0)), 0)
+
+        row = db.session.execute(
+            select(
+                func.coalesce(func.sum(Bill.amount), 0),
+                func.count(case((Bill.due_date < today, 1))),
+                unpaid_amount(Bill.due_date >= today, Bill.due_date <= today + timedelta(days=7)),
+                unpaid_amount(Bill.due_date >= today, Bill.due_date <= today + timedelta(days=30)),
+                func.min(case((Bill.due_date >= today, Bill.due_date))),
+            ).where(
+                Bill.user_id == user_id,
+                Bill.is_deleted == False,  # noqa: E712
+                Bill.status != "paid",
+            )
+        ).one()
+
+        next_due_date = row[4]
+        if isinstance(next_due_date, str):
+            next_due_date = date.fromisoformat(next_due_date)
+
+        summary = {
+            "total_outstanding": round(row[0], 2),
+            "overdue_count": row[1],
+            "due_next_7_days": round(row[2], 2),
+            "due_next_30_days": round(row[3], 2),
+            "next_due_date": next_due_date.isoformat() if next_due_date else None,
+        }
+        summary_cache.set(key, summary)
+        return dict(summary)
+
     @staticmethod
     def mark_bill_as_paid(bill_id):
-        bill = db.session.get(Bill, bill_id)
-        if not bill:
-            return None
-        
-        bill.mark_as_paid()
+        """Pay a live bill with one conditional UPDATE; paying it again returns the paid bill"""
+        bill = conditional_update(Bill, bill_id, {"status": "paid"},
+                                  Bill.is_deleted == False, Bill.status != "paid")  # noqa: E712
+        if bill is None:
+            bill = db.session.get(Bill, bill_id, populate_existing=True)
+            return bill if bill is not None and not bill.is_deleted else None
+
+        user_id = bill.user_id
+        commit()
+        _invalidate_summary(user_id)
         return bill
     
     @staticmethod
@@ -47,32 +302,80 @@ class BillService:
         
         return bill.is_overdue()
     
+    @staticmethod
+    def sweep_overdue(chunk_size=OVERDUE_SWEEP_CHUNK_SIZE, today=None):
+        """Move every unpaid bill past its due date to "overdue" with set-based UPDATEs.
+
+        Works in chunks of at most chunk_size rows, each committed on its own
+        so locks stay short. Bills that are already overdue are skipped, so
+        running it again changes nothing."""
+        started = perf_counter()
+        today = today or date.today()
+        updated = chunks = 0
+
+        candidates = (
+            select(Bill.id)
+            .where(Bill.is_deleted == False,  # noqa: E712
+                   Bill.status != "paid",
+                   Bill.status != "overdue",
+                   Bill.due_date < today)
+            .limit(chunk_size)
+        )
+
+        while True:
+            result = db.session.execute(
+                update(Bill)
+                .where(Bill.id.in_(candidates.scalar_subquery()))
+                .values(status="overdue")
+                .execution_options(synchronize_session=False)
+            )
+            commit()
+            if not result.rowcount:
+                break
+            updated += result.rowcount
+            chunks += 1
+
+        return {"updated": updated, "chunks": chunks, "duration_seconds": perf_counter() - started}
+
     @staticmethod
     def update_bill(bill_id, amount=None, due_date=None, description=None, minimum_payment=None):
-        bill = db.session.get(Bill, bill_id)
-        if not bill:
-            return None
-        
+        """Update a live bill with one conditional UPDATE; None if there is no such bill"""
+        values = {}
         if amount is not None:
-            bill.amount = amount
+            values["amount"] = amount
             
         if due_date is not None:
-            bill.due_date = due_date
+            values["due_date"] = due_date
+            if due_date >= date.today():
+                values["status"] = case((Bill.status == "overdue", "pending"), else_=Bill.status)
             
         if description is not None:
-            bill.description = description
+            values["description"] = description
         
         if minimum_payment is not None:
-            bill.minimum_payment = minimum_payment
-            
-        db.session.commit()
+            values["minimum_payment"] = minimum_payment
+
+        if not values:
+            bill = db.session.get(Bill, bill_id)
+            return bill if bill is not None and not bill.is_deleted else None
+
+        bill = conditional_update(Bill, bill_id, values, Bill.is_deleted == False)  # noqa: E712
+        if bill is None:
+            return None
+
+        user_id = bill.user_id
+        commit()
+        _invalidate_summary(user_id)
         return bill
     
     @staticmethod
     def delete_bill(bill_id):
-        bill = db.session.get(Bill, bill_id)
-        if not bill:
-            return None
-        
-        bill.soft_delete()
+        """Soft-delete with one conditional UPDATE; deleting again returns the deleted bill"""
+        bill = conditional_update(Bill, bill_id, {"is_deleted": True}, Bill.is_deleted == False)  # noqa: E712
+        if bill is None:
+            return db.session.get(Bill, bill_id, populate_existing=True)
+
+        user_id = bill.user_id
+        commit()
+        _invalidate_summary(user_id)
         return bill
\ No newline at end of file
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+
+import pickle
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class CacheBackend(ABC):
+    """Key/value store used by the service caches"""
+
+    # True when entries leave the process (a file or network store)
+    shared = False
+
+    @abstractmethod
+    def get(self, key, default=None):
+        """Return the cached value or default"""
+
+    @abstractmethod
+    def set(self, key, value):
+        """Store a value, evicting old entries as needed"""
+
+    @abstractmethod
+    def delete(self, key):
+        """Drop a key if present"""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every entry and reset the counters"""
+
+    @abstractmethod
+    def stats(self):
+        """Return {"size", "hits", "misses"}"""
+
+
+class LRUCache(CacheBackend):
+    """Thread-safe in-process cache with LRU eviction and an optional TTL (seconds)"""
+
+    def __init__(self, maxsize=1024, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._data[key]
+            self.misses += 1
+            return default
+
+    def set(self, key, value):
+        expires_at = time.monotonic() + self.ttl if self.ttl else None
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        with self._lock:
+            return {"size": len(self._data), "hits": self.hits, "misses": self.misses}
+
+
+class SQLiteCache(CacheBackend):
+    """Cache stored in a local SQLite file so several worker processes share it.
+
+    A stand-in for a network cache such as Redis. Entries are pickled, so only
+    point it at a file the application owns. Hit/miss counters are per process."""
+
+    shared = True
+
+    def __init__(self, path, maxsize=100000, ttl=None):
+        self.path = path
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value BLOB, expires_at REAL, stored_at REAL)"
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _count(self, hit):
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+    def get(self, key, default=None):
+        row = self._connect().execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (repr(key),)
+        ).fetchone()
+        if row is None or (row[1] is not None and row[1] <= time.time()):
+            self._count(False)
+            return default
+        self._count(True)
+        return pickle.loads(row[0])
+
+    def set(self, key, value):
+        now = time.time()
+        expires_at = now + self.ttl if self.ttl else None
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at, stored_at) VALUES (?, ?, ?, ?)",
+            (repr(key), pickle.dumps(value), expires_at, now)
+        )
+        with self._lock:
+            self._writes += 1
+            trim = self._writes % 1000 == 0
+        if trim:
+            conn.execute("DELETE FROM cache WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY stored_at DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,)
+            )
+
+    def delete(self, key):
+        self._connect().execute("DELETE FROM cache WHERE key = ?", (repr(key),))
+
+    def clear(self):
+        self._connect().execute("DELETE FROM cache")
+        with self._lock:
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self):
+        size = self._connect().execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        with self._lock:
+            return {"size": size, "hits": self.hits, "misses": self.misses}
+
+
+def make_cache(backend="memory", maxsize=1024, ttl=None, path=None):
+    """Build a cache backend by name: "memory" (per process) or "sqlite" (shared file)"""
+    if backend == "memory":
+        return LRUCache(maxsize=maxsize, ttl=ttl)
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("A file path is required for the sqlite cache backend")
+        return SQLiteCache(path, maxsize=maxsize, ttl=ttl)
+    raise ValueError(f"Unknown cache backend: {backend}")
+
+
+class AppCache(CacheBackend):
+    """A cache whose backend is built from app config by init_app.
+
+    Services import the instance at module level; init_app swaps in the
+    backend named by <prefix>_BACKEND, <prefix>_SIZE, <prefix>_TTL and
+    <prefix>_PATH (backend and path are optional). Until then it is an
+    in-process LRU with the given defaults."""
+
+    def __init__(self, config_prefix, maxsize=1024, ttl=None):
+        self.config_prefix = config_prefix
+        self.backend = LRUCache(maxsize=maxsize, ttl=ttl)
+
+    def init_app(self, app):
+        config, prefix = app.config, self.config_prefix
+        self.backend = make_cache(config.get(f"{prefix}_BACKEND", "memory"), config[f"{prefix}_SIZE"],
+                                  config[f"{prefix}_TTL"], config.get(f"{prefix}_PATH"))
+
+    @property
+    def shared(self):
+        return self.backend.shared
+
+    def get(self, key, default=None):
+        return self.backend.get(key, default)
+
+    def set(self, key, value):
+        self.backend.set(key, value)
+
+    def delete(self, key):
+        self.backend.delete(key)
+
+    def clear(self):
+        self.backend.clear()
+
+    def stats(self):
+        return self.backend.stats()
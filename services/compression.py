@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import gzip
+import zlib
+from flask import request
+
+COMPRESSIBLE_MIMETYPES = ("application/json", "application/x-ndjson", "text/csv", "text/plain", "text/html")
+ENCODINGS = ("gzip", "deflate")
+
+
+def compress(data, encoding, level=6):
+    """Encode a body for the given Content-Encoding"""
+    if encoding == "gzip":
+        return gzip.compress(data, compresslevel=level, mtime=0)
+    if encoding == "deflate":
+        # HTTP "deflate" is the zlib format, not raw deflate
+        return zlib.compress(data, level)
+    raise ValueError(f"Unsupported encoding: {encoding}")
+
+
+class ResponseCompression:
+    """gzip/deflate response bodies negotiated from Accept-Encoding.
+
+    Only buffered bodies of a text mimetype and at least `min_size` bytes are
+    compressed; below that the framing costs more than it saves. Streamed
+    responses (the exports) are left alone so they keep streaming. Every
+    compressible response gets Vary: Accept-Encoding so shared caches keep
+    the variants apart."""
+
+    def __init__(self, app=None):
+        self.min_size = 1024
+        self.level = 6
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.min_size = app.config["COMPRESSION_MIN_SIZE"]
+        self.level = app.config["COMPRESSION_LEVEL"]
+        app.extensions["compression"] = self
+        app.after_request(self._after_request)
+
+    def _after_request(self, response):
+        if response.mimetype not in COMPRESSIBLE_MIMETYPES:
+            return response
+        response.vary.add("Accept-Encoding")
+        if (response.direct_passthrough or response.is_streamed or "Content-Encoding" in response.headers
+                or not 200 <= response.status_code < 300 or response.status_code == 204):
+            return response
+
+        encoding = request.accept_encodings.best_match(ENCODINGS)
+        if encoding is None:
+            return response
+        data = response.get_data()
+        if len(data) < self.min_size:
+            return response
+
+        response.set_data(compress(data, encoding, self.level))
+        response.headers["Content-Encoding"] = encoding
+        return response
@@ -0,0 +1,26 @@
+#!/usr/bin/env python3
+
+from sqlalchemy import update
+from database import db
+
+
+def conditional_update(model, row_id, values, *conditions):
+    """UPDATE the row with this id if `conditions` still hold; return it or None.
+
+    One statement does the check and the write, so concurrent callers cannot
+    both succeed. With RETURNING (SQLite 3.35+, PostgreSQL) the new row is
+    loaded into the session by the UPDATE itself; otherwise rowcount decides
+    and the row is read back by id."""
+    statement = (
+        update(model)
+        .where(model.id == row_id, *conditions)
+        .values(**values)
+        .execution_options(synchronize_session=False)
+    )
+    if db.session.get_bind().dialect.update_returning:
+        statement = statement.returning(model).execution_options(populate_existing=True)
+        return db.session.execute(statement).scalars().one_or_none()
+
+    if db.session.execute(statement).rowcount != 1:
+        return None
+    return db.session.get(model, row_id, populate_existing=True)
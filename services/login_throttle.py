@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+
+import math
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+
+
+class LoginThrottled(Exception):
+    """Raised when a login attempt is over the per-IP or per-email rate"""
+
+    def __init__(self, retry_after):
+        super().__init__("Too many login attempts, try again later")
+        self.retry_after = retry_after
+
+
+class BucketStore(ABC):
+    """Token buckets keyed by string; take() is atomic per key"""
+
+    @abstractmethod
+    def take(self, key, capacity, rate, now):
+        """Spend one token; return 0 when allowed, else seconds until one is available"""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every bucket"""
+
+
+def _refill(tokens, updated, capacity, rate, now):
+    return min(capacity, tokens + (now - updated) * rate)
+
+
+def _spend(tokens, rate):
+    """(tokens left, retry_after) after trying to spend one token"""
+    if tokens >= 1:
+        return tokens - 1, 0
+    return tokens, (1 - tokens) / rate
+
+
+class MemoryBucketStore(BucketStore):
+    """In-process buckets, at most maxsize keys; the least recently used key is evicted"""
+
+    def __init__(self, maxsize=100000):
+        self.maxsize = maxsize
+        self._buckets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key, capacity, rate, now):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            tokens = capacity if bucket is None else _refill(bucket[0], bucket[1], capacity, rate, now)
+            tokens, retry_after = _spend(tokens, rate)
+            self._buckets[key] = (tokens, now)
+            self._buckets.move_to_end(key)
+            if len(self._buckets) > self.maxsize:
+                self._buckets.popitem(last=False)
+            return retry_after
+
+    def clear(self):
+        with self._lock:
+            self._buckets.clear()
+
+    def __len__(self):
+        return len(self._buckets)
+
+
+class SQLiteBucketStore(BucketStore):
+    """Buckets in a local SQLite file shared by several worker processes.
+
+    A stand-in for a network store such as Redis; each take() is one
+    BEGIN IMMEDIATE transaction so concurrent processes never double-spend."""
+
+    def __init__(self, path, maxsize=100000):
+        self.path = path
+        self.maxsize = maxsize
+        self._writes = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connect().execute(
+            "CREATE TABLE IF NOT EXISTS buckets (key TEXT PRIMARY KEY, tokens REAL, updated REAL)"
+        )
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self, key, capacity, rate, now):
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute("SELECT tokens, updated FROM buckets WHERE key = ?", (key,)).fetchone()
+            tokens = capacity if row is None else _refill(row[0], row[1], capacity, rate, now)
+            tokens, retry_after = _spend(tokens, rate)
+            conn.execute("INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)", (key, tokens, now))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self._writes += 1
+            trim = self._writes % 1000 == 0
+        if trim:
+            conn.execute(
+                "DELETE FROM buckets WHERE key IN (SELECT key FROM buckets ORDER BY updated DESC LIMIT -1 OFFSET ?)",
+                (self.maxsize,)
+            )
+        return retry_after
+
+    def clear(self):
+        self._connect().execute("DELETE FROM buckets")
+
+
+def make_bucket_store(backend="memory", maxsize=100000, path=None):
+    """Build a bucket store by name: "memory" (per process) or "sqlite" (shared file)"""
+    if backend == "memory":
+        return MemoryBucketStore(maxsize=maxsize)
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("A file path is required for the sqlite bucket store")
+        return SQLiteBucketStore(path, maxsize=maxsize)
+    raise ValueError(f"Unknown bucket store: {backend}")
+
+
+class LoginThrottle:
+    """Per-IP and per-email token buckets checked before any login work.
+
+    An attempt first spends a token from its IP's bucket, then from the
+    email's bucket; either being empty rejects it with LoginThrottled, before
+    the user lookup or bcrypt run. Buckets refill continuously at
+    `per_minute` tokens a minute up to `burst`. The IP is request.remote_addr,
+    which is the proxy's address unless PROXY_FIX_X_FOR trusts its
+    X-Forwarded-For header."""
+
+    OUTCOMES = ("admitted", "rejected_ip", "rejected_email")
+
+    def __init__(self, store=None, ip_burst=20, ip_per_minute=20, email_burst=5, email_per_minute=5, enabled=True):
+        self.store = store or MemoryBucketStore()
+        self.enabled = enabled
+        self.ip_limit = (ip_burst, ip_per_minute / 60)
+        self.email_limit = (email_burst, email_per_minute / 60)
+        self._lock = threading.Lock()
+        self._counts = dict.fromkeys(self.OUTCOMES, 0)
+
+    def init_app(self, app):
+        config = app.config
+        self.enabled = config["LOGIN_THROTTLE_ENABLED"]
+        self.store = make_bucket_store(config["LOGIN_THROTTLE_BACKEND"], config["LOGIN_THROTTLE_MAX_KEYS"],
+                                       config["LOGIN_THROTTLE_PATH"])
+        self.ip_limit = (config["LOGIN_IP_BURST"], config["LOGIN_IP_PER_MINUTE"] / 60)
+        self.email_limit = (config["LOGIN_EMAIL_BURST"], config["LOGIN_EMAIL_PER_MINUTE"] / 60)
+        with self._lock:
+            self._counts = dict.fromkeys(self.OUTCOMES, 0)
+        metrics = app.extensions.get("metrics")
+        if metrics is not None:
+            metrics.add_collector(self.render_metrics)
+
+    def _count(self, outcome):
+        with self._lock:
+            self._counts[outcome] += 1
+
+    def check(self, ip, email):
+        """Admit the attempt or raise LoginThrottled with a Retry-After in seconds"""
+        if not self.enabled:
+            return
+        now = time.time()
+        retry_after = self.store.take(f"ip:{ip}", *self.ip_limit, now)
+        if retry_after:
+            self._count("rejected_ip")
+            raise LoginThrottled(math.ceil(retry_after))
+        retry_after = self.store.take(f"email:{(email or '').strip().lower()}", *self.email_limit, now)
+        if retry_after:
+            self._count("rejected_email")
+            raise LoginThrottled(math.ceil(retry_after))
+        self._count("admitted")
+
+    def stats(self):
+        with self._lock:
+            return dict(self._counts)
+
+    def render_metrics(self):
+        lines = [
+            "# HELP billmap_login_attempts_total Login attempts by throttle outcome.",
+            "# TYPE billmap_login_attempts_total counter",
+        ]
+        for outcome, count in self.stats().items():
+            lines.append(f'billmap_login_attempts_total{{outcome="{outcome}"}} {count}')
+        return lines
+
+
+login_throttle = LoginThrottle()
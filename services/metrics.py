@@ -0,0 +1,213 @@
+#!/usr/bin/env python3
+
+import hmac
+import threading
+from bisect import bisect_left
+from collections import defaultdict
+from contextvars import ContextVar
+from time import perf_counter
+from flask import Response, g, jsonify, request
+from sqlalchemy import event
+from database import db
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+STATEMENT_BUCKETS = (0, 1, 2, 5, 10, 25, 50, 100)
+
+# [statements, sql seconds, start of the running statement] for the current request
+_request_sql = ContextVar("request_sql", default=None)
+
+
+class Histogram:
+    """Fixed-bucket histogram; counts are per bucket and made cumulative on render"""
+
+    __slots__ = ("buckets", "counts", "sum", "count")
+
+    def __init__(self, buckets):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def copy(self):
+        other = Histogram(self.buckets)
+        other.counts = list(self.counts)
+        other.sum = self.sum
+        other.count = self.count
+        return other
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_sql.get()
+    if stats is not None:
+        stats[2] = perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    stats = _request_sql.get()
+    if stats is not None:
+        stats[0] += 1
+        stats[1] += perf_counter() - stats[2]
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n")
+
+
+def _labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_bound(bound):
+    return "+Inf" if bound is None else repr(float(bound))
+
+
+class RequestMetrics:
+    """Per-route request metrics exposed at /metrics in Prometheus text format.
+
+    Records latency and SQL statements per request (histograms), SQL time and
+    status counts (counters) and requests in flight (gauge). SQL is counted
+    with engine cursor events that only touch a context variable, and shared
+    state is updated once per request under a single lock. A request is
+    recorded when its response is closed, so streamed exports are measured
+    to the last byte. With ADMIN_TOKEN set, /metrics requires it in
+    X-Admin-Token."""
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.requests = defaultdict(int)
+        self.sql_seconds = defaultdict(float)
+        self.latency = {}
+        self.statements = {}
+        self._collectors = []
+        self.admin_token = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        self.admin_token = app.config.get("ADMIN_TOKEN")
+        app.extensions["metrics"] = self
+        app.before_request(self._before_request)
+        app.after_request(self._after_request)
+        app.teardown_request(self._teardown_request)
+        app.add_url_rule("/metrics", "metrics", self._metrics_view, methods=["GET"])
+        with app.app_context():
+            event.listen(db.engine, "before_cursor_execute", _before_cursor_execute)
+            event.listen(db.engine, "after_cursor_execute", _after_cursor_execute)
+
+    def add_collector(self, collector):
+        """Register a callable returning extra exposition lines for /metrics"""
+        self._collectors.append(collector)
+
+    def _before_request(self):
+        g._metrics_token = _request_sql.set([0, 0.0, 0.0])
+        g._metrics_started = perf_counter()
+        with self._lock:
+            self.in_flight += 1
+
+    def _after_request(self, response):
+        started = g.pop("_metrics_started", None)
+        if started is None:
+            return response
+        # teardown runs before a streamed body is generated, so the statement
+        # counter stays installed until the response is closed
+        token = g.pop("_metrics_token")
+        sql = _request_sql.get()
+        method = request.method
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        status = response.status_code
+
+        def record():
+            try:
+                _request_sql.reset(token)
+            except ValueError:  # closed from another context
+                pass
+            self.observe(method, route, status, perf_counter() - started, *sql[:2])
+            with self._lock:
+                self.in_flight -= 1
+
+        response.call_on_close(record)
+        return response
+
+    def _teardown_request(self, exc):
+        # only requests that never produced a response are left to close here
+        token = g.pop("_metrics_token", None)
+        if token is not None:
+            _request_sql.reset(token)
+            with self._lock:
+                self.in_flight -= 1
+
+    def observe(self, method, route, status, seconds, statements=0, sql_seconds=0.0):
+        key = (method, route)
+        with self._lock:
+            self.requests[(method, route, status)] += 1
+            self.sql_seconds[key] += sql_seconds
+            latency = self.latency.get(key)
+            if latency is None:
+                latency = self.latency[key] = Histogram(LATENCY_BUCKETS)
+                self.statements[key] = Histogram(STATEMENT_BUCKETS)
+            latency.observe(seconds)
+            self.statements[key].observe(statements)
+
+    def _snapshot(self):
+        with self._lock:
+            return (self.in_flight, dict(self.requests), dict(self.sql_seconds),
+                    {key: h.copy() for key, h in self.latency.items()},
+                    {key: h.copy() for key, h in self.statements.items()})
+
+    def render(self):
+        """Return every metric in the Prometheus text exposition format"""
+        in_flight, requests, sql_seconds, latency, statements = self._snapshot()
+        route = ("method", "route")
+        lines = [
+            "# HELP billmap_http_requests_in_flight Requests currently being served.",
+            "# TYPE billmap_http_requests_in_flight gauge",
+            f"billmap_http_requests_in_flight {in_flight}",
+            "# HELP billmap_http_requests_total Requests served, by route and status.",
+            "# TYPE billmap_http_requests_total counter",
+        ]
+        for key, count in sorted(requests.items()):
+            lines.append(f"billmap_http_requests_total{_labels(('method', 'route', 'status'), key)} {count}")
+
+        lines += self._render_histograms(
+            "billmap_http_request_duration_seconds", "Request latency in seconds.", latency, route)
+        lines += self._render_histograms(
+            "billmap_db_statements_per_request", "SQL statements executed per request.", statements, route)
+
+        lines += [
+            "# HELP billmap_db_seconds_total Time spent executing SQL, by route.",
+            "# TYPE billmap_db_seconds_total counter",
+        ]
+        for key, seconds in sorted(sql_seconds.items()):
+            lines.append(f"billmap_db_seconds_total{_labels(route, key)} {seconds!r}")
+        for collector in self._collectors:
+            lines += collector()
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histograms(name, help_text, histograms, label_names):
+        lines = [f"# HELP {name} {help_text}", f"# TYPE {name} histogram"]
+        for key, histogram in sorted(histograms.items()):
+            cumulative = 0
+            for bound, count in zip(histogram.buckets + (None,), histogram.counts):
+                cumulative += count
+                le = 'le="' + _format_bound(bound) + '"'
+                lines.append(f"{name}_bucket{_labels(label_names, key, le)} {cumulative}")
+            lines.append(f"{name}_sum{_labels(label_names, key)} {histogram.sum!r}")
+            lines.append(f"{name}_count{_labels(label_names, key)} {histogram.count}")
+        return lines
+
+    def _metrics_view(self):
+        if self.admin_token:
+            supplied = request.headers.get("X-Admin-Token", "")
+            if not hmac.compare_digest(supplied, self.admin_token):
+                return jsonify({"error": "Admin token required"}), 403
+        return Response(self.render(), mimetype="text/plain; version=0.0.4")
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+
+from database import db
+
+# Stay under SQLite's historical 999 bound-parameter limit
+IN_CHUNK_SIZE = 900
+
+
+def get_many(model, ids, chunk_size=None):
+    """Fetch rows by primary key with chunked IN queries.
+
+    Returns (found, missing): found follows the order of ids (duplicates
+    dropped), and missing lists the ids that matched no row."""
+    chunk_size = chunk_size or IN_CHUNK_SIZE
+    ids = list(dict.fromkeys(ids))
+    by_id = {}
+    for start in range(0, len(ids), chunk_size):
+        chunk = ids[start:start + chunk_size]
+        for record in db.session.execute(db.select(model).where(model.id.in_(chunk))).scalars():
+            by_id[record.id] = record
+
+    found = [by_id[record_id] for record_id in ids if record_id in by_id]
+    missing = [record_id for record_id in ids if record_id not in by_id]
+    return found, missing
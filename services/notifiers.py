@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import json
+import logging
+import smtplib
+from abc import ABC, abstractmethod
+from email.message import EmailMessage
+from urllib import request as urllib_request
+
+logger = logging.getLogger(__name__)
+
+
+class Notifier(ABC):
+    """Delivers one reminder. Implementations must be thread-safe."""
+
+    @abstractmethod
+    def send(self, reminder):
+        """Deliver a reminder payload (a plain dict); raise on failure"""
+
+
+class LogNotifier(Notifier):
+    def send(self, reminder):
+        logger.info("Sending %s reminder to user %s: %s",
+                    reminder["notification_method"], reminder["user_id"], reminder["message"])
+
+
+class SmtpNotifier(Notifier):
+    """Sends reminders by email, e.g. to a local debugging SMTP server"""
+
+    def __init__(self, host="localhost", port=1025, sender="reminders@billmap.local", timeout=10):
+        self.host = host
+        self.port = port
+        self.sender = sender
+        self.timeout = timeout
+
+    def send(self, reminder):
+        if not reminder.get("email"):
+            raise ValueError("Reminder has no recipient email")
+
+        message = EmailMessage()
+        message["From"] = self.sender
+        message["To"] = reminder["email"]
+        message["Subject"] = "Bill reminder"
+        message.set_content(reminder["message"] or "You have a bill due soon.")
+
+        with smtplib.SMTP(self.host, self.port, timeout=self.timeout) as smtp:
+            smtp.send_message(message)
+
+
+class WebhookNotifier(Notifier):
+    """POSTs each reminder as JSON to a webhook URL"""
+
+    def __init__(self, url, timeout=10):
+        self.url = url
+        self.timeout = timeout
+
+    def send(self, reminder):
+        body = json.dumps(reminder, default=str).encode("utf-8")
+        req = urllib_request.Request(self.url, data=body, headers={"Content-Type": "application/json"})
+        with urllib_request.urlopen(req, timeout=self.timeout) as response:
+            if response.status >= 400:
+                raise RuntimeError(f"Webhook returned {response.status}")
+
+
+def notifier_from_config(config):
+    """Build the notifier selected by REMINDER_NOTIFIER"""
+    kind = config.get("REMINDER_NOTIFIER", "log")
+    if kind == "log":
+        return LogNotifier()
+    if kind == "smtp":
+        return SmtpNotifier(config["REMINDER_SMTP_HOST"], config["REMINDER_SMTP_PORT"], config["REMINDER_SMTP_SENDER"])
+    if kind == "webhook":
+        if not config.get("REMINDER_WEBHOOK_URL"):
+            raise ValueError("REMINDER_WEBHOOK_URL is required for the webhook notifier")
+        return WebhookNotifier(config["REMINDER_WEBHOOK_URL"])
+    raise ValueError(f"Unknown reminder notifier: {kind}")
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+
+import base64
+import json
+from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, select
+from database import db
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class WatermarkExpired(ValueError):
+    """The watermark predates the tombstone retention window; the client must resync from scratch"""
+
+
+def encode_cursor(record, sort_key="created_at"):
+    """Build an opaque cursor pointing just after the given record"""
+    payload = json.dumps([getattr(record, sort_key).isoformat(), record.id])
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+
+
+def decode_cursor(cursor):
+    """Return the (timestamp, id) pair stored in a cursor"""
+    try:
+        created_at, record_id = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        created_at = datetime.fromisoformat(created_at)
+    except (ValueError, TypeError, UnicodeError):
+        raise ValueError("Invalid cursor")
+    # ids are strings; anything else would reach the database as an unbindable parameter
+    if not isinstance(record_id, str):
+        raise ValueError("Invalid cursor")
+    return created_at, record_id
+
+
+def _after_cursor(model, cursor):
+    """Condition selecting the rows that sort after the cursor on (created_at, id); model may be table.c"""
+    created_at, record_id = decode_cursor(cursor)
+    # with bound parameters SQLite only seeks on a plain range term, not on the OR
+    return and_(model.created_at >= created_at, or_(
+        model.created_at > created_at,
+        and_(model.created_at == created_at, model.id > record_id)
+    ))
+
+
+def keyset_page(query, model, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """Return one page of query ordered on (created_at, id) and the cursor for the next page.
+
+    The page is located with a range condition on the sort key instead of an
+    OFFSET, so every page costs the same regardless of how deep it is."""
+    limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+    if cursor:
+        query = query.filter(_after_cursor(model, cursor))
+
+    items = query.order_by(model.created_at, model.id).limit(limit + 1).all()
+    next_cursor = None
+    if len(items) > limit:
+        items = items[:limit]
+        next_cursor = encode_cursor(items[-1])
+    return items, next_cursor
+
+
+def changes_page(query, model, limit=DEFAULT_PAGE_SIZE, since=None, settle_seconds=0, retention_days=None):
+    """Return rows of query changed after the `since` watermark, oldest change first.
+
+    Returns (items, watermark, has_more). Soft-deleted rows are included so the
+    caller can send them as tombstones. The watermark is a cursor on
+    (updated_at, id) just after the last item, or `since` itself when nothing
+    changed. Rows touched in the last `settle_seconds` are held back, so a
+    transaction that commits a little after it stamped updated_at is not
+    skipped by a watermark already handed out. That only holds for writers
+    that commit within `settle_seconds` of stamping; longer ones must commit
+    in chunks or re-stamp before commit, as create_bills_bulk does. A
+    watermark older than `retention_days` raises WatermarkExpired, because
+    the tombstones it would need may already have been archived."""
+    limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+    now = datetime.utcnow()
+
+    if since:
+        updated_at, record_id = decode_cursor(since)
+        if retention_days is not None and updated_at < now - timedelta(days=retention_days):
+            raise WatermarkExpired("Watermark is older than the deletion history; sync again without one")
+        # the plain range term lets the (user_id, updated_at, id) index seek past old rows
+        query = query.filter(model.updated_at >= updated_at, or_(
+            model.updated_at > updated_at,
+            and_(model.updated_at == updated_at, model.id > record_id)
+        ))
+    if settle_seconds:
+        query = query.filter(model.updated_at <= now - timedelta(seconds=settle_seconds))
+
+    items = query.order_by(model.updated_at, model.id).limit(limit + 1).all()
+    has_more = len(items) > limit
+    items = items[:limit]
+    watermark = encode_cursor(items[-1], "updated_at") if items else since
+    return items, watermark, has_more
+
+
+def keyset_rows(table, columns, *conditions, limit=DEFAULT_PAGE_SIZE, cursor=None):
+    """keyset_page without the ORM: a Core select of `columns` (names) from `table`.
+
+    Returns plain named-tuple rows read straight from the cursor, with no
+    instances, identity map or change tracking, for read-only list
+    responses. `conditions` should use table columns (table.c) so the
+    statement stays Core. The sort key is always selected so the next
+    cursor can be built from the last row."""
+    limit = max(1, min(limit or DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE))
+    names = dict.fromkeys((*columns, "created_at", "id"))
+    statement = select(*(table.c[name] for name in names)).where(*conditions)
+    if cursor:
+        statement = statement.where(_after_cursor(table.c, cursor))
+
+    rows = db.session.execute(statement.order_by(table.c.created_at, table.c.id).limit(limit + 1)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1])
+    return rows, next_cursor
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+import bcrypt
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool and its queue are full"""
+
+
+def hash_cost(password_hash):
+    """Return the bcrypt cost (log rounds) stored in a hash like $2b$12$..."""
+    try:
+        return int(password_hash.split("$")[2])
+    except (AttributeError, IndexError, ValueError):
+        return None
+
+
+class PasswordHasher:
+    """Runs bcrypt on a dedicated, size-limited thread pool.
+
+    At most max_workers hashes run at once and at most max_queue more wait;
+    anything beyond that is rejected immediately with PasswordHasherBusy so
+    request threads are never stuck behind a login burst. A caller that waits
+    longer than `timeout` gets PasswordHasherBusy too."""
+
+    def __init__(self, rounds=12, max_workers=4, max_queue=16, timeout=10):
+        self.rounds = rounds
+        self.timeout = timeout
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.rejected = 0
+        self.timed_out = 0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="bcrypt")
+
+    def init_app(self, app):
+        """Resize the pool from config and optionally calibrate the cost"""
+        self.configure(
+            rounds=app.config["BCRYPT_LOG_ROUNDS"],
+            max_workers=app.config["PASSWORD_HASH_WORKERS"],
+            max_queue=app.config["PASSWORD_HASH_QUEUE"],
+            timeout=app.config["PASSWORD_HASH_TIMEOUT"],
+        )
+        target_ms = app.config.get("BCRYPT_TARGET_MS")
+        if target_ms:
+            self.rounds = self.calibrate(target_ms / 1000)
+            logger.info("Calibrated bcrypt cost to %s rounds for a %s ms target", self.rounds, target_ms)
+
+    def configure(self, rounds=None, max_workers=None, max_queue=None, timeout=None):
+        if rounds is not None:
+            self.rounds = rounds
+        if timeout is not None:
+            self.timeout = timeout
+        if max_workers is not None or max_queue is not None:
+            old_pool = self._pool
+            self.max_workers = max_workers or self.max_workers
+            self.max_queue = self.max_queue if max_queue is None else max_queue
+            self._slots = threading.BoundedSemaphore(self.max_workers + self.max_queue)
+            self._pool = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="bcrypt")
+            old_pool.shutdown(wait=False)
+
+    def _run(self, fn, *args):
+        slots = self._slots
+        if not slots.acquire(blocking=False):
+            with self._lock:
+                self.rejected += 1
+            raise PasswordHasherBusy("Password hashing is saturated, try again shortly")
+        try:
+            future = self._pool.submit(fn, *args)
+        except Exception:
+            slots.release()
+            raise
+        future.add_done_callback(lambda _: slots.release())
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeout:
+            # a queued hash is dropped; one already running finishes and frees its slot
+            future.cancel()
+            with self._lock:
+                self.timed_out += 1
+            raise PasswordHasherBusy("Password hashing timed out, try again shortly") from None
+
+    @staticmethod
+    def _hash(password, rounds):
+        return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds)).decode("utf-8")
+
+    @staticmethod
+    def _verify(password_hash, password):
+        return bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8"))
+
+    def hash(self, password):
+        return self._run(self._hash, password, self.rounds)
+
+    def verify(self, password_hash, password):
+        return self._run(self._verify, password_hash, password)
+
+    def needs_rehash(self, password_hash):
+        """True when the stored cost is below the current cost"""
+        cost = hash_cost(password_hash)
+        return cost is not None and cost < self.rounds
+
+    def calibrate(self, target_seconds, min_rounds=10, max_rounds=16):
+        """Pick the highest cost whose hash time stays within target_seconds.
+
+        Each extra round doubles the work, so one timing at min_rounds is
+        enough to extrapolate. Never goes below min_rounds."""
+        started = time.perf_counter()
+        self._hash("calibration", min_rounds)
+        elapsed = time.perf_counter() - started
+
+        rounds = min_rounds
+        while rounds < max_rounds and elapsed * 2 <= target_seconds:
+            rounds += 1
+            elapsed *= 2
+        return rounds
+
+    def stats(self):
+        with self._lock:
+            return {"rounds": self.rounds, "workers": self.max_workers,
+                    "queue": self.max_queue, "rejected": self.rejected, "timed_out": self.timed_out}
+
+
+password_hasher = PasswordHasher()
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time as dt_time, timedelta
+from sqlalchemy import case, or_, select, update
+from database import db
+from models.reminder import Reminder
+from models.user import User
+from services.notifiers import notifier_from_config
+
+logger = logging.getLogger(__name__)
+
+
+class ReminderDispatcher:
+    """Sends due reminders in batches over a bounded thread pool.
+
+    Each batch is one indexed query for pending, due reminders. The batch is
+    claimed (pending -> sending, one attempt counted) before anything is sent.
+    A failed send goes back to pending and is retried on a later run until
+    max_attempts is used up, then stays failed. Claims older than
+    lease_seconds (a dispatcher that died mid-batch) are taken back the same
+    way at the start of each run. Only one dispatcher should run against a
+    database at a time."""
+
+    def __init__(self, app, notifier=None, batch_size=None, max_workers=None, max_attempts=None,
+                 lease_seconds=None):
+        self.app = app
+        self.notifier = notifier or notifier_from_config(app.config)
+        self.batch_size = batch_size or app.config["REMINDER_BATCH_SIZE"]
+        self.max_workers = max_workers or app.config["REMINDER_MAX_WORKERS"]
+        self.max_attempts = max_attempts or app.config["REMINDER_MAX_ATTEMPTS"]
+        self.lease_seconds = lease_seconds or app.config["REMINDER_LEASE_SECONDS"]
+        self._run_lock = threading.Lock()
+        self._metrics_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        self._metrics = {
+            "runs": 0,
+            "batches": 0,
+            "sent": 0,
+            "failed": 0,
+            "reclaimed": 0,
+            "busy_seconds": 0.0,
+            "lag_seconds_total": 0.0,
+            "max_lag_seconds": 0.0,
+            "last_run_at": None,
+        }
+
+    def _fetch_batch(self, today, run_started):
+        """Return plain payloads for the next batch of due reminders not yet tried in this run"""
+        query = (
+            select(Reminder.id, Reminder.user_id, Reminder.bill_id, Reminder.reminder_date,
+                   Reminder.notification_method, Reminder.message, User.email)
+            .outerjoin(User, User.id == Reminder.user_id)
+            .where(Reminder.delivery_status == "pending",
+                   Reminder.is_deleted == False,  # noqa: E712
+                   Reminder.reminder_date <= today,
+                   or_(Reminder.claimed_at.is_(None), Reminder.claimed_at < run_started))
+            .order_by(Reminder.reminder_date, Reminder.id)
+            .limit(self.batch_size)
+        )
+        return [dict(row._mapping) for row in db.session.execute(query)]
+
+    def _set_status(self, ids, status, from_status, **values):
+        if ids:
+            db.session.execute(
+                update(Reminder)
+                .where(Reminder.id.in_(ids), Reminder.delivery_status == from_status)
+                .values(delivery_status=status, **values)
+                .execution_options(synchronize_session=False)
+            )
+
+    def _retry_or_fail(self):
+        """Status for a reminder whose claim ended without a send"""
+        return case((Reminder.delivery_attempts >= self.max_attempts, "failed"), else_="pending")
+
+    def _reclaim_stale(self, now):
+        """Release "sending" claims older than the lease; return how many"""
+        result = db.session.execute(
+            update(Reminder)
+            .where(Reminder.delivery_status == "sending",
+                   Reminder.claimed_at < now - timedelta(seconds=self.lease_seconds))
+            .values(delivery_status=self._retry_or_fail())
+            .execution_options(synchronize_session=False)
+        )
+        db.session.commit()
+        return result.rowcount
+
+    def _send(self, reminder):
+        try:
+            self.notifier.send(reminder)
+            return True
+        except Exception:
+            logger.exception("Failed to send reminder %s", reminder["id"])
+            return False
+
+    def run_once(self):
+        """Dispatch every reminder due today or earlier; return this run's counts"""
+        with self._run_lock:
+            started = time.perf_counter()
+            today = date.today()
+            run_started = datetime.utcnow()
+            sent = failed = batches = 0
+            lag_total = max_lag = 0.0
+            reclaimed = self._reclaim_stale(run_started)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                while True:
+                    batch = self._fetch_batch(today, run_started)
+                    if not batch:
+                        break
+
+                    self._set_status([r["id"] for r in batch], "sending", "pending", claimed_at=datetime.utcnow(),
+                                     delivery_attempts=Reminder.delivery_attempts + 1)
+                    db.session.commit()
+
+                    results = list(pool.map(self._send, batch))
+                    now = datetime.utcnow()
+                    sent_ids = [r["id"] for r, ok in zip(batch, results) if ok]
+                    failed_ids = [r["id"] for r, ok in zip(batch, results) if not ok]
+                    self._set_status(sent_ids, "sent", "sending", sent_at=now)
+                    self._set_status(failed_ids, self._retry_or_fail(), "sending")
+                    db.session.commit()
+
+                    for reminder, ok in zip(batch, results):
+                        if ok:
+                            lag = (now - datetime.combine(reminder["reminder_date"], dt_time.min)).total_seconds()
+                            lag_total += lag
+                            max_lag = max(max_lag, lag)
+
+                    batches += 1
+                    sent += len(sent_ids)
+                    failed += len(failed_ids)
+
+            elapsed = time.perf_counter() - started
+            with self._metrics_lock:
+                m = self._metrics
+                m["runs"] += 1
+                m["batches"] += batches
+                m["sent"] += sent
+                m["failed"] += failed
+                m["reclaimed"] += reclaimed
+                m["busy_seconds"] += elapsed
+                m["lag_seconds_total"] += lag_total
+                m["max_lag_seconds"] = max(m["max_lag_seconds"], max_lag)
+                m["last_run_at"] = datetime.utcnow().isoformat()
+
+            return {"sent": sent, "failed": failed, "reclaimed": reclaimed, "batches": batches,
+                    "duration_seconds": elapsed}
+
+    def metrics(self):
+        """Cumulative counters plus throughput (sent per busy second) and mean lag"""
+        with self._metrics_lock:
+            m = dict(self._metrics)
+        m["throughput_per_second"] = m["sent"] / m["busy_seconds"] if m["busy_seconds"] else 0.0
+        m["mean_lag_seconds"] = m["lag_seconds_total"] / m["sent"] if m["sent"] else 0.0
+        return m
+
+    def _loop(self, interval):
+        with self.app.app_context():
+            while not self._stop.is_set():
+                try:
+                    self.run_once()
+                except Exception:
+                    logger.exception("Reminder dispatch run failed")
+                    db.session.rollback()
+                finally:
+                    db.session.remove()
+                self._stop.wait(interval)
+
+    def start(self, interval=None):
+        """Run the dispatcher every `interval` seconds on a background thread"""
+        if self._thread and self._thread.is_alive():
+            return
+        interval = interval or self.app.config["REMINDER_DISPATCH_INTERVAL"]
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._loop, args=(interval,), name="reminder-dispatcher", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout=None):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
 
+from sqlalchemy import case, select
 from models.reminder import Reminder
-from database import db
+from database import db, commit
+from services.conditional_update import conditional_update
+from services.multi_get import get_many
+from services.pagination import changes_page, keyset_page, keyset_rows, DEFAULT_PAGE_SIZE
+
+EXPORT_BATCH_SIZE = 1000
+LIST_COLUMNS = ("id", "bill_id", "reminder_date", "notification_method", "message")
+EXPORT_COLUMNS = ("id", "bill_id", "user_id", "reminder_date", "notification_method", "message",
+                  "delivery_status", "sent_at", "created_at", "updated_at", "is_deleted")
 
 class ReminderService:
     @staticmethod
@@ -20,9 +29,43 @@ class ReminderService:
     def get_reminder_by_id(reminder_id):
         return db.session.get(Reminder, reminder_id)
     
+    @staticmethod
+    def get_reminders_by_ids(reminder_ids):
+        """Return (reminders in the requested order, ids not found) using chunked IN queries"""
+        return get_many(Reminder, reminder_ids)
+
     @staticmethod
     def get_reminders_by_user(user_id):
         return Reminder.query.filter_by(user_id=user_id).all()
+
+    @staticmethod
+    def iter_reminders_for_export(user_id, start_date=None, end_date=None, batch_size=EXPORT_BATCH_SIZE):
+        """Yield every reminder of a user (deleted ones included) as rows, fetched batch_size at a time"""
+        query = select(*(getattr(Reminder, column) for column in EXPORT_COLUMNS)).where(Reminder.user_id == user_id)
+        if start_date:
+            query = query.where(Reminder.reminder_date >= start_date)
+        if end_date:
+            query = query.where(Reminder.reminder_date <= end_date)
+        query = query.order_by(Reminder.reminder_date, Reminder.id).execution_options(yield_per=batch_size)
+
+        yield from db.session.execute(query)
+
+    @staticmethod
+    def get_reminders_page_by_user(user_id, limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """Return a page of a user's reminders and the cursor for the next one"""
+        return keyset_page(Reminder.query.filter_by(user_id=user_id), Reminder, limit, cursor)
+
+    @staticmethod
+    def list_reminders_rows(user_id, limit=DEFAULT_PAGE_SIZE, cursor=None, columns=LIST_COLUMNS):
+        """Read-only page of a user's reminders as plain rows of `columns`, and the next cursor"""
+        reminders = Reminder.__table__
+        return keyset_rows(reminders, columns, reminders.c.user_id == user_id, limit=limit, cursor=cursor)
+
+    @staticmethod
+    def get_reminder_changes(user_id, since=None, limit=DEFAULT_PAGE_SIZE, settle_seconds=0, retention_days=None):
+        """Return a user's reminders changed after the `since` watermark, deleted ones included"""
+        return changes_page(Reminder.query.filter_by(user_id=user_id), Reminder, limit, since,
+                            settle_seconds, retention_days)
     
     @staticmethod
     def check_if_reminder_is_due(reminder_id):
@@ -44,27 +87,39 @@ class ReminderService:
     
     @staticmethod
     def update_reminder(reminder_id, reminder_date=None, message=None, notification_method=None):
-        reminder = db.session.get(Reminder, reminder_id)
-        if not reminder:
-            return None
-        
+        """Update a live reminder with one conditional UPDATE; None if there is no such reminder"""
+        values = {}
         if reminder_date is not None:
-            reminder.reminder_date = reminder_date
-            
+            values["reminder_date"] = reminder_date
+            # a reminder moved to another day is due to be sent again
+            moved = Reminder.reminder_date != reminder_date
+            values["delivery_status"] = case((moved, "pending"), else_=Reminder.delivery_status)
+            values["sent_at"] = case((moved, None), else_=Reminder.sent_at)
+            values["delivery_attempts"] = case((moved, 0), else_=Reminder.delivery_attempts)
+            values["claimed_at"] = case((moved, None), else_=Reminder.claimed_at)
+
         if message is not None:
-            reminder.message = message
+            values["message"] = message
         
         if notification_method is not None:
-            reminder.notification_method = notification_method
-            
-        db.session.commit()
+            values["notification_method"] = notification_method
+
+        if not values:
+            reminder = db.session.get(Reminder, reminder_id)
+            return reminder if reminder is not None and not reminder.is_deleted else None
+
+        reminder = conditional_update(Reminder, reminder_id, values, Reminder.is_deleted == False)  # noqa: E712
+        if reminder is not None:
+            commit()
         return reminder
     
     @staticmethod
     def delete_reminder(reminder_id):
-        reminder = db.session.get(Reminder, reminder_id)
-        if not reminder:
-            return None
-        
-        reminder.soft_delete()
+        """Soft-delete with one conditional UPDATE; deleting again returns the deleted reminder"""
+        reminder = conditional_update(Reminder, reminder_id, {"is_deleted": True},
+                                      Reminder.is_deleted == False)  # noqa: E712
+        if reminder is None:
+            return db.session.get(Reminder, reminder_id, populate_existing=True)
+
+        commit()
         return reminder
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+
+import hmac
+import json
+import logging
+import os
+import random
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from logging.handlers import RotatingFileHandler
+from flask import has_request_context, jsonify, request
+from sqlalchemy import event
+from database import db
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EXPLAIN_PREFIXES = {"sqlite": "EXPLAIN QUERY PLAN ", "postgresql": "EXPLAIN ", "mysql": "EXPLAIN "}
+EXPLAINABLE = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+def parameter_shape(parameters):
+    """Describe bound parameters by type only, so values never reach the log"""
+    if isinstance(parameters, dict):
+        return {key: type(value).__name__ for key, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def _origin():
+    """First frame of application code below the engine event, as path:line function"""
+    frame = sys._getframe(2)
+    while frame is not None:
+        path = frame.f_code.co_filename
+        if path.startswith(PROJECT_ROOT) and path != __file__ and "site-packages" not in path:
+            return f"{os.path.relpath(path, PROJECT_ROOT)}:{frame.f_lineno} {frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """Opt-in recorder for statements slower than SLOW_QUERY_THRESHOLD_MS.
+
+    Each slow statement is stored with its parameter types, duration, the
+    route and application function that issued it and the backend's EXPLAIN
+    output, either in an in-memory ring buffer (served at /admin/slow-queries)
+    or as JSON lines in a rotating file. Only a SLOW_QUERY_SAMPLE_RATE share
+    of statements is timed and EXPLAIN runs at most SLOW_QUERY_EXPLAIN_PER_MINUTE
+    times a minute, which bounds the overhead."""
+
+    def __init__(self, app=None):
+        self._lock = threading.Lock()
+        self.records = deque()
+        self.stats = {"sampled": 0, "slow": 0, "explained": 0, "explain_skipped": 0}
+        self._explain_window = (0, 0)  # (minute, explains in it)
+        self._file_logger = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        config = app.config
+        self.threshold = config["SLOW_QUERY_THRESHOLD_MS"] / 1000
+        self.sample_rate = config["SLOW_QUERY_SAMPLE_RATE"]
+        self.explain_per_minute = config["SLOW_QUERY_EXPLAIN_PER_MINUTE"]
+        self.admin_token = config.get("ADMIN_TOKEN")
+        self.records = deque(maxlen=config["SLOW_QUERY_BUFFER_SIZE"])
+
+        if config["SLOW_QUERY_SINK"] == "file":
+            handler = RotatingFileHandler(config["SLOW_QUERY_FILE"], maxBytes=config["SLOW_QUERY_FILE_MAX_BYTES"],
+                                          backupCount=config["SLOW_QUERY_FILE_BACKUPS"])
+            handler.setFormatter(logging.Formatter("%(message)s"))
+            self._file_logger = logging.getLogger(f"billmap.slow_queries.{id(self)}")
+            self._file_logger.propagate = False
+            self._file_logger.setLevel(logging.INFO)
+            self._file_logger.addHandler(handler)
+        else:
+            app.add_url_rule("/admin/slow-queries", "slow_queries", self._admin_view, methods=["GET", "DELETE"])
+
+        app.extensions["slow_query_log"] = self
+        with app.app_context():
+            self.explain_prefix = EXPLAIN_PREFIXES.get(db.engine.dialect.name)
+            event.listen(db.engine, "before_cursor_execute", self._before_cursor_execute)
+            event.listen(db.engine, "after_cursor_execute", self._after_cursor_execute)
+            event.listen(db.engine, "handle_error", self._handle_error)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        sampled = self.sample_rate >= 1 or random.random() < self.sample_rate
+        conn.info.setdefault("slow_query_started", []).append(time.perf_counter() if sampled else None)
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        started = conn.info["slow_query_started"].pop()
+        if started is None:
+            return
+        duration = time.perf_counter() - started
+        with self._lock:
+            self.stats["sampled"] += 1
+        if duration >= self.threshold:
+            self._record(conn, statement, parameters, executemany, duration)
+
+    @staticmethod
+    def _handle_error(exception_context):
+        """A failed statement never reaches after_cursor_execute; drop its start time"""
+        conn = exception_context.connection
+        if conn is not None and exception_context.cursor is not None and conn.info.get("slow_query_started"):
+            conn.info["slow_query_started"].pop()
+
+    def _explain_allowed(self):
+        minute = int(time.monotonic() // 60)
+        with self._lock:
+            window, used = self._explain_window
+            if window != minute:
+                window, used = minute, 0
+            allowed = used < self.explain_per_minute
+            self._explain_window = (window, used + 1 if allowed else used)
+            self.stats["explained" if allowed else "explain_skipped"] += 1
+        return allowed
+
+    def _explain(self, conn, statement, parameters, executemany):
+        """EXPLAIN on a raw DBAPI cursor so the engine events do not fire again"""
+        if not self.explain_prefix or not statement.lstrip().upper().startswith(EXPLAINABLE):
+            return None
+        if not self._explain_allowed():
+            return None
+        if executemany:
+            parameters = parameters[0] if parameters else ()
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(self.explain_prefix + statement, parameters)
+            return [" | ".join(str(column) for column in row) for row in cursor.fetchall()]
+        except Exception as error:
+            return [f"EXPLAIN failed: {error}"]
+        finally:
+            cursor.close()
+
+    def _record(self, conn, statement, parameters, executemany, duration):
+        record = {
+            "at": datetime.utcnow().isoformat(),
+            "duration_ms": round(duration * 1000, 3),
+            "statement": statement,
+            "parameters": parameter_shape(parameters[0] if executemany and parameters else parameters),
+            "executemany": len(parameters) if executemany else None,
+            "route": f"{request.method} {request.path}" if has_request_context() else None,
+            "function": _origin(),
+            "plan": self._explain(conn, statement, parameters, executemany),
+        }
+        with self._lock:
+            self.stats["slow"] += 1
+            if self._file_logger is None:
+                self.records.append(record)
+        if self._file_logger is not None:
+            self._file_logger.info(json.dumps(record))
+
+    def snapshot(self):
+        with self._lock:
+            return {"items": list(reversed(self.records)), "stats": dict(self.stats)}
+
+    def clear(self):
+        with self._lock:
+            self.records.clear()
+
+    def _admin_view(self):
+        supplied = request.headers.get("X-Admin-Token", "")
+        if not self.admin_token or not hmac.compare_digest(supplied, self.admin_token):
+            return jsonify({"error": "Admin token required"}), 403
+        if request.method == "DELETE":
+            self.clear()
+            return "", 204
+        return jsonify(self.snapshot()), 200
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+import itertools
+import multiprocessing
+import random
+import time
+from datetime import date, datetime, time as dt_time, timedelta
+from sqlalchemy import create_engine, event
+from database import _is_sqlite, _sqlite_pragma_listener
+from models.bill import Bill
+from models.ids import uuid7
+from models.reminder import Reminder
+from models.user import User
+
+FIRST_NAMES = ("Ana", "Ben", "Carla", "David", "Elena", "Farid", "Grace", "Hugo", "Irene", "Jon",
+               "Kemi", "Luis", "Maya", "Noah", "Olga", "Pablo", "Quinn", "Rosa", "Sam", "Tara")
+LAST_NAMES = ("Alvarez", "Brown", "Chen", "Diaz", "Evans", "Fischer", "Garcia", "Hughes", "Ito", "Jones",
+              "Khan", "Lopez", "Martin", "Nguyen", "Okafor", "Patel", "Rossi", "Smith", "Tanaka", "Weber")
+# (description, has a minimum payment)
+PAYEES = (("Electricity", False), ("Water", False), ("Internet", False), ("Phone", False), ("Rent", False),
+          ("Credit card", True), ("Insurance", False), ("Streaming", False), ("Gym", False), ("Car loan", True))
+NOTIFICATION_METHODS = ("app_notification", "app_notification", "email", "sms")
+REMINDER_OFFSETS = (1, 3, 7)  # days before the due date
+# every sorted choice of k offsets, so picking one is a single rng.choice
+OFFSET_CHOICES = [list(itertools.combinations(REMINDER_OFFSETS, k)) for k in range(len(REMINDER_OFFSETS) + 1)]
+
+DEFAULTS = {
+    "bills_per_user": 12.0,
+    "reminders_per_bill": 1.5,
+    "deleted_fraction": 0.02,
+    "paid_fraction": 0.9,
+    "history_days": 365,
+    "chunk_users": 5000,
+    "seed": 1,
+}
+
+
+def _rows_for_users(rng, start, end, password_hash, today, now, options):
+    """Users [start, end) with their bills and reminders, as plain dicts for executemany.
+
+    Bills due up to 45 days ahead would be created 30 days before their due
+    date, i.e. in the future; creation times are clamped to the past so
+    nothing carries a timestamp later than `now`."""
+    users, bills, reminders = [], [], []
+    mean_bills = options["bills_per_user"]
+    reminders_whole, reminders_extra = divmod(options["reminders_per_bill"], 1)
+    deleted_fraction = options["deleted_fraction"]
+    paid_fraction = options["paid_fraction"]
+    history_days = options["history_days"]
+
+    for n in range(start, end):
+        user_id = uuid7()
+        joined = now - timedelta(days=rng.randint(0, history_days), seconds=rng.randint(0, 86399))
+        users.append({"id": user_id, "first_name": rng.choice(FIRST_NAMES), "last_name": rng.choice(LAST_NAMES),
+                      "email": f"user{n}@example.com", "password_hash": password_hash,
+                      "created_at": joined, "updated_at": joined, "is_deleted": False})
+
+        for _ in range(max(1, round(rng.gauss(mean_bills, mean_bills / 3)))):
+            description, has_minimum = rng.choice(PAYEES)
+            due_date = today + timedelta(days=int(rng.triangular(-history_days, 45, 10)))
+            amount = round(max(1.0, rng.lognormvariate(4.2, 0.8)), 2)
+            if due_date >= today:
+                status = "pending"
+            else:
+                status = "paid" if rng.random() < paid_fraction else "overdue"
+            created_at = min(datetime.combine(due_date - timedelta(days=30), dt_time(12)),
+                             now - timedelta(seconds=rng.randint(60, 86400)))
+            deleted = rng.random() < deleted_fraction
+            bill_id = uuid7()
+            bills.append({"id": bill_id, "user_id": user_id, "amount": amount, "due_date": due_date,
+                          "status": status, "minimum_payment": round(amount * 0.1, 2) if has_minimum else None,
+                          "description": description, "created_at": created_at,
+                          "updated_at": now if deleted else created_at, "is_deleted": deleted})
+
+            count = int(reminders_whole) + (rng.random() < reminders_extra)
+            for offset in rng.choice(OFFSET_CHOICES[min(count, len(REMINDER_OFFSETS))]):
+                reminder_date = due_date - timedelta(days=offset)
+                sent = reminder_date <= today
+                reminders.append({"id": uuid7(), "bill_id": bill_id, "user_id": user_id,
+                                  "reminder_date": reminder_date,
+                                  "notification_method": rng.choice(NOTIFICATION_METHODS),
+                                  "message": f"{description} bill due on {due_date.isoformat()}",
+                                  "delivery_status": "sent" if sent else "pending",
+                                  "sent_at": min(datetime.combine(reminder_date, dt_time(9)), now) if sent else None,
+                                  "created_at": created_at, "updated_at": created_at,
+                                  "is_deleted": deleted or rng.random() < deleted_fraction})
+    return users, bills, reminders
+
+
+def generate_range(engine, start, end, password_hash, **options):
+    """Insert users [start, end) and their data, one transaction per chunk of users.
+
+    Each chunk is seeded from (seed, chunk start), so the same range always
+    produces the same data however the work is split between processes."""
+    options = dict(DEFAULTS, **options)
+    today, now = date.today(), datetime.utcnow()
+    targets = [model.__table__ for model in (User, Bill, Reminder)]
+    counts = {"users": 0, "bills": 0, "reminders": 0}
+    for chunk_start in range(start, end, options["chunk_users"]):
+        chunk_end = min(end, chunk_start + options["chunk_users"])
+        rng = random.Random(f"{options['seed']}:{chunk_start}")
+        rows = _rows_for_users(rng, chunk_start, chunk_end, password_hash, today, now, options)
+        with engine.begin() as conn:
+            for target, chunk in zip(targets, rows):
+                if chunk:
+                    conn.execute(target.insert(), chunk)
+        users, bills, reminders = rows
+        counts["users"] += len(users)
+        counts["bills"] += len(bills)
+        counts["reminders"] += len(reminders)
+    return counts
+
+
+def _worker(url, pragma_config, start, end, password_hash, options):
+    """Process entry point: its own engine, one user range"""
+    engine = create_engine(url)
+    if pragma_config is not None:
+        event.listen(engine, "connect", _sqlite_pragma_listener(pragma_config))
+    try:
+        return generate_range(engine, start, end, password_hash, **options)
+    finally:
+        engine.dispose()
+
+
+def generate(engine, users, password_hash, start_user=0, workers=1, pragma_config=None, **options):
+    """Generate `users` users from index start_user, split across `workers` processes.
+
+    With more than one worker every process opens its own engine on the same
+    database; on SQLite the writers take turns, so give them a long
+    busy_timeout in pragma_config."""
+    started = time.perf_counter()
+    end_user = start_user + users
+    if workers <= 1:
+        counts = generate_range(engine, start_user, end_user, password_hash, **options)
+    else:
+        if _is_sqlite(engine.url) and engine.url.database in (None, "", ":memory:"):
+            raise ValueError("Parallel generation needs a database file, not an in-memory database")
+        step = -(-users // workers)
+        url = engine.url.render_as_string(hide_password=False)
+        pragmas = pragma_config if _is_sqlite(engine.url) else None
+        ranges = [(url, pragmas, s, min(end_user, s + step), password_hash, options)
+                  for s in range(start_user, end_user, step)]
+        with multiprocessing.Pool(len(ranges)) as pool:
+            parts = pool.starmap(_worker, ranges)
+        counts = {key: sum(part[key] for part in parts) for key in ("users", "bills", "reminders")}
+
+    duration = time.perf_counter() - started
+    rows = sum(counts.values())
+    return dict(counts, rows=rows, duration_seconds=duration, rows_per_second=rows / duration if duration else 0.0)
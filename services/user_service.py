@@ -1,5 +1,70 @@
+from datetime import date
+from sqlalchemy import event, inspect, select
+from sqlalchemy.orm import Session, make_transient_to_detached, object_session, selectinload
 from models.user import User
-from database import db
+from models.bill import Bill
+from models.reminder import Reminder
+from database import db, commit
+from services.cache import AppCache
+from services.pagination import keyset_page, keyset_rows, DEFAULT_PAGE_SIZE
+
+LIST_COLUMNS = ("id", "first_name", "last_name", "email")
+
+# User rows keyed by ("id", user_id) and ("email", normalized email); configured by init_app
+user_cache = AppCache("USER_CACHE")
+# Columns kept out of caches shared with other processes
+PRIVATE_COLUMNS = ("password_hash",)
+# session.info key of the cache keys touched by the session's current transaction
+_TOUCHED = "user_cache_keys"
+
+
+def _normalize_email(email):
+    return email.strip().lower()
+
+
+def _cache_user(user):
+    """Store the user's column values under both lookup keys"""
+    private = PRIVATE_COLUMNS if user_cache.shared else ()
+    record = {attr.key: getattr(user, attr.key) for attr in User.__mapper__.column_attrs
+              if attr.key not in private}
+    user_cache.set(("id", record["id"]), record)
+    user_cache.set(("email", _normalize_email(record["email"])), record)
+
+
+def _load_cached(record):
+    """Attach a cached row to the current session without querying the database.
+
+    Columns missing from the record (PRIVATE_COLUMNS) load on first access."""
+    user = User(**record)
+    make_transient_to_detached(user)
+    return db.session.merge(user, load=False)
+
+
+@event.listens_for(User, "after_insert")
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user(mapper, connection, target):
+    """Drop cached entries when a user row is written, and again when its transaction ends.
+
+    The flush-time drop keeps this transaction from reading its own stale
+    entry; the commit/rollback drop removes whatever was cached in between,
+    by this transaction or a concurrent one, that may be uncommitted or old."""
+    keys = {("id", target.id)}
+    for email in {target.email, *inspect(target).attrs.email.history.deleted}:
+        if email:
+            keys.add(("email", _normalize_email(email)))
+    for key in keys:
+        user_cache.delete(key)
+    session = object_session(target)
+    if session is not None:
+        session.info.setdefault(_TOUCHED, set()).update(keys)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_touched_users(session):
+    for key in session.info.pop(_TOUCHED, ()):
+        user_cache.delete(key)
 
 
 class UserService:
@@ -17,11 +82,52 @@ class UserService:
 
     @staticmethod
     def get_user_by_id(user_id):
-        return User.query.filter_by(id=user_id).first()
+        record = user_cache.get(("id", user_id))
+        if record is not None:
+            return _load_cached(record)
+
+        user = User.query.filter_by(id=user_id).first()
+        if user:
+            _cache_user(user)
+        return user
+
+    @staticmethod
+    def get_user_version(user_id):
+        """Return the user's updated_at, or None if there is no such user, without loading the row"""
+        record = user_cache.get(("id", user_id))
+        if record is not None:
+            return record["updated_at"]
+        return db.session.execute(select(User.updated_at).where(User.id == user_id)).scalar()
 
     @staticmethod
     def get_user_by_email(email):
-        return User.get_active().filter_by(email=email).first()
+        record = user_cache.get(("email", _normalize_email(email)))
+        if record is not None and record["email"] == email:
+            return None if record["is_deleted"] else _load_cached(record)
+
+        user = User.get_active().filter_by(email=email).first()
+        if user:
+            _cache_user(user)
+        return user
+
+    @staticmethod
+    def get_user_overview(user_id):
+        """Load a user with active bills and their upcoming reminders in three queries"""
+        today = date.today()
+        return (
+            User.query.filter_by(id=user_id)
+            .options(
+                selectinload(User.bills.and_(Bill.is_deleted == False))  # noqa: E712
+                .selectinload(Bill.reminders.and_(Reminder.is_deleted == False,  # noqa: E712
+                                                  Reminder.reminder_date >= today))
+            )
+            .first()
+        )
+
+    @staticmethod
+    def cache_stats():
+        """Hit/miss counters and size of the user cache"""
+        return user_cache.stats()
 
     @staticmethod
     def authenticate_user(email, password):
@@ -32,6 +138,16 @@ class UserService:
             return user
         return None
 
+    @staticmethod
+    def rehash_password_if_needed(user, password):
+        """Re-hash a just-verified password when its stored cost is outdated"""
+        if not user.password_needs_rehash():
+            return False
+
+        user.set_password(password)
+        user.save()
+        return True
+
     @staticmethod
     def update_user(user_id, **kwargs):
         """Update user details"""
@@ -43,7 +159,7 @@ class UserService:
             if hasattr(user, key) and value:
                 setattr(user, key, value)
 
-        db.session.commit()
+        commit()
         return user
 
     @staticmethod
@@ -54,10 +170,20 @@ class UserService:
             return None
 
         db.session.delete(user)
-        db.session.commit()
+        commit()
         return True
 
     @staticmethod
     def get_all_users():
 
         return User.query.all()
+
+    @staticmethod
+    def get_users_page(limit=DEFAULT_PAGE_SIZE, cursor=None):
+        """Return a page of users and the cursor for the next one"""
+        return keyset_page(User.query, User, limit, cursor)
+
+    @staticmethod
+    def list_users_rows(limit=DEFAULT_PAGE_SIZE, cursor=None, columns=LIST_COLUMNS):
+        """Read-only page of users as plain rows of `columns`, and the next cursor"""
+        return keyset_rows(User.__table__, columns, limit=limit, cursor=cursor)
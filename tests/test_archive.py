@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, datetime, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.archive import bills_archive, reminders_archive
+from models.bill import Bill
+from models.reminder import Reminder
+from services.archive_service import ArchiveService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def add_bill(deleted_days_ago=None, reminders=1):
+    bill = Bill(user_id="u1", amount=10, due_date=date.today())
+    if deleted_days_ago is not None:
+        bill.is_deleted = True
+        bill.updated_at = datetime.utcnow() - timedelta(days=deleted_days_ago)
+    db.session.add(bill)
+    db.session.flush()
+    for _ in range(reminders):
+        db.session.add(Reminder(bill_id=bill.id, user_id="u1", reminder_date=date.today()))
+    db.session.commit()
+    return bill.id
+
+def count(table):
+    return db.session.execute(db.select(db.func.count()).select_from(table)).scalar()
+
+def test_archive_moves_old_deleted_rows(app):
+    with app.app_context():
+        old = [add_bill(deleted_days_ago=40, reminders=2) for _ in range(3)]
+        recent = add_bill(deleted_days_ago=1)
+        live = add_bill()
+        stale_reminder = Reminder(bill_id=live, user_id="u1", reminder_date=date.today(), is_deleted=True,
+                                  updated_at=datetime.utcnow() - timedelta(days=90))
+        db.session.add(stale_reminder)
+        db.session.commit()
+
+        result = ArchiveService.archive_deleted(retention_days=30, batch_size=2)
+
+        assert result["bills"] == 3
+        assert result["reminders"] == 7
+        assert result["batches"] == 3
+        assert result["size_before"]["bills"] == 5
+        assert result["size_after"]["bills"] == 2
+        assert result["size_after"]["reminders_archive"] == 7
+        assert {bill.id for bill in Bill.query.all()} == {recent, live}
+        assert count(bills_archive) == 3
+        assert ArchiveService.archive_deleted(retention_days=30)["bills"] == 0
+        assert Reminder.query.filter(Reminder.bill_id.in_(old)).count() == 0
+
+def test_restore_bill_brings_back_reminders(app):
+    with app.app_context():
+        bill_id = add_bill(deleted_days_ago=40, reminders=2)
+        ArchiveService.archive_deleted(retention_days=30)
+
+        bill = ArchiveService.restore_bill(bill_id)
+        assert bill.is_deleted is False
+        assert Reminder.query.filter_by(bill_id=bill_id).count() == 2
+        assert count(bills_archive) == 0
+        assert count(reminders_archive) == 0
+        assert ArchiveService.restore_bill(bill_id) is None
+
+def test_restore_routes(client, app):
+    with app.app_context():
+        bill_id = add_bill(deleted_days_ago=40, reminders=0)
+        reminder = Reminder(bill_id=add_bill(reminders=0), user_id="u1", reminder_date=date.today(), is_deleted=True,
+                            updated_at=datetime.utcnow() - timedelta(days=40))
+        db.session.add(reminder)
+        db.session.commit()
+        reminder_id = reminder.id
+        ArchiveService.archive_deleted(retention_days=30)
+
+    response = client.post(f"/api/v1/bills/{bill_id}/restore")
+    assert response.status_code == 200
+    assert response.get_json()["id"] == bill_id
+    assert client.post(f"/api/v1/reminders/{reminder_id}/restore").status_code == 200
+    assert client.post("/api/v1/reminders/missing/restore").status_code == 404
+
+def test_reminder_of_an_archived_bill_is_not_restored_alone(client, app):
+    with app.app_context():
+        bill_id = add_bill(reminders=0)
+        reminder = Reminder(bill_id=bill_id, user_id="u1", reminder_date=date.today(), is_deleted=True,
+                            updated_at=datetime.utcnow() - timedelta(days=40))
+        db.session.add(reminder)
+        db.session.commit()
+        reminder_id = reminder.id
+        ArchiveService.archive_deleted(retention_days=30)
+        bill = db.session.get(Bill, bill_id)
+        bill.is_deleted = True
+        bill.updated_at = datetime.utcnow() - timedelta(days=40)
+        db.session.commit()
+        ArchiveService.archive_deleted(retention_days=30)
+
+    response = client.post(f"/api/v1/reminders/{reminder_id}/restore")
+    assert response.status_code == 409
+    assert "restore the bill first" in response.get_json()["error"]
+
+    assert client.post(f"/api/v1/bills/{bill_id}/restore").status_code == 200
+    with app.app_context():
+        assert db.session.get(Reminder, reminder_id) is not None
+        assert count(reminders_archive) == 0
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+import json
+import time
+import pytest
+from datetime import date, datetime, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from services.bill_service import BillService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def test_create_bills_bulk(init_database):
+    """Valid rows are inserted, invalid rows are reported by row number."""
+    due = (date.today() + timedelta(days=5)).isoformat()
+    rows = [
+        {"user_id": "u1", "amount": "10.5", "due_date": due, "description": "Water"},
+        {"user_id": "u1", "amount": "", "due_date": due},
+        {"user_id": "u1", "amount": "20", "due_date": "05/01/2025"},
+        {"user_id": "u1", "amount": 30, "due_date": due, "minimum_payment": "5"},
+    ]
+
+    result = BillService.create_bills_bulk(rows, chunk_size=2)
+
+    assert result["created"] == 2
+    assert [e["row"] for e in result["errors"]] == [2, 3]
+    assert Bill.query.count() == 2
+    assert Bill.query.filter_by(description="Water").first().status == "pending"
+
+def test_create_bills_bulk_default_user(init_database):
+    """The user_id argument fills in rows that do not carry one."""
+    due = date.today().isoformat()
+    result = BillService.create_bills_bulk([{"amount": 1, "due_date": due}] * 3, user_id="u2")
+
+    assert result == {"created": 3, "errors": []}
+    assert Bill.query.filter_by(user_id="u2").count() == 3
+
+def test_single_transaction_import_is_stamped_at_commit(init_database):
+    """Early chunks of a long import must not carry times older than the commit, or delta sync skips them."""
+    due = date.today().isoformat()
+    last_chunk_started = []
+
+    def slow_rows():
+        for i in range(6):
+            if i % 2 == 0:
+                time.sleep(0.05)
+                last_chunk_started.append(datetime.utcnow())
+            yield {"user_id": "u1", "amount": i + 1, "due_date": due}
+
+    assert BillService.create_bills_bulk(slow_rows(), chunk_size=2)["created"] == 6
+    stamps = {bill.updated_at for bill in Bill.query.all()}
+    assert min(stamps) >= last_chunk_started[-1]
+
+def test_import_csv(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    body = "user_id,amount,due_date,description\n" \
+           f"u1,100.5,{due},Electricity\n" \
+           f"u1,abc,{due},Broken\n"
+    response = client.post("/api/v1/bills/import", data=body, content_type="text/csv")
+
+    assert response.status_code == 201
+    assert response.get_json() == {"created": 1, "errors": [{"row": 2, "error": "Invalid amount"}]}
+
+def test_import_ndjson(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    lines = [json.dumps({"amount": 10, "due_date": due}), "{not json", json.dumps({"amount": 20, "due_date": due})]
+    response = client.post("/api/v1/bills/import?user_id=u9&chunk_size=1&commit_per_chunk=true",
+                           data="\n".join(lines), content_type="application/x-ndjson")
+
+    assert response.status_code == 201
+    assert response.get_json() == {"created": 2, "errors": [{"row": 2, "error": "Invalid row"}]}
+    with app.app_context():
+        assert Bill.query.filter_by(user_id="u9").count() == 2
+
+def test_import_unsupported_content_type(client):
+    response = client.post("/api/v1/bills/import", json=[])
+    assert response.status_code == 415
+
+def test_non_string_due_dates_are_row_errors(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    lines = [json.dumps({"amount": 10, "due_date": due}),
+             json.dumps({"amount": 10, "due_date": 5}),
+             json.dumps({"amount": 10, "due_date": True}),
+             json.dumps({"amount": 10, "due_date": [due]})]
+    response = client.post("/api/v1/bills/import?user_id=u1", data="\n".join(lines),
+                           content_type="application/x-ndjson")
+
+    assert response.status_code == 201
+    assert response.get_json()["errors"] == [
+        {"row": row, "error": "Invalid date format. Use YYYY-MM-DD"} for row in (2, 3, 4)
+    ]
+
+def test_non_finite_numbers_are_row_errors(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    body = "user_id,amount,due_date,minimum_payment\n" \
+           f"u1,10,{due},\n" \
+           f"u1,nan,{due},\n" \
+           f"u1,1e400,{due},\n" \
+           f"u1,-inf,{due},\n" \
+           f"u1,10,{due},nan\n"
+    response = client.post("/api/v1/bills/import", data=body, content_type="text/csv")
+
+    assert response.status_code == 201
+    assert response.get_json() == {"created": 1, "errors": [
+        {"row": 2, "error": "Invalid amount"},
+        {"row": 3, "error": "Invalid amount"},
+        {"row": 4, "error": "Invalid amount"},
+        {"row": 5, "error": "Invalid minimum payment"},
+    ]}
+    with app.app_context():
+        assert Bill.query.count() == 1
+
+def test_non_string_user_ids_are_row_errors(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    lines = [json.dumps({"user_id": "u1", "amount": "nan", "due_date": due}),
+             json.dumps({"user_id": ["a"], "amount": 10, "due_date": due}),
+             json.dumps({"user_id": 7, "amount": 10, "due_date": due}),
+             json.dumps({"user_id": "u1", "amount": 10, "due_date": due})]
+    response = client.post("/api/v1/bills/import", data="\n".join(lines), content_type="application/x-ndjson")
+
+    assert response.status_code == 201
+    assert response.get_json() == {"created": 1, "errors": [
+        {"row": 1, "error": "Invalid amount"},
+        {"row": 2, "error": "Invalid user ID"},
+        {"row": 3, "error": "Invalid user ID"},
+    ]}
+
+def test_undecodable_body_is_rejected(client, app):
+    due = (date.today() + timedelta(days=5)).isoformat()
+    body = f"user_id,amount,due_date\nu1,10,{due}\n".encode() + b"u1,\xff\xfe,2025-01-01\n"
+    response = client.post("/api/v1/bills/import", data=body, content_type="text/csv")
+
+    assert response.status_code == 400
+    assert "could not be read" in response.get_json()["error"]
+    with app.app_context():
+        assert Bill.query.count() == 0
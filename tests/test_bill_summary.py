@@ -0,0 +1,118 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, timedelta
+from sqlalchemy import event
+from app import create_app, db
+from database import unit_of_work
+from config import TestingConfig
+from models.bill import Bill
+from services.bill_service import BillService, summary_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    summary_cache.clear()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+def add_bill(user_id, amount, days_from_today, **kwargs):
+    bill = Bill(user_id=user_id, amount=amount, due_date=date.today() + timedelta(days=days_from_today), **kwargs)
+    db.session.add(bill)
+    db.session.commit()
+    return bill
+
+def test_summary_aggregates(init_database):
+    add_bill("u1", 10, -2)
+    add_bill("u1", 20, 3)
+    add_bill("u1", 40, 20)
+    add_bill("u1", 80, 60)
+    add_bill("u1", 1000, 1, status="paid")
+    add_bill("u1", 1000, 1, is_deleted=True)
+    add_bill("u2", 1000, 1)
+
+    assert BillService.get_summary("u1") == {
+        "total_outstanding": 150,
+        "overdue_count": 1,
+        "due_next_7_days": 20,
+        "due_next_30_days": 60,
+        "next_due_date": (date.today() + timedelta(days=3)).isoformat(),
+    }
+
+def test_summary_for_user_without_bills(init_database):
+    summary = BillService.get_summary("nobody")
+    assert summary["total_outstanding"] == 0
+    assert summary["next_due_date"] is None
+
+def test_summary_is_cached_until_a_write(init_database):
+    bill = BillService.create_bill("u1", 10, date.today() + timedelta(days=1))
+    counter = QueryCounter()
+    event.listen(db.engine, "before_cursor_execute", counter)
+    try:
+        assert BillService.get_summary("u1")["total_outstanding"] == 10
+        assert counter.count == 1
+        BillService.get_summary("u1")
+        assert counter.count == 1
+    finally:
+        event.remove(db.engine, "before_cursor_execute", counter)
+
+    BillService.update_bill(bill.id, amount=25)
+    assert BillService.get_summary("u1")["total_outstanding"] == 25
+    BillService.mark_bill_as_paid(bill.id)
+    assert BillService.get_summary("u1")["total_outstanding"] == 0
+    BillService.create_bills_bulk([{"user_id": "u1", "amount": 5, "due_date": date.today().isoformat()}])
+    assert BillService.get_summary("u1")["total_outstanding"] == 5
+
+def test_summary_read_inside_a_rolled_back_unit_of_work_is_dropped(init_database):
+    class Abort(Exception):
+        pass
+
+    with pytest.raises(Abort):
+        with unit_of_work():
+            BillService.create_bill("u1", 100.0, date.today() + timedelta(days=3))
+            assert BillService.get_summary("u1")["total_outstanding"] == 100.0
+            raise Abort()
+
+    assert Bill.query.count() == 0
+    assert BillService.get_summary("u1")["total_outstanding"] == 0
+
+def test_summary_route(client, app):
+    with app.app_context():
+        add_bill("u1", 12.5, 2)
+    response = client.get("/api/v1/bills/user/u1/summary")
+    assert response.status_code == 200
+    assert response.get_json()["due_next_7_days"] == 12.5
+
+def test_cache_settings_come_from_app_config():
+    class SmallCacheConfig(TestingConfig):
+        BILL_SUMMARY_CACHE_SIZE = 3
+        BILL_SUMMARY_CACHE_TTL = 7
+
+    create_app(SmallCacheConfig)
+    try:
+        assert (summary_cache.backend.maxsize, summary_cache.backend.ttl) == (3, 7)
+    finally:
+        create_app(TestingConfig)
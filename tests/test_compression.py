@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+
+import gzip
+import json
+import zlib
+import pytest
+from datetime import date
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        db.session.add_all([Bill(user_id="u1", amount=i, due_date=date.today(), description=f"Bill number {i}")
+                            for i in range(50)])
+        db.session.commit()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def test_gzip_when_accepted(client):
+    plain = client.get("/api/v1/bills/user/u1")
+    response = client.get("/api/v1/bills/user/u1", headers={"Accept-Encoding": "gzip, deflate"})
+
+    assert plain.headers.get("Content-Encoding") is None
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert "Accept-Encoding" in response.headers["Vary"]
+    assert int(response.headers["Content-Length"]) < len(plain.data)
+    assert json.loads(gzip.decompress(response.data)) == plain.get_json()
+
+def test_deflate_is_negotiated_by_quality(client):
+    response = client.get("/api/v1/bills/user/u1", headers={"Accept-Encoding": "gzip;q=0, deflate"})
+
+    assert response.headers["Content-Encoding"] == "deflate"
+    assert len(json.loads(zlib.decompress(response.data))["items"]) == 50
+
+def test_small_bodies_are_not_compressed(client):
+    response = client.get("/api/v1/bills/user/u1?limit=1&fields=id", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers.get("Content-Encoding") is None
+    assert "Accept-Encoding" in response.headers["Vary"]
+
+def test_streamed_exports_keep_streaming(client):
+    response = client.get("/api/v1/bills/user/u1/export", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers.get("Content-Encoding") is None
+    assert len(response.data.splitlines()) == 50
+
+def test_compression_can_be_disabled():
+    class PlainConfig(TestingConfig):
+        COMPRESSION_ENABLED = False
+
+    app = create_app(PlainConfig)
+    with app.app_context():
+        db.create_all()
+    response = app.test_client().get("/metrics", headers={"Accept-Encoding": "gzip"})
+    assert response.headers.get("Content-Encoding") is None
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, datetime, timedelta
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.user import User
+from services.bill_service import BillService
+from services.user_service import user_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    user_cache.clear()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def seed_bills(count, user_id="u1"):
+    bills = [Bill(user_id=user_id, amount=i, due_date=date.today()) for i in range(count)]
+    db.session.add_all(bills)
+    db.session.commit()
+    return [bill.id for bill in bills]
+
+def count_statements(app, call):
+    statements = []
+    with app.app_context():
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            response = call()
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+    return response, statements
+
+def test_bill_detail_revalidates_with_etag(app, client):
+    with app.app_context():
+        bill_id = seed_bills(1)[0]
+
+    first = client.get(f"/api/v1/bills/{bill_id}")
+    etag = first.headers["ETag"]
+    assert etag.startswith('W/"')
+    assert first.headers["Last-Modified"]
+
+    response, statements = count_statements(
+        app, lambda: client.get(f"/api/v1/bills/{bill_id}", headers={"If-None-Match": etag}))
+    assert response.status_code == 304
+    assert response.data == b""
+    assert response.headers["ETag"] == etag
+    assert len(statements) == 1 and "amount" not in statements[0]
+
+    with app.app_context():
+        BillService.update_bill(bill_id, amount=50)
+    changed = client.get(f"/api/v1/bills/{bill_id}", headers={"If-None-Match": etag})
+    assert changed.status_code == 200
+    assert changed.get_json()["amount"] == 50
+    assert changed.headers["ETag"] != etag
+
+def test_bill_detail_honours_if_modified_since(app, client):
+    with app.app_context():
+        bill_id = seed_bills(1)[0]
+        db.session.get(Bill, bill_id).updated_at = datetime.utcnow() - timedelta(seconds=5)
+        db.session.commit()
+
+    last_modified = client.get(f"/api/v1/bills/{bill_id}").headers["Last-Modified"]
+    response = client.get(f"/api/v1/bills/{bill_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 304
+
+    assert client.get("/api/v1/bills/missing", headers={"If-None-Match": "*"}).status_code == 404
+
+def test_if_modified_since_is_not_trusted_within_the_same_second(app, client):
+    with app.app_context():
+        bill_id = seed_bills(1)[0]
+
+    last_modified = client.get(f"/api/v1/bills/{bill_id}").headers["Last-Modified"]
+    client.put(f"/api/v1/bills/{bill_id}", json={"amount": 75})
+    response = client.get(f"/api/v1/bills/{bill_id}", headers={"If-Modified-Since": last_modified})
+    assert response.status_code == 200
+    assert response.get_json()["amount"] == 75
+
+def test_bill_list_ignores_if_modified_since(app, client):
+    with app.app_context():
+        ids = seed_bills(2)
+        db.session.query(Bill).update({"updated_at": datetime.utcnow() - timedelta(seconds=5)})
+        db.session.commit()
+
+    first = client.get("/api/v1/bills/user/u1")
+    assert "Last-Modified" not in first.headers
+    since = "Sun, 01 Jan 2090 00:00:00 GMT"
+    assert client.get("/api/v1/bills/user/u1", headers={"If-Modified-Since": since}).status_code == 200
+
+    client.patch(f"/api/v1/bills/{ids[0]}/pay")
+    response = client.get("/api/v1/bills/user/u1", headers={"If-None-Match": first.headers["ETag"]})
+    assert response.status_code == 200
+
+def test_bill_list_etag_tracks_changes_and_pages(app, client):
+    with app.app_context():
+        ids = seed_bills(3)
+        seed_bills(1, user_id="u2")
+
+    first = client.get("/api/v1/bills/user/u1")
+    etag = first.headers["ETag"]
+    assert client.get("/api/v1/bills/user/u1?limit=2").headers["ETag"] != etag
+
+    response, statements = count_statements(
+        app, lambda: client.get("/api/v1/bills/user/u1", headers={"If-None-Match": etag}))
+    assert response.status_code == 304
+    assert len(statements) == 1
+
+    with app.app_context():
+        seed_bills(1, user_id="u2")
+    assert client.get("/api/v1/bills/user/u1", headers={"If-None-Match": etag}).status_code == 304
+
+    with app.app_context():
+        BillService.delete_bill(ids[0])
+    assert client.get("/api/v1/bills/user/u1", headers={"If-None-Match": etag}).status_code == 200
+
+def test_user_detail_304_comes_from_the_cache(app, client):
+    with app.app_context():
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+        user.save()
+        user_id = user.id
+        token = create_access_token(identity=user_id)
+    auth = {"Authorization": f"Bearer {token}"}
+
+    first = client.get(f"/api/v1/users/{user_id}", headers=auth)
+    assert first.status_code == 200
+    conditional = dict(auth, **{"If-None-Match": first.headers["ETag"]})
+
+    response, statements = count_statements(app, lambda: client.get(f"/api/v1/users/{user_id}", headers=conditional))
+    assert response.status_code == 304
+    assert statements == []
+
+    with app.app_context():
+        db.session.get(User, user_id).update({"first_name": "Anna"})
+    changed = client.get(f"/api/v1/users/{user_id}", headers=conditional)
+    assert changed.status_code == 200
+    assert changed.get_json()["first_name"] == "Anna"
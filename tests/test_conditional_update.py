@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, datetime, timedelta
+from sqlalchemy import event, update
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+from services.reminder_service import ReminderService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Set up the database before each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_bill(days=5, **values):
+    bill = Bill(user_id="u1", amount=10, due_date=date.today() + timedelta(days=days), **values)
+    db.session.add(bill)
+    db.session.commit()
+    return bill.id
+
+def statements_during(fn):
+    statements = []
+    listener = lambda *args: statements.append(args[2].split()[0])  # noqa: E731
+    event.listen(db.engine, "before_cursor_execute", listener)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", listener)
+    return result, statements
+
+def test_pay_is_one_update(init_database):
+    bill_id = add_bill()
+    db.session.expunge_all()
+
+    bill, statements = statements_during(lambda: BillService.mark_bill_as_paid(bill_id))
+    assert statements == ["UPDATE"]
+    assert bill.id == bill_id
+
+    paid = db.session.execute(db.select(Bill.status).where(Bill.id == bill_id)).scalar()
+    assert paid == "paid"
+
+def test_pay_refreshes_loaded_bill_and_is_idempotent(init_database):
+    bill_id = add_bill()
+    loaded = db.session.get(Bill, bill_id)
+    assert loaded.status == "pending"
+
+    assert BillService.mark_bill_as_paid(bill_id) is loaded
+    assert loaded.status == "paid"
+
+    again = BillService.mark_bill_as_paid(bill_id)
+    assert again is not None and again.status == "paid"
+
+def test_pay_and_update_skip_deleted_and_missing_bills(init_database):
+    bill_id = add_bill(is_deleted=True)
+    assert BillService.mark_bill_as_paid(bill_id) is None
+    assert BillService.update_bill(bill_id, amount=99) is None
+    assert BillService.mark_bill_as_paid("missing") is None
+    assert BillService.update_bill("missing", amount=1) is None
+    assert BillService.delete_bill("missing") is None
+
+def test_concurrent_payment_is_seen(init_database):
+    bill_id = add_bill()
+    loaded = db.session.get(Bill, bill_id)
+    # another worker pays the bill behind this session's back
+    db.session.execute(update(Bill).where(Bill.id == bill_id).values(status="paid")
+                       .execution_options(synchronize_session=False))
+    db.session.commit()
+
+    assert BillService.mark_bill_as_paid(bill_id).status == "paid"
+    assert loaded.status == "paid"
+
+def test_update_resets_overdue_in_the_same_statement(init_database):
+    bill_id = add_bill(days=-3, status="overdue")
+    db.session.expunge_all()
+
+    bill, statements = statements_during(
+        lambda: BillService.update_bill(bill_id, amount=30, due_date=date.today() + timedelta(days=3)))
+    assert statements == ["UPDATE"]
+    assert (bill.amount, bill.status) == (30, "pending")
+
+    paid_id = add_bill(days=-3, status="paid")
+    assert BillService.update_bill(paid_id, due_date=date.today()).status == "paid"
+
+def test_delete_marks_deleted_and_touches_updated_at(init_database):
+    bill_id = add_bill()
+    before = db.session.get(Bill, bill_id).updated_at
+
+    deleted = BillService.delete_bill(bill_id)
+    assert deleted.is_deleted is True
+    assert deleted.updated_at >= before
+    assert BillService.delete_bill(bill_id).is_deleted is True
+
+def test_reminder_update_and_delete(init_database):
+    bill_id = add_bill()
+    reminder = Reminder(bill_id=bill_id, user_id="u1", reminder_date=date.today())
+    db.session.add(reminder)
+    db.session.commit()
+    reminder_id = reminder.id
+    db.session.expunge_all()
+
+    updated, statements = statements_during(lambda: ReminderService.update_reminder(reminder_id, message="Pay rent"))
+    assert statements == ["UPDATE"]
+    assert updated.message == "Pay rent"
+
+    assert ReminderService.delete_reminder(reminder_id).is_deleted is True
+    assert ReminderService.update_reminder(reminder_id, message="too late") is None
+    assert ReminderService.delete_reminder(reminder_id).is_deleted is True
+
+def test_rescheduled_reminder_is_sent_again(init_database):
+    bill_id = add_bill()
+    sent_at = datetime.utcnow()
+    reminder = Reminder(bill_id=bill_id, user_id="u1", reminder_date=date.today(), delivery_status="sent",
+                        sent_at=sent_at, delivery_attempts=1, claimed_at=sent_at)
+    db.session.add(reminder)
+    db.session.commit()
+    reminder_id = reminder.id
+    db.session.expunge_all()
+
+    same_day = ReminderService.update_reminder(reminder_id, reminder_date=date.today(), message="Same day")
+    assert (same_day.delivery_status, same_day.sent_at) == ("sent", sent_at)
+
+    moved, statements = statements_during(
+        lambda: ReminderService.update_reminder(reminder_id, reminder_date=date.today() + timedelta(days=2)))
+    assert statements == ["UPDATE"]
+    assert (moved.delivery_status, moved.sent_at, moved.delivery_attempts, moved.claimed_at) == \
+        ("pending", None, 0, None)
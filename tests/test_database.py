@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import pytest
+from app import create_app, db
+from config import Config, TestingConfig
+from database import _server_engine_options
+
+@pytest.fixture
+def file_app(tmp_path):
+    """Create an app backed by a SQLite file."""
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = "sqlite:///" + str(tmp_path / "test.db")
+
+    app = create_app(FileConfig)
+    with app.app_context():
+        db.create_all()
+        yield app
+        db.session.remove()
+
+def pragma(name):
+    return db.session.execute(db.text(f"PRAGMA {name}")).scalar()
+
+def test_sqlite_pragmas_applied_on_connect(file_app):
+    assert pragma("journal_mode") == "wal"
+    assert pragma("synchronous") == 1  # NORMAL
+    assert pragma("busy_timeout") == Config.SQLITE_BUSY_TIMEOUT_MS
+    assert pragma("cache_size") == Config.SQLITE_CACHE_SIZE
+    assert pragma("temp_store") == 2  # MEMORY
+
+def test_pragmas_can_be_disabled(tmp_path):
+    class PlainConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = "sqlite:///" + str(tmp_path / "plain.db")
+        SQLITE_APPLY_PRAGMAS = False
+
+    app = create_app(PlainConfig)
+    with app.app_context():
+        assert pragma("journal_mode") == "delete"
+        db.session.remove()
+
+def test_server_engine_options():
+    options = _server_engine_options(vars(Config))
+    assert options == {
+        "pool_size": Config.DB_POOL_SIZE,
+        "max_overflow": Config.DB_MAX_OVERFLOW,
+        "pool_recycle": Config.DB_POOL_RECYCLE,
+        "pool_pre_ping": Config.DB_POOL_PRE_PING,
+    }
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import csv
+import io
+import json
+import pytest
+from datetime import date, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+        today = date.today()
+        for i in range(5):
+            db.session.add(Bill(user_id="u1", amount=i, due_date=today + timedelta(days=i), is_deleted=i == 4))
+            db.session.add(Reminder(bill_id="b1", user_id="u1", reminder_date=today + timedelta(days=i)))
+        db.session.add(Bill(user_id="u2", amount=99, due_date=today))
+        db.session.commit()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def test_export_bills_ndjson(client):
+    response = client.get("/api/v1/bills/user/u1/export")
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert response.is_streamed
+
+    rows = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+    assert [row["amount"] for row in rows] == [0, 1, 2, 3, 4]
+    assert rows[0]["due_date"] == date.today().isoformat()
+    assert rows[4]["is_deleted"] is True
+
+def test_export_bills_csv_with_date_range(client):
+    start = (date.today() + timedelta(days=1)).isoformat()
+    end = (date.today() + timedelta(days=2)).isoformat()
+    response = client.get(f"/api/v1/bills/user/u1/export?format=csv&from={start}&to={end}")
+    assert response.mimetype == "text/csv"
+
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert [row["due_date"] for row in rows] == [start, end]
+
+def test_export_reminders(client):
+    response = client.get("/api/v1/reminders/user/u1/export?format=csv")
+    rows = list(csv.DictReader(io.StringIO(response.get_data(as_text=True))))
+    assert len(rows) == 5
+    assert rows[0]["delivery_status"] == "pending"
+
+def test_export_rejects_bad_arguments(client):
+    assert client.get("/api/v1/bills/user/u1/export?format=xml").status_code == 400
+    assert client.get("/api/v1/reminders/user/u1/export?from=01-01-2025").status_code == 400
+
+def test_iter_bills_for_export_batches(app):
+    with app.app_context():
+        rows = list(BillService.iter_bills_for_export("u1", batch_size=2))
+        assert len(rows) == 5
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+
+import uuid
+import pytest
+import sqlalchemy as sa
+from app import create_app, db
+from config import TestingConfig
+from models.ids import BinaryUUID, uuid7
+from models.bill import Bill
+from models.user import User
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def test_uuid7_is_time_ordered():
+    ids = [uuid7() for _ in range(5000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+    parsed = uuid.UUID(ids[0])
+    assert parsed.version == 7
+    assert parsed.variant == uuid.RFC_4122
+
+def test_models_get_uuid7_ids_and_string_foreign_keys(init_database):
+    user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+    user.save()
+    bill = Bill(user_id=user.id, amount=1, due_date=sa.func.current_date())
+    bill.save()
+
+    assert uuid.UUID(user.id).version == 7
+    assert isinstance(Bill.__table__.c.user_id.type, type(User.__table__.c.id.type))
+    assert db.session.execute(sa.select(Bill.id).join(User, User.id == Bill.user_id)).scalar() == bill.id
+
+def test_binary_uuid_round_trip():
+    engine = sa.create_engine("sqlite://")
+    metadata = sa.MetaData()
+    table = sa.Table("t", metadata, sa.Column("id", BinaryUUID(), primary_key=True))
+    metadata.create_all(engine)
+
+    value = uuid7()
+    with engine.begin() as conn:
+        conn.execute(table.insert(), {"id": value})
+        assert conn.execute(sa.select(table.c.id).where(table.c.id == value)).scalar() == value
+        stored = conn.execute(sa.text("SELECT length(id) FROM t")).scalar()
+    assert stored == 16
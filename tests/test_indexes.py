@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from models.user import User
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def query_plan(query):
+    """Return the SQLite EXPLAIN QUERY PLAN details for an ORM query"""
+    statement = query.statement.compile(db.engine, compile_kwargs={"literal_binds": True})
+    rows = db.session.execute(db.text(f"EXPLAIN QUERY PLAN {statement}")).all()
+    return " ".join(row[-1] for row in rows)
+
+def test_bills_by_user_and_due_date_use_index(init_database):
+    query = Bill.get_active().filter_by(user_id="u1").filter(Bill.due_date <= date.today())
+    assert "USING INDEX ix_bills_user_id_is_deleted_due_date" in query_plan(query)
+
+def test_bills_by_status_use_index(init_database):
+    query = Bill.query.filter(Bill.status == "overdue", Bill.due_date < date.today())
+    assert "USING INDEX ix_bills_status_due_date" in query_plan(query)
+
+def test_unpaid_bills_use_partial_index(init_database):
+    query = Bill.query.filter(Bill.is_deleted == False, Bill.status != "paid",  # noqa: E712
+                              Bill.due_date < date.today())
+    assert "USING INDEX ix_bills_unpaid_due_date" in query_plan(query)
+
+def test_due_reminders_use_index(init_database):
+    query = Reminder.get_active().filter(Reminder.reminder_date <= date.today())
+    assert "USING INDEX ix_reminders_reminder_date_is_deleted" in query_plan(query)
+
+def test_pages_use_keyset_index(init_database):
+    bills = Bill.query.filter_by(user_id="u1").order_by(Bill.created_at, Bill.id)
+    users = User.query.order_by(User.created_at, User.id)
+    assert "USING INDEX ix_bills_user_id_created_at_id" in query_plan(bills)
+    assert "ix_users_created_at_id" in query_plan(users)
+
+def test_user_bills_version_is_index_only(init_database):
+    query = db.session.query(db.func.count(), db.func.max(Bill.updated_at)).filter(Bill.user_id == "u1")
+    assert "USING COVERING INDEX ix_bills_user_id_updated_at_id" in query_plan(query)
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+import pytest
+from app import create_app, db
+from config import TestingConfig
+from services.login_throttle import BucketStore, MemoryBucketStore, SQLiteBucketStore, login_throttle
+from services.user_service import UserService, user_cache
+
+class ThrottleConfig(TestingConfig):
+    LOGIN_IP_BURST = 4
+    LOGIN_EMAIL_BURST = 2
+
+@pytest.fixture
+def app():
+    """Create a test app instance with small login buckets."""
+    app = create_app(ThrottleConfig)
+    with app.app_context():
+        db.create_all()
+        UserService.create_user("Ann", "Lee", "ann@example.com", "secret123")
+    user_cache.clear()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def login(client, email, password="secret123", ip="10.0.0.1"):
+    return client.post("/api/v1/auth/login", json={"email": email, "password": password},
+                       environ_base={"REMOTE_ADDR": ip})
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path: MemoryBucketStore(),
+    lambda tmp_path: SQLiteBucketStore(str(tmp_path / "buckets.db")),
+])
+def test_bucket_spends_and_refills(make_store, tmp_path):
+    store = make_store(tmp_path)
+    assert store.take("k", 2, 1.0, now=100.0) == 0
+    assert store.take("k", 2, 1.0, now=100.0) == 0
+    assert store.take("k", 2, 1.0, now=100.5) == pytest.approx(0.5)
+    assert store.take("k", 2, 1.0, now=101.0) == 0
+    assert store.take("other", 2, 1.0, now=101.0) == 0
+
+def test_memory_store_is_bounded():
+    store = MemoryBucketStore(maxsize=3)
+    for key in "abcde":
+        store.take(key, 1, 1.0, now=0.0)
+    assert len(store) == 3
+    assert store.take("a", 1, 1.0, now=0.0) == 0  # evicted, so it starts full again
+
+def test_email_limit_rejects_before_lookup(client, monkeypatch):
+    assert login(client, "ann@example.com").status_code == 200
+    assert login(client, "ANN@example.com ", password="wrong", ip="10.0.0.2").status_code == 401
+
+    def fail(*args):
+        raise AssertionError("throttled attempts must not reach the user lookup")
+
+    monkeypatch.setattr(UserService, "get_user_by_email", fail)
+    response = login(client, "ann@example.com", ip="10.0.0.3")
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+
+def test_ip_limit_covers_many_emails(client):
+    statuses = [login(client, f"user{i}@example.com").status_code for i in range(5)]
+    assert statuses == [401, 401, 401, 401, 429]
+    assert login(client, "ann@example.com", ip="10.0.0.9").status_code == 200
+
+def test_outcomes_are_exported_as_metrics(client):
+    login(client, "ann@example.com")
+    for _ in range(3):
+        login(client, "nobody@example.com", ip="10.0.0.5")
+
+    assert login_throttle.stats() == {"admitted": 3, "rejected_ip": 0, "rejected_email": 1}
+    body = client.get("/metrics").get_data(as_text=True)
+    assert 'billmap_login_attempts_total{outcome="admitted"} 3' in body
+    assert 'billmap_login_attempts_total{outcome="rejected_email"} 1' in body
+
+def test_throttle_can_be_disabled():
+    class NoThrottleConfig(ThrottleConfig):
+        LOGIN_THROTTLE_ENABLED = False
+
+    app = create_app(NoThrottleConfig)
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    assert {login(client, "nobody@example.com").status_code for _ in range(6)} == {401}
+
+def forwarded_login(client, forwarded_for):
+    return client.post("/api/v1/auth/login", json={"email": "x@example.com", "password": "wrong"},
+                       environ_base={"REMOTE_ADDR": "10.0.0.254"}, headers={"X-Forwarded-For": forwarded_for})
+
+def test_forwarded_for_is_ignored_without_a_trusted_proxy(client):
+    statuses = [forwarded_login(client, f"203.0.113.{i}").status_code for i in range(5)]
+    assert statuses[-1] == 429
+
+def test_trusted_proxy_keys_buckets_on_the_client_address():
+    class ProxyConfig(ThrottleConfig):
+        PROXY_FIX_X_FOR = 1
+        LOGIN_EMAIL_BURST = 100
+
+    app = create_app(ProxyConfig)
+    with app.app_context():
+        db.create_all()
+    client = app.test_client()
+    assert [forwarded_login(client, f"203.0.113.{i}").status_code for i in range(6)] == [401] * 6
+    # a spoofed entry to the left of the one the proxy appended is not trusted
+    statuses = [forwarded_login(client, f"198.51.100.{i}, 203.0.113.50").status_code for i in range(5)]
+    assert statuses == [401, 401, 401, 401, 429]
+
+def test_bucket_store_is_abstract():
+    with pytest.raises(TypeError):
+        BucketStore()
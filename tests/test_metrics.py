@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from services.metrics import Histogram
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def metric_lines(client, prefix):
+    # requests are recorded when the response is closed, as a WSGI server does
+    body = client.get("/metrics", buffered=True).get_data(as_text=True)
+    return [line for line in body.splitlines() if line.startswith(prefix)]
+
+def test_histogram_buckets_are_upper_bounds():
+    histogram = Histogram((1, 5))
+    for value in (0.5, 1, 3, 10):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.count == 4
+    assert histogram.sum == 14.5
+
+def test_request_counts_latency_and_sql(client, app):
+    with app.app_context():
+        bill = Bill(user_id="u1", amount=10, due_date=date.today())
+        db.session.add(bill)
+        db.session.commit()
+        bill_id = bill.id
+
+    assert client.get(f"/api/v1/bills/{bill_id}", buffered=True).status_code == 200
+    assert client.get("/api/v1/bills/missing", buffered=True).status_code == 404
+
+    route = 'method="GET",route="/api/v1/bills/<string:bill_id>"'
+    assert f'billmap_http_requests_total{{{route},status="200"}} 1' in metric_lines(client, "billmap_http_requests_total")
+    assert f'billmap_http_requests_total{{{route},status="404"}} 1' in metric_lines(client, "billmap_http_requests_total")
+    assert f"billmap_http_request_duration_seconds_count{{{route}}} 2" in metric_lines(client, "billmap_http_request")
+    assert f'billmap_http_request_duration_seconds_bucket{{{route},le="+Inf"}} 2' in metric_lines(client, "billmap_http")
+
+    statements = metric_lines(client, "billmap_db_statements_per_request_sum{" + route)
+    assert float(statements[0].split()[-1]) >= 2
+    assert metric_lines(client, "billmap_db_seconds_total{" + route)
+
+def test_in_flight_and_scrapes(client):
+    client.get("/metrics", buffered=True)
+    assert metric_lines(client, "billmap_http_requests_in_flight ") == ["billmap_http_requests_in_flight 1"]
+    assert 'billmap_http_requests_total{method="GET",route="/metrics",status="200"}' in \
+        " ".join(metric_lines(client, "billmap_http_requests_total"))
+
+def test_unmatched_routes_share_one_label(client):
+    client.get("/no/such/page", buffered=True)
+    client.get("/another/missing/page", buffered=True)
+    assert 'billmap_http_requests_total{method="GET",route="unmatched",status="404"} 2' in \
+        metric_lines(client, "billmap_http_requests_total")
+
+def test_metrics_can_be_disabled():
+    class NoMetricsConfig(TestingConfig):
+        METRICS_ENABLED = False
+
+    app = create_app(NoMetricsConfig)
+    assert "metrics" not in app.extensions
+    assert app.test_client().get("/metrics").status_code == 404
+
+def test_streamed_export_is_recorded_when_closed(client, app):
+    with app.app_context():
+        db.session.add_all([Bill(user_id="u1", amount=i, due_date=date.today()) for i in range(3)])
+        db.session.commit()
+
+    route = 'method="GET",route="/api/v1/bills/user/<string:user_id>/export"'
+    response = client.get("/api/v1/bills/user/u1/export")
+    assert not metric_lines(client, "billmap_http_request_duration_seconds_count{" + route)
+    assert len(response.get_data(as_text=True).splitlines()) == 3
+    response.close()
+
+    assert metric_lines(client, "billmap_http_request_duration_seconds_count{" + route) == \
+        [f"billmap_http_request_duration_seconds_count{{{route}}} 1"]
+    statements = metric_lines(client, "billmap_db_statements_per_request_sum{" + route)
+    assert float(statements[0].split()[-1]) >= 1
+
+def test_admin_token_guards_the_scrape():
+    class TokenConfig(TestingConfig):
+        ADMIN_TOKEN = "secret"
+
+    client = create_app(TokenConfig).test_client()
+    assert client.get("/metrics").status_code == 403
+    assert client.get("/metrics", headers={"X-Admin-Token": "wrong"}).status_code == 403
+    assert client.get("/metrics", headers={"X-Admin-Token": "secret"}).status_code == 200
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date
+from sqlalchemy import event
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+from services.reminder_service import ReminderService
+import services.multi_get as multi_get
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def add_bills(count):
+    bills = [Bill(user_id="u1", amount=i, due_date=date.today()) for i in range(count)]
+    db.session.add_all(bills)
+    db.session.commit()
+    return [bill.id for bill in bills]
+
+def test_get_bills_by_ids_preserves_order_and_reports_missing(app, monkeypatch):
+    monkeypatch.setattr(multi_get, "IN_CHUNK_SIZE", 2)
+    with app.app_context():
+        ids = add_bills(5)
+        requested = [ids[3], "missing-id", ids[0], ids[4], ids[0], ids[1]]
+
+        statements = []
+        event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+        bills, missing = BillService.get_bills_by_ids(requested)
+
+        assert [bill.id for bill in bills] == [ids[3], ids[0], ids[4], ids[1]]
+        assert missing == ["missing-id"]
+        assert len(statements) == 3  # five distinct ids in chunks of two
+
+def test_get_reminders_by_ids(app):
+    with app.app_context():
+        reminder = Reminder(bill_id="b1", user_id="u1", reminder_date=date.today())
+        reminder.save()
+        reminders, missing = ReminderService.get_reminders_by_ids([reminder.id])
+        assert [r.id for r in reminders] == [reminder.id]
+        assert missing == []
+
+def test_batch_routes(client, app):
+    with app.app_context():
+        ids = add_bills(3)
+        reminder = Reminder(bill_id=ids[0], user_id="u1", reminder_date=date.today())
+        reminder.save()
+        reminder_id = reminder.id
+
+    response = client.get(f"/api/v1/bills/batch?ids={ids[2]},{ids[0]},nope")
+    assert response.status_code == 200
+    body = response.get_json()
+    assert [item["id"] for item in body["items"]] == [ids[2], ids[0]]
+    assert body["missing"] == ["nope"]
+
+    response = client.get(f"/api/v1/reminders/batch?ids={reminder_id}")
+    assert response.get_json()["items"][0]["bill_id"] == ids[0]
+
+    assert client.get(f"/api/v1/bills/{ids[1]}").get_json()["amount"] == 1
+
+def test_batch_limits(client, app):
+    app.config["BATCH_GET_MAX_IDS"] = 2
+    assert client.get("/api/v1/bills/batch?ids=a,b,c").status_code == 400
+    assert client.get("/api/v1/reminders/batch").status_code == 400
@@ -0,0 +1,70 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from services.bill_service import BillService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_bill(days_from_today, **kwargs):
+    bill = Bill(user_id="u1", amount=10, due_date=date.today() + timedelta(days=days_from_today), **kwargs)
+    db.session.add(bill)
+    db.session.commit()
+    return bill.id
+
+def test_sweep_marks_only_qualifying_bills(init_database):
+    late = [add_bill(-d) for d in range(1, 6)]
+    paid = add_bill(-3, status="paid")
+    deleted = add_bill(-3, is_deleted=True)
+    upcoming = add_bill(0)
+
+    result = BillService.sweep_overdue(chunk_size=2)
+    assert result["updated"] == 5
+    assert result["chunks"] == 3
+
+    db.session.expire_all()
+    assert all(db.session.get(Bill, bill_id).status == "overdue" for bill_id in late)
+    assert db.session.get(Bill, paid).status == "paid"
+    assert db.session.get(Bill, deleted).status == "pending"
+    assert db.session.get(Bill, upcoming).status == "pending"
+
+def test_sweep_is_idempotent(init_database):
+    add_bill(-1)
+    assert BillService.sweep_overdue()["updated"] == 1
+    assert BillService.sweep_overdue()["updated"] == 0
+
+def test_moving_due_date_forward_clears_overdue(init_database):
+    bill_id = add_bill(-1)
+    BillService.sweep_overdue()
+    bill = BillService.update_bill(bill_id, due_date=date.today() + timedelta(days=7))
+    assert bill.status == "pending"
+
+def test_sweep_route(client, app):
+    with app.app_context():
+        add_bill(-2)
+    response = client.post("/api/v1/bills/overdue/sweep")
+    assert response.status_code == 200
+    assert response.get_json()["updated"] == 1
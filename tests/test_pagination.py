@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+
+import base64
+import json
+import pytest
+from datetime import date, datetime
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+from services.reminder_service import ReminderService
+from services.pagination import decode_cursor
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_bills(user_id, count, created_at=None):
+    for i in range(count):
+        bill = Bill(user_id=user_id, amount=i, due_date=date.today(), description=f"Bill {i}")
+        if created_at:
+            bill.created_at = created_at
+        db.session.add(bill)
+    db.session.commit()
+
+def test_bill_pages_cover_every_row_once(init_database):
+    """Walking the cursors returns each bill exactly once, even with tied created_at values."""
+    add_bills("u1", 7, created_at=datetime(2025, 1, 1))
+    add_bills("u1", 3)
+    add_bills("u2", 4)
+
+    seen = []
+    cursor = None
+    while True:
+        bills, cursor = BillService.get_bills_page_by_user("u1", limit=3, cursor=cursor)
+        seen.extend(bill.id for bill in bills)
+        if cursor is None:
+            break
+
+    assert len(seen) == 10
+    assert len(set(seen)) == 10
+    assert seen[:7] == sorted(seen[:7])
+
+def test_last_page_has_no_cursor(init_database):
+    add_bills("u1", 2)
+    bills, cursor = BillService.get_bills_page_by_user("u1", limit=2)
+    assert len(bills) == 2
+    assert cursor is None
+
+def test_reminder_page(init_database):
+    for i in range(3):
+        db.session.add(Reminder(bill_id="b1", user_id="u1", reminder_date=date.today()))
+    db.session.commit()
+
+    reminders, cursor = ReminderService.get_reminders_page_by_user("u1", limit=2)
+    assert len(reminders) == 2
+    assert decode_cursor(cursor)[1] == reminders[-1].id
+
+def test_invalid_cursor(init_database):
+    with pytest.raises(ValueError):
+        BillService.get_bills_page_by_user("u1", cursor="not-a-cursor")
+
+@pytest.mark.parametrize("record_id", [[1], {"id": "x"}, None, 7])
+def test_cursor_ids_must_be_strings(client, record_id):
+    payload = json.dumps([datetime.utcnow().isoformat(), record_id]).encode("utf-8")
+    cursor = base64.urlsafe_b64encode(payload).decode("ascii")
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+    assert client.get(f"/api/v1/bills/user/u1?cursor={cursor}").status_code == 400
+    assert client.get(f"/api/v1/bills/user/u1/changes?since={cursor}").status_code == 400
+    assert client.get(f"/api/v1/reminders/user/u1?cursor={cursor}").status_code == 400
+
+def test_bills_by_user_route(client, app):
+    with app.app_context():
+        add_bills("u1", 5)
+
+    first = client.get("/api/v1/bills/user/u1?limit=3").get_json()
+    assert len(first["items"]) == 3
+    second = client.get(f"/api/v1/bills/user/u1?limit=3&cursor={first['next_cursor']}").get_json()
+    assert len(second["items"]) == 2
+    assert second["next_cursor"] is None
+
+    assert client.get("/api/v1/bills/user/u1?cursor=bogus").status_code == 400
+
+def test_sparse_fields_load_only_the_requested_columns(client, app):
+    with app.app_context():
+        add_bills("u1", 3)
+        statements = []
+        db.event.listen(db.engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    data = client.get("/api/v1/bills/user/u1?fields=id,amount,due_date&limit=2").get_json()
+
+    assert [sorted(item) for item in data["items"]] == [["amount", "due_date", "id"]] * 2
+    page_query = statements[-1]
+    assert "bills.amount" in page_query and "bills.description" not in page_query
+    second = client.get(f"/api/v1/bills/user/u1?fields=amount&cursor={data['next_cursor']}").get_json()
+    assert second["items"] == [{"amount": 2}]
+
+    assert client.get("/api/v1/bills/user/u1?fields=amount,password").status_code == 400
+    assert list(client.get("/api/v1/reminders/user/u1?fields=reminder_date").get_json()) == ["items", "next_cursor"]
+
+def test_rows_path_matches_the_orm_path(init_database):
+    add_bills("u1", 7, created_at=datetime(2025, 1, 1))
+    add_bills("u1", 2)
+    add_bills("u2", 3)
+    db.session.expunge_all()
+
+    orm_cursor = rows_cursor = None
+    while True:
+        bills, orm_cursor = BillService.get_bills_page_by_user("u1", limit=4, cursor=orm_cursor)
+        rows, rows_cursor = BillService.list_bills_rows("u1", limit=4, cursor=rows_cursor)
+        assert [(row.id, row.amount, row.due_date, row.description) for row in rows] == \
+               [(bill.id, bill.amount, bill.due_date, bill.description) for bill in bills]
+        assert rows_cursor == orm_cursor
+        if rows_cursor is None:
+            break
+
+    db.session.expunge_all()
+    rows, _ = BillService.list_bills_rows("u1", columns=("amount",))
+    assert len(rows) == 9
+    assert not isinstance(rows[0], Bill)
+    assert len(db.session.identity_map) == 0
+
+def test_next_page_seeks_past_the_cursor(init_database):
+    """With bound parameters the cursor condition must still be an index range, not a scan of the user's rows"""
+    add_bills("u1", 3)
+    _, cursor = BillService.list_bills_rows("u1", limit=1)
+    captured = []
+    db.event.listen(db.engine, "before_cursor_execute",
+                    lambda conn, cursor, statement, params, context, many: captured.append((statement, params)))
+    BillService.list_bills_rows("u1", limit=1, cursor=cursor)
+    statement, params = captured[-1]
+    plan = " ".join(str(row[-1]) for row in db.session.connection().exec_driver_sql(
+        "EXPLAIN QUERY PLAN " + statement, params))
+
+    assert "ix_bills_user_id_created_at_id (user_id=? AND created_at>?)" in plan
@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+import threading
+import pytest
+from app import create_app, db
+from config import TestingConfig
+from models.user import User
+from services.password_hasher import PasswordHasher, PasswordHasherBusy, password_hasher, hash_cost
+from services.user_service import user_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    user_cache.clear()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def test_hash_and_verify():
+    hasher = PasswordHasher(rounds=4, max_workers=2)
+    password_hash = hasher.hash("secret")
+    assert hash_cost(password_hash) == 4
+    assert hasher.verify(password_hash, "secret")
+    assert not hasher.verify(password_hash, "wrong")
+
+def test_rejects_when_pool_and_queue_are_full():
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=0)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    worker = threading.Thread(target=hasher._run, args=(slow,))
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash("secret")
+        assert hasher.stats()["rejected"] == 1
+    finally:
+        release.set()
+        worker.join()
+    assert hasher.verify(hasher.hash("secret"), "secret")
+
+def test_timeout_is_reported_as_busy():
+    hasher = PasswordHasher(rounds=4, max_workers=1, max_queue=1, timeout=0.05)
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow():
+        started.set()
+        release.wait(5)
+
+    def occupy():
+        with pytest.raises(PasswordHasherBusy):
+            hasher._run(slow)
+
+    worker = threading.Thread(target=occupy)
+    worker.start()
+    started.wait(5)
+    try:
+        with pytest.raises(PasswordHasherBusy):
+            hasher.hash("secret")
+        assert hasher.stats()["timed_out"] >= 1
+    finally:
+        release.set()
+        worker.join()
+    # the queued hash was cancelled and its slot given back
+    assert hasher.verify(hasher.hash("secret"), "secret")
+
+def test_needs_rehash_only_for_lower_cost():
+    hasher = PasswordHasher(rounds=5)
+    assert hasher.needs_rehash(PasswordHasher._hash("x", 4))
+    assert not hasher.needs_rehash(PasswordHasher._hash("x", 5))
+    assert not hasher.needs_rehash("not-a-hash")
+
+def test_calibrate_stays_in_bounds():
+    rounds = PasswordHasher().calibrate(0.0, min_rounds=4, max_rounds=6)
+    assert rounds == 4
+    assert 4 <= PasswordHasher().calibrate(10.0, min_rounds=4, max_rounds=6) <= 6
+
+def test_login_rehashes_outdated_cost(client, app):
+    with app.app_context():
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com",
+                    password_hash=PasswordHasher._hash("secret", 4))
+        user.save()
+        user_id = user.id
+
+    password_hasher.configure(rounds=5)
+    try:
+        response = client.post("/api/v1/auth/login", json={"email": "ann@example.com", "password": "secret"})
+        assert response.status_code == 200
+    finally:
+        password_hasher.configure(rounds=4)
+
+    with app.app_context():
+        assert hash_cost(db.session.get(User, user_id).password_hash) == 5
+
+def test_login_returns_503_when_busy(client, app, monkeypatch):
+    with app.app_context():
+        user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+        user.set_password("secret")
+        user.save()
+
+    def busy(*args):
+        raise PasswordHasherBusy("busy")
+
+    monkeypatch.setattr(password_hasher, "verify", busy)
+    response = client.post("/api/v1/auth/login", json={"email": "ann@example.com", "password": "secret"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+
+import threading
+import pytest
+from datetime import date, datetime, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.reminder import Reminder
+from models.user import User
+from services.notifiers import Notifier, notifier_from_config, LogNotifier
+from services.reminder_dispatcher import ReminderDispatcher
+
+class RecordingNotifier(Notifier):
+    def __init__(self, fail_ids=()):
+        self.sent = []
+        self.fail_ids = set(fail_ids)
+        self.lock = threading.Lock()
+
+    def send(self, reminder):
+        if reminder["id"] in self.fail_ids:
+            raise RuntimeError("boom")
+        with self.lock:
+            self.sent.append(reminder)
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+def add_reminder(user_id, days_from_today, **kwargs):
+    reminder = Reminder(bill_id="b1", user_id=user_id,
+                        reminder_date=date.today() + timedelta(days=days_from_today), **kwargs)
+    db.session.add(reminder)
+    db.session.commit()
+    return reminder
+
+def test_dispatches_due_reminders_once(app, init_database):
+    user = User(first_name="Ann", last_name="Lee", email="ann@example.com", password_hash="x")
+    user.save()
+    due = [add_reminder(user.id, -i, message=f"due {i}") for i in range(5)]
+    add_reminder(user.id, 3, message="future")
+    add_reminder(user.id, -1, message="deleted", is_deleted=True)
+
+    notifier = RecordingNotifier()
+    dispatcher = ReminderDispatcher(app, notifier=notifier, batch_size=2, max_workers=2)
+
+    result = dispatcher.run_once()
+    assert result["sent"] == 5
+    assert result["batches"] == 3
+    assert sorted(r["id"] for r in notifier.sent) == sorted(r.id for r in due)
+    assert notifier.sent[0]["email"] == "ann@example.com"
+
+    assert dispatcher.run_once()["sent"] == 0
+    assert len(notifier.sent) == 5
+
+    db.session.expire_all()
+    assert all(r.delivery_status == "sent" and r.sent_at for r in due)
+
+    metrics = dispatcher.metrics()
+    assert metrics["sent"] == 5
+    assert metrics["runs"] == 2
+    assert metrics["max_lag_seconds"] >= 4 * 86400
+
+def test_failed_sends_are_recorded(app, init_database):
+    ok = add_reminder("u1", 0)
+    bad = add_reminder("u1", 0)
+
+    dispatcher = ReminderDispatcher(app, notifier=RecordingNotifier(fail_ids=[bad.id]), max_attempts=1)
+    result = dispatcher.run_once()
+    assert (result["sent"], result["failed"]) == (1, 1)
+    assert dispatcher.run_once()["failed"] == 0
+
+    db.session.expire_all()
+    assert db.session.get(Reminder, ok.id).delivery_status == "sent"
+    assert db.session.get(Reminder, bad.id).delivery_status == "failed"
+    assert dispatcher.metrics()["failed"] == 1
+
+def test_failed_sends_are_retried_on_later_runs(app, init_database):
+    reminder = add_reminder("u1", 0)
+    notifier = RecordingNotifier(fail_ids=[reminder.id])
+    dispatcher = ReminderDispatcher(app, notifier=notifier, max_attempts=3)
+
+    # one attempt per run, even though the row is pending again right away
+    assert dispatcher.run_once()["failed"] == 1
+    db.session.expire_all()
+    assert (reminder.delivery_status, reminder.delivery_attempts) == ("pending", 1)
+
+    assert dispatcher.run_once()["failed"] == 1
+    notifier.fail_ids.clear()
+    assert dispatcher.run_once()["sent"] == 1
+    db.session.expire_all()
+    assert (reminder.delivery_status, reminder.delivery_attempts) == ("sent", 3)
+
+def test_attempts_are_bounded(app, init_database):
+    reminder = add_reminder("u1", 0)
+    dispatcher = ReminderDispatcher(app, notifier=RecordingNotifier(fail_ids=[reminder.id]), max_attempts=2)
+
+    assert [dispatcher.run_once()["failed"] for _ in range(3)] == [1, 1, 0]
+    db.session.expire_all()
+    assert (reminder.delivery_status, reminder.delivery_attempts) == ("failed", 2)
+
+def test_stale_sending_claims_are_reclaimed(app, init_database):
+    stale_time = datetime.utcnow() - timedelta(hours=1)
+    stale = add_reminder("u1", 0, delivery_status="sending", claimed_at=stale_time, delivery_attempts=1)
+    exhausted = add_reminder("u1", 0, delivery_status="sending", claimed_at=stale_time, delivery_attempts=2)
+    fresh = add_reminder("u1", 0, delivery_status="sending", claimed_at=datetime.utcnow(), delivery_attempts=1)
+
+    notifier = RecordingNotifier()
+    dispatcher = ReminderDispatcher(app, notifier=notifier, max_attempts=2, lease_seconds=600)
+    result = dispatcher.run_once()
+    assert (result["reclaimed"], result["sent"]) == (2, 1)
+    assert [r["id"] for r in notifier.sent] == [stale.id]
+
+    db.session.expire_all()
+    assert db.session.get(Reminder, stale.id).delivery_status == "sent"
+    assert db.session.get(Reminder, exhausted.id).delivery_status == "failed"
+    assert db.session.get(Reminder, fresh.id).delivery_status == "sending"
+    assert dispatcher.metrics()["reclaimed"] == 2
+
+def test_notifier_must_implement_send():
+    class Silent(Notifier):
+        pass
+
+    with pytest.raises(TypeError):
+        Silent()
+
+def test_notifier_from_config():
+    assert isinstance(notifier_from_config({"REMINDER_NOTIFIER": "log"}), LogNotifier)
+    with pytest.raises(ValueError):
+        notifier_from_config({"REMINDER_NOTIFIER": "webhook"})
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+import json
+import pytest
+from datetime import date
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from services.bill_service import BillService
+from services.slow_query import parameter_shape
+
+class SlowQueryConfig(TestingConfig):
+    SLOW_QUERY_LOG_ENABLED = True
+    SLOW_QUERY_THRESHOLD_MS = 0
+    ADMIN_TOKEN = "secret"
+
+@pytest.fixture
+def app():
+    """Create a test app instance that treats every statement as slow."""
+    app = create_app(SlowQueryConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def add_bill():
+    bill = Bill(user_id="u1", amount=10, due_date=date.today())
+    db.session.add(bill)
+    db.session.commit()
+    return bill.id
+
+def test_parameter_shape_hides_values():
+    assert parameter_shape({"email": "a@b.c", "limit": 5}) == {"email": "str", "limit": "int"}
+    assert parameter_shape(("u1", 5, None)) == ["str", "int", "NoneType"]
+
+def test_records_statement_plan_and_origin(app):
+    with app.app_context():
+        log = app.extensions["slow_query_log"]
+        add_bill()
+        log.clear()
+        BillService.get_bills_by_user("u1")
+
+        record = log.snapshot()["items"][0]
+        assert record["statement"].startswith("SELECT")
+        assert "str" in record["parameters"]
+        assert record["duration_ms"] >= 0
+        assert record["function"].startswith("services/bill_service.py")
+        assert "get_bills_by_user" in record["function"]
+        assert any("ix_bills_user_id" in line for line in record["plan"])
+
+def test_admin_endpoint_requires_token(client, app):
+    with app.app_context():
+        bill_id = add_bill()
+    client.get(f"/api/v1/bills/{bill_id}")
+
+    assert client.get("/admin/slow-queries").status_code == 403
+    assert client.get("/admin/slow-queries", headers={"X-Admin-Token": "wrong"}).status_code == 403
+
+    response = client.get("/admin/slow-queries", headers={"X-Admin-Token": "secret"})
+    assert response.status_code == 200
+    routes = [item["route"] for item in response.get_json()["items"]]
+    assert f"GET /api/v1/bills/{bill_id}" in routes
+
+    assert client.delete("/admin/slow-queries", headers={"X-Admin-Token": "secret"}).status_code == 204
+    assert app.extensions["slow_query_log"].snapshot()["items"] == []
+
+def test_sampling_and_explain_budget():
+    class SampledConfig(SlowQueryConfig):
+        SLOW_QUERY_SAMPLE_RATE = 0.0
+
+    app = create_app(SampledConfig)
+    with app.app_context():
+        db.create_all()
+        add_bill()
+        assert app.extensions["slow_query_log"].snapshot()["stats"]["sampled"] == 0
+
+    class BudgetConfig(SlowQueryConfig):
+        SLOW_QUERY_EXPLAIN_PER_MINUTE = 2
+
+    app = create_app(BudgetConfig)
+    with app.app_context():
+        db.create_all()
+        for _ in range(3):
+            add_bill()
+        stats = app.extensions["slow_query_log"].snapshot()["stats"]
+        assert stats["explained"] == 2
+        assert stats["explain_skipped"] >= 1
+
+def test_file_sink(tmp_path):
+    class FileConfig(SlowQueryConfig):
+        SLOW_QUERY_SINK = "file"
+        SLOW_QUERY_FILE = str(tmp_path / "slow.log")
+
+    app = create_app(FileConfig)
+    with app.app_context():
+        db.create_all()
+        add_bill()
+
+    records = [json.loads(line) for line in (tmp_path / "slow.log").read_text().splitlines()]
+    assert any(record["statement"].startswith("INSERT INTO bills") for record in records)
+    assert app.test_client().get("/admin/slow-queries").status_code == 404
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, datetime, timedelta
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+from services.pagination import encode_cursor
+
+
+class SyncConfig(TestingConfig):
+    SYNC_SETTLE_SECONDS = 0
+
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(SyncConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def add_bills(count, user_id="u1", updated_at=None):
+    start = datetime.utcnow() - timedelta(hours=1)
+    bills = [Bill(user_id=user_id, amount=10 + i, due_date=date.today(),
+                  updated_at=updated_at or start + timedelta(seconds=i)) for i in range(count)]
+    db.session.add_all(bills)
+    db.session.commit()
+    return [bill.id for bill in bills]
+
+def sync_all(client, path, since=None, limit=2):
+    """Follow the feed until has_more is false; return (pages, watermark)"""
+    pages = []
+    while True:
+        query = {"limit": limit}
+        if since:
+            query["since"] = since
+        data = client.get(path, query_string=query).get_json()
+        pages.append(data)
+        since = data["watermark"]
+        if not data["has_more"]:
+            return pages, since
+
+def test_initial_sync_pages_through_every_bill(app, client):
+    with app.app_context():
+        ids = add_bills(5)
+        add_bills(2, user_id="u2")
+
+    pages, watermark = sync_all(client, "/api/v1/bills/user/u1/changes")
+
+    assert [len(page["items"]) for page in pages] == [2, 2, 1]
+    assert [item["id"] for page in pages for item in page["items"]] == ids
+    assert "updated_at" in pages[0]["items"][0]
+    assert watermark is not None
+
+def test_sync_returns_only_changes_and_tombstones(app, client):
+    with app.app_context():
+        ids = add_bills(4)
+    _, watermark = sync_all(client, "/api/v1/bills/user/u1/changes")
+
+    with app.app_context():
+        BillService.update_bill(ids[1], amount=99)
+        BillService.delete_bill(ids[2])
+
+    data = client.get("/api/v1/bills/user/u1/changes", query_string={"since": watermark}).get_json()
+
+    assert [item["id"] for item in data["items"]] == [ids[1]]
+    assert data["items"][0]["amount"] == 99
+    assert [tombstone["id"] for tombstone in data["deleted"]] == [ids[2]]
+    assert data["has_more"] is False
+
+    again = client.get("/api/v1/bills/user/u1/changes", query_string={"since": data["watermark"]}).get_json()
+    assert again["items"] == [] and again["deleted"] == []
+    assert again["watermark"] == data["watermark"]
+
+def test_rows_sharing_a_timestamp_are_not_skipped(app, client):
+    with app.app_context():
+        ids = add_bills(5, updated_at=datetime.utcnow() - timedelta(minutes=5))
+
+    pages, _ = sync_all(client, "/api/v1/bills/user/u1/changes")
+
+    assert sorted(item["id"] for page in pages for item in page["items"]) == sorted(ids)
+
+def test_recent_changes_wait_for_the_settle_window(app, client):
+    app.config["SYNC_SETTLE_SECONDS"] = 60
+    with app.app_context():
+        settled = add_bills(1)
+        db.session.add(Bill(user_id="u1", amount=1, due_date=date.today()))
+        db.session.commit()
+
+    data = client.get("/api/v1/bills/user/u1/changes").get_json()
+
+    assert [item["id"] for item in data["items"]] == settled
+
+def test_watermark_older_than_retention_requires_resync(app, client):
+    with app.app_context():
+        bill = Bill(id="b1", user_id="u1", amount=1, due_date=date.today(),
+                    updated_at=datetime.utcnow() - timedelta(days=app.config["ARCHIVE_RETENTION_DAYS"] + 1))
+        expired = encode_cursor(bill, "updated_at")
+
+    assert client.get("/api/v1/bills/user/u1/changes", query_string={"since": expired}).status_code == 410
+    assert client.get("/api/v1/bills/user/u1/changes", query_string={"since": "nope"}).status_code == 400
+
+def test_reminder_changes(app, client):
+    with app.app_context():
+        bill_id = add_bills(1)[0]
+        reminders = [Reminder(bill_id=bill_id, user_id="u1", reminder_date=date.today(),
+                              updated_at=datetime.utcnow() - timedelta(minutes=i)) for i in (2, 1)]
+        reminders[1].is_deleted = True
+        db.session.add_all(reminders)
+        db.session.commit()
+        live_id, deleted_id = reminders[0].id, reminders[1].id
+
+    data = client.get("/api/v1/reminders/user/u1/changes").get_json()
+
+    assert [item["id"] for item in data["items"]] == [live_id]
+    assert [tombstone["id"] for tombstone in data["deleted"]] == [deleted_id]
+
+def test_changes_query_seeks_the_user_updated_at_index(app):
+    with app.app_context():
+        ids = add_bills(3)
+        since = encode_cursor(db.session.get(Bill, ids[0]), "updated_at")
+        captured = []
+        db.event.listen(db.engine, "before_cursor_execute",
+                        lambda conn, cursor, statement, params, context, many: captured.append((statement, params)))
+        BillService.get_bill_changes("u1", since, limit=10)
+        statement, params = captured[-1]
+        with db.engine.connect() as conn:
+            plan = " ".join(str(row[-1]) for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, params))
+
+    assert "ix_bills_user_id_updated_at_id (user_id=? AND updated_at>?)" in plan
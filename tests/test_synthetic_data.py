@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import json
+import pytest
+from datetime import date, datetime
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from models.user import User
+from services.synthetic_data import generate
+from services.user_service import UserService, user_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    user_cache.clear()
+    yield app
+
+def test_generated_rows_are_consistent(app):
+    with app.app_context():
+        result = generate(db.engine, 200, "hash", bills_per_user=6, reminders_per_bill=1.5, chunk_users=64)
+
+        assert result["users"] == User.query.count() == 200
+        assert result["bills"] == Bill.query.count() > 200
+        assert result["reminders"] == Reminder.query.count() > result["bills"]
+        assert result["rows"] == result["users"] + result["bills"] + result["reminders"]
+
+        today = date.today()
+        for bill in Bill.query.limit(500):
+            assert bill.amount >= 1
+            assert bill.status == "pending" if bill.due_date >= today else bill.status in ("paid", "overdue")
+        for reminder in Reminder.query.limit(500):
+            assert (reminder.bill.due_date - reminder.reminder_date).days in (1, 3, 7)
+            assert (reminder.delivery_status == "sent") == (reminder.reminder_date <= today)
+            assert reminder.user_id == reminder.bill.user_id
+
+def test_no_timestamps_in_the_future(app):
+    with app.app_context():
+        generate(db.engine, 100, "hash", bills_per_user=10, chunk_users=50)
+        now = datetime.utcnow()
+        for model in (User, Bill, Reminder):
+            assert db.session.query(db.func.max(model.created_at)).scalar() <= now
+            assert db.session.query(db.func.max(model.updated_at)).scalar() <= now
+        assert db.session.query(db.func.max(Reminder.sent_at)).scalar() <= now
+        assert Bill.query.filter(Bill.due_date > date.today()).count() > 0
+
+def test_same_seed_same_data_for_a_range(app):
+    with app.app_context():
+        generate(db.engine, 50, "hash", start_user=0, chunk_users=25)
+        first = [(b.amount, b.due_date) for b in Bill.query.order_by(Bill.id)]
+        db.session.remove()
+        db.drop_all()
+        db.create_all()
+        generate(db.engine, 50, "hash", start_user=0, chunk_users=25)
+        assert [(b.amount, b.due_date) for b in Bill.query.order_by(Bill.id)] == first
+
+def test_cli_generates_loginable_users(app):
+    runner = app.test_cli_runner()
+    result = runner.invoke(args=["data", "generate", "--users", "20", "--start-user", "100",
+                                 "--password", "secret123"])
+    assert result.exit_code == 0, result.output
+    assert json.loads(result.output)["users"] == 20
+
+    with app.app_context():
+        user = UserService.authenticate_user("user105@example.com", "secret123")
+        assert user is not None
+
+def test_parallel_generation_needs_a_file_database(app):
+    result = app.test_cli_runner().invoke(args=["data", "generate", "--users", "20", "--workers", "2"])
+    assert result.exit_code != 0
+    assert "database file" in result.output
+
+def test_parallel_workers_split_the_user_range(tmp_path):
+    class FileConfig(TestingConfig):
+        SQLALCHEMY_DATABASE_URI = "sqlite:///" + str(tmp_path / "generated.db")
+
+    app = create_app(FileConfig)
+    with app.app_context():
+        db.create_all()
+        result = generate(db.engine, 60, "hash", workers=3, chunk_users=10)
+        assert result["users"] == 60
+        emails = {email for (email,) in db.session.query(User.email)}
+        assert emails == {f"user{n}@example.com" for n in range(60)}
+        assert Bill.query.count() == result["bills"]
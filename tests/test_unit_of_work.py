@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date
+from sqlalchemy import event
+from app import create_app, db
+from config import TestingConfig
+from database import unit_of_work
+from models.bill import Bill
+from models.reminder import Reminder
+from services.bill_service import BillService
+from services.reminder_service import ReminderService
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+class CommitCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+def create_bill_with_reminders():
+    bill = BillService.create_bill("u1", 50, date.today())
+    for _ in range(3):
+        ReminderService.create_reminder(bill.id, "u1", date.today())
+    BillService.update_bill(bill.id, amount=60)
+    return bill
+
+def count_commits(fn):
+    counter = CommitCounter()
+    event.listen(db.engine, "commit", counter)
+    try:
+        fn()
+    finally:
+        event.remove(db.engine, "commit", counter)
+    return counter.count
+
+def test_commits_once_per_unit_of_work(init_database):
+    assert count_commits(create_bill_with_reminders) == 5
+
+    def grouped():
+        with unit_of_work():
+            bill = create_bill_with_reminders()
+            assert bill.id is not None  # flushed, so ids are available inside the block
+
+    assert count_commits(grouped) == 1
+    assert Bill.query.count() == 2
+    assert Reminder.query.count() == 6
+
+def test_rolls_back_on_error(init_database):
+    with pytest.raises(RuntimeError):
+        with unit_of_work():
+            create_bill_with_reminders()
+            raise RuntimeError("boom")
+
+    assert Bill.query.count() == 0
+    assert Reminder.query.count() == 0
+
+def test_nested_and_decorator(init_database):
+    @unit_of_work()
+    def inner():
+        return create_bill_with_reminders()
+
+    def outer():
+        with unit_of_work():
+            inner()
+            inner()
+
+    assert count_commits(outer) == 1
+    assert Bill.query.count() == 2
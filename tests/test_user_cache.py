@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+
+import time
+import pytest
+from sqlalchemy import event
+from app import create_app, db
+from config import TestingConfig
+from models.user import User
+from services.cache import LRUCache, SQLiteCache
+from services.user_service import UserService, user_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    user_cache.clear()
+    yield app
+
+@pytest.fixture
+def init_database(app):
+    """Initialize the database and clear it before and after each test."""
+    with app.app_context():
+        db.create_all()
+        yield db
+        db.session.remove()
+        db.drop_all()
+
+class QueryCounter:
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, *args):
+        self.count += 1
+
+def make_user(email="ann@example.com"):
+    user = User(first_name="Ann", last_name="Lee", email=email, password_hash="x")
+    user.save()
+    return user.id
+
+def count_queries(fn):
+    counter = QueryCounter()
+    event.listen(db.engine, "before_cursor_execute", counter)
+    try:
+        result = fn()
+    finally:
+        event.remove(db.engine, "before_cursor_execute", counter)
+    return result, counter.count
+
+def test_lookups_are_cached_by_id_and_email(init_database):
+    user_id = make_user()
+    UserService.get_user_by_id(user_id)
+    db.session.remove()
+
+    user, queries = count_queries(lambda: UserService.get_user_by_id(user_id))
+    assert queries == 0
+    assert user.email == "ann@example.com"
+
+    user, queries = count_queries(lambda: UserService.get_user_by_email("ann@example.com"))
+    assert queries == 0
+    assert user.id == user_id
+    assert UserService.cache_stats()["hits"] == 2
+
+def test_update_user_invalidates(init_database):
+    user_id = make_user()
+    UserService.get_user_by_email("ann@example.com")
+
+    UserService.update_user(user_id, first_name="Anna", email="anna@example.com")
+    db.session.remove()
+
+    assert UserService.get_user_by_id(user_id).first_name == "Anna"
+    assert UserService.get_user_by_email("ann@example.com") is None
+    assert UserService.get_user_by_email("anna@example.com").id == user_id
+
+def test_soft_delete_and_delete_invalidate(init_database):
+    user_id = make_user()
+    UserService.get_user_by_email("ann@example.com").soft_delete()
+    assert UserService.get_user_by_email("ann@example.com") is None
+
+    UserService.delete_user(user_id)
+    assert UserService.get_user_by_id(user_id) is None
+
+def test_lru_cache_eviction_and_ttl():
+    cache = LRUCache(maxsize=2, ttl=0.05)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    time.sleep(0.06)
+    assert cache.get("c") is None
+
+def test_sqlite_cache_is_shared(tmp_path):
+    path = str(tmp_path / "cache.db")
+    first = SQLiteCache(path, ttl=60)
+    second = SQLiteCache(path, ttl=60)
+
+    first.set(("id", "u1"), {"email": "a@example.com"})
+    assert second.get(("id", "u1")) == {"email": "a@example.com"}
+    second.delete(("id", "u1"))
+    assert first.get(("id", "u1")) is None
+    assert first.stats() == {"size": 0, "hits": 0, "misses": 1}
+
+def test_backend_comes_from_app_config(tmp_path):
+    class SharedCacheConfig(TestingConfig):
+        USER_CACHE_BACKEND = "sqlite"
+        USER_CACHE_PATH = str(tmp_path / "users.db")
+
+    app = create_app(SharedCacheConfig)
+    try:
+        assert isinstance(user_cache.backend, SQLiteCache)
+        with app.app_context():
+            db.create_all()
+            user_id = make_user()
+            UserService.get_user_by_id(user_id)
+            assert "password_hash" not in user_cache.get(("id", user_id))
+            db.session.remove()
+
+            user = UserService.get_user_by_email("ann@example.com")
+            assert user.password_hash == "x"
+    finally:
+        create_app(TestingConfig)
+    assert isinstance(user_cache.backend, LRUCache)
+
+def test_rows_cached_inside_a_rolled_back_transaction_are_dropped(init_database):
+    user_id = make_user()
+    user = db.session.get(User, user_id)
+    user.first_name = "Uncommitted"
+    db.session.flush()
+    assert UserService.get_user_by_id(user_id).first_name == "Uncommitted"
+    assert user_cache.get(("id", user_id)) is not None
+
+    db.session.rollback()
+    assert user_cache.get(("id", user_id)) is None
+    db.session.remove()
+    assert UserService.get_user_by_id(user_id).first_name == "Ann"
+
+def test_commit_drops_entries_cached_by_a_concurrent_reader(init_database):
+    user_id = make_user()
+    user = db.session.get(User, user_id)
+    user.first_name = "Anna"
+    db.session.flush()
+    # another request caches the committed row while this transaction is still open
+    user_cache.set(("id", user_id), {"id": user_id, "first_name": "Ann"})
+
+    db.session.commit()
+    assert user_cache.get(("id", user_id)) is None
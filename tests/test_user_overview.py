@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+
+import pytest
+from datetime import date, timedelta
+from flask_jwt_extended import create_access_token
+from sqlalchemy import event
+from app import create_app, db
+from config import TestingConfig
+from models.bill import Bill
+from models.reminder import Reminder
+from models.user import User
+from services.user_service import UserService, user_cache
+
+@pytest.fixture
+def app():
+    """Create a test app instance."""
+    app = create_app(TestingConfig)
+    with app.app_context():
+        db.create_all()
+    user_cache.clear()
+    yield app
+
+@pytest.fixture
+def client(app):
+    """Create a test client."""
+    return app.test_client()
+
+def seed_user(bill_count):
+    user = User(first_name="Ann", last_name="Lee", email=f"ann{bill_count}@example.com", password_hash="x")
+    user.save()
+    user_id = user.id
+    today = date.today()
+    for i in range(bill_count):
+        bill = Bill(user_id=user_id, amount=i, due_date=today + timedelta(days=i))
+        db.session.add(bill)
+        db.session.flush()
+        db.session.add_all([
+            Reminder(bill_id=bill.id, user_id=user_id, reminder_date=today + timedelta(days=1)),
+            Reminder(bill_id=bill.id, user_id=user_id, reminder_date=today - timedelta(days=1)),
+            Reminder(bill_id=bill.id, user_id=user_id, reminder_date=today, is_deleted=True),
+        ])
+    db.session.add(Bill(user_id=user_id, amount=99, due_date=today, is_deleted=True))
+    db.session.commit()
+    db.session.expunge_all()
+    return user_id
+
+def walk_overview(user_id):
+    user = UserService.get_user_overview(user_id)
+    return [(bill.amount, [r.reminder_date for r in bill.reminders]) for bill in user.bills]
+
+@pytest.mark.parametrize("bill_count", [3, 30])
+def test_overview_uses_constant_queries(app, bill_count):
+    with app.app_context():
+        user_id = seed_user(bill_count)
+        statements = []
+        listener = lambda *args: statements.append(args[2])
+        event.listen(db.engine, "before_cursor_execute", listener)
+        try:
+            bills = walk_overview(user_id)
+        finally:
+            event.remove(db.engine, "before_cursor_execute", listener)
+
+        assert len(statements) == 3
+        assert [amount for amount, _ in bills] == list(range(bill_count))
+        assert all(dates == [date.today() + timedelta(days=1)] for _, dates in bills)
+
+def test_overview_route(client, app):
+    with app.app_context():
+        user_id = seed_user(2)
+        token = create_access_token(identity=user_id)
+
+    response = client.get(f"/api/v1/users/{user_id}/overview", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["id"] == user_id
+    assert len(body["bills"]) == 2
+    assert len(body["bills"][0]["reminders"]) == 1
+
+    missing = client.get("/api/v1/users/nope/overview", headers={"Authorization": f"Bearer {token}"})
+    assert missing.status_code == 404
+
+def test_delete_user_keeps_children_untouched(app):
+    with app.app_context():
+        user_id = seed_user(1)
+        user = UserService.get_user_by_id(user_id)
+        assert user.bills  # children loaded into the session
+        assert UserService.delete_user(user_id)
+        assert Bill.query.filter_by(user_id=user_id).count() == 2